@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""Quick script to test knowledge creation without Slack slash command.
+
+Indexes into and searches the live Graphiti backend, so it is run by hand
+rather than collected by pytest.
+
+Usage:
+    python scripts/manual_knowledge_creation.py
+"""
+
+import asyncio
+import uuid
+from datetime import datetime
+
+from knowledge_base.graph.graphiti_indexer import GraphitiIndexer
+from knowledge_base.graph.graphiti_retriever import get_graphiti_retriever
+from knowledge_base.vectorstore.indexer import ChunkData
+
+
+async def create_knowledge_batch(facts: list[dict], created_by: str = "test_user") -> int:
+    """Create knowledge chunks directly, indexing all facts in one call.
+
+    Args:
+        facts: Dicts with ``content`` and optional ``title``
+        created_by: Author recorded on every chunk
+
+    Returns:
+        Number of successfully indexed chunks
+    """
+    now = datetime.utcnow().isoformat()
+    chunks = []
+    for fact in facts:
+        content = fact["content"]
+        print(f"Creating knowledge: {content[:100]}...")
+        page_id = f"quick_{uuid.uuid4().hex[:16]}"
+        chunks.append(
+            ChunkData(
+                chunk_id=f"{page_id}_0",
+                content=content,
+                page_id=page_id,
+                page_title=fact.get("title", "Quick Fact"),
+                chunk_index=0,
+                space_key="QUICK",
+                url="slack://manual-test",
+                author=created_by,
+                created_at=now,
+                updated_at=now,
+                owner=created_by,
+                doc_type="quick_fact",
+                summary=content[:200],
+            )
+        )
+
+    indexer = GraphitiIndexer(enable_checkpoints=False)
+    indexed = await indexer.index_chunks_direct(chunks)
+
+    print(f"✅ Indexed {indexed}/{len(chunks)} chunks")
+    for chunk in chunks:
+        print(f"   Chunk ID: {chunk.chunk_id}")
+    return indexed
+
+
+async def verify_knowledge(search_query: str):
+    """Verify the knowledge was indexed."""
+    print(f"\n🔍 Searching for: '{search_query}'")
+
+    retriever = get_graphiti_retriever()
+    results = await retriever.search(search_query, num_results=3)
+
+    if results:
+        print(f"✅ Found {len(results)} matching chunks:")
+        for i, result in enumerate(results):
+            print(f"\n   {i+1}. {result.content[:100]}...")
+            print(f"      Created by: {result.metadata.get('created_by', 'unknown')}")
+            print(f"      Quality: {result.metadata.get('quality_score', 'N/A')}")
+    else:
+        print("❌ No matching chunks found")
+
+
+async def main():
+    # Your HR system knowledge
+    hr_fact = """We use for HR (HR information system) headless ODOO. Employees can connect to it using MCP server called ODOO MCP Staging. They just need to click connect in claude.ai interface to access HR system."""
+
+    print("=" * 70)
+    print("KNOWLEDGE CREATION TEST")
+    print("=" * 70)
+
+    # Create the knowledge
+    await create_knowledge_batch(
+        [{"content": hr_fact, "title": "HR System - ODOO MCP"}],
+        created_by="jiri.manas",
+    )
+
+    # Wait a moment for indexing
+    await asyncio.sleep(1)
+
+    # Verify it was indexed
+    await verify_knowledge("ODOO HR system")
+    await verify_knowledge("MCP server staging")
+
+    print("\n" + "=" * 70)
+    print("✅ Test complete! Knowledge should now be searchable by the bot.")
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
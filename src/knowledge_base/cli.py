@@ -1,9 +1,9 @@
 """CLI commands for the knowledge base."""
 
-import asyncio
 import logging
 import re
 import sys
+from typing import Any, Coroutine, TypeVar
 
 import click
 
@@ -39,6 +39,15 @@ logging.basicConfig(
 logging.getLogger().addFilter(SecretRedactingFilter())
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+
+def _run(coro: Coroutine[Any, Any, T]) -> T:
+    """Run a command coroutine, closing the shared LLM HTTP client before its loop ends."""
+    from knowledge_base.rag.factory import run_with_shared_client
+
+    return run_with_shared_client(coro)
+
 
 @click.group()
 @click.option("--verbose", "-v", is_flag=True, help="Enable verbose output")
@@ -58,7 +67,7 @@ def cli(verbose: bool) -> None:
 @click.option("--resume", "-r", is_flag=True, help="Resume from last position (skip unchanged)")
 def download(spaces: str | None, verbose: bool, resume: bool) -> None:
     """Download pages from Confluence spaces."""
-    asyncio.run(_download(spaces, verbose, resume))
+    _run(_download(spaces, verbose, resume))
 
 
 async def _download(spaces: str | None, verbose: bool, resume: bool) -> None:
@@ -107,7 +116,7 @@ async def _download(spaces: str | None, verbose: bool, resume: bool) -> None:
 @click.option("--rebase", is_flag=True, help="Rebase from Confluence (force update all)")
 def sync(spaces: str | None, full: bool, rebase: bool) -> None:
     """Sync pages from Confluence (incremental or full)."""
-    asyncio.run(_sync(spaces, full, rebase))
+    _run(_sync(spaces, full, rebase))
 
 
 async def _sync(spaces: str | None, full: bool, rebase: bool) -> None:
@@ -144,7 +153,7 @@ async def _sync(spaces: str | None, full: bool, rebase: bool) -> None:
 @cli.command()
 def init_database() -> None:
     """Initialize the database schema."""
-    asyncio.run(_init_database())
+    _run(_init_database())
 
 
 async def _init_database() -> None:
@@ -158,7 +167,7 @@ async def _init_database() -> None:
 @cli.command()
 def check_connection() -> None:
     """Check connection to Confluence."""
-    asyncio.run(_check_connection())
+    _run(_check_connection())
 
 
 async def _check_connection() -> None:
@@ -185,7 +194,7 @@ async def _check_connection() -> None:
 @click.option("--verbose", "-v", is_flag=True, help="Show detailed progress")
 def parse(space: str | None, force: bool, verbose: bool) -> None:
     """Parse downloaded pages into chunks."""
-    asyncio.run(_parse(space, force, verbose))
+    _run(_parse(space, force, verbose))
 
 
 async def _parse(space: str | None, force: bool, verbose: bool) -> None:
@@ -226,7 +235,7 @@ async def _parse(space: str | None, force: bool, verbose: bool) -> None:
 @click.option("--batch-size", "-b", type=int, default=10, help="Batch size for LLM calls")
 def metadata(space: str | None, regenerate: bool, verbose: bool, batch_size: int) -> None:
     """Generate metadata for document chunks using LLM."""
-    asyncio.run(_metadata(space, regenerate, verbose, batch_size))
+    _run(_metadata(space, regenerate, verbose, batch_size))
 
 
 async def _metadata(space: str | None, regenerate: bool, verbose: bool, batch_size: int) -> None:
@@ -365,7 +374,7 @@ async def _metadata(space: str | None, regenerate: bool, verbose: bool, batch_si
 @click.option("--verbose", "-v", is_flag=True, help="Show detailed progress")
 def index(space: str | None, reindex: bool, verbose: bool) -> None:
     """Index chunks into Graphiti for search."""
-    asyncio.run(_index(space, reindex, verbose))
+    _run(_index(space, reindex, verbose))
 
 
 async def _index(space: str | None, reindex: bool, verbose: bool) -> None:
@@ -474,7 +483,7 @@ async def _index(space: str | None, reindex: bool, verbose: bool) -> None:
 @cli.command()
 def stats() -> None:
     """Show database statistics."""
-    asyncio.run(_stats())
+    _run(_stats())
 
 
 async def _stats() -> None:
@@ -551,7 +560,7 @@ def lifecycle() -> None:
 @lifecycle.command(name="stats")
 def lifecycle_stats() -> None:
     """Show lifecycle statistics (quality, feedback, archival, conflicts)."""
-    asyncio.run(_lifecycle_stats())
+    _run(_lifecycle_stats())
 
 
 async def _lifecycle_stats() -> None:
@@ -603,7 +612,7 @@ async def _lifecycle_stats() -> None:
 @lifecycle.command(name="init-quality")
 def init_quality() -> None:
     """Initialize quality records for all chunks."""
-    asyncio.run(_init_quality())
+    _run(_init_quality())
 
 
 async def _init_quality() -> None:
@@ -624,7 +633,7 @@ async def _init_quality() -> None:
 @lifecycle.command(name="run-archival")
 def run_archival() -> None:
     """Run the archival pipeline (deprecate, cold archive, hard archive)."""
-    asyncio.run(_run_archival())
+    _run(_run_archival())
 
 
 async def _run_archival() -> None:
@@ -647,7 +656,7 @@ async def _run_archival() -> None:
 @lifecycle.command(name="recalculate-quality")
 def recalculate_quality() -> None:
     """Recalculate quality scores based on decay and feedback."""
-    asyncio.run(_recalculate_quality())
+    _run(_recalculate_quality())
 
 
 async def _recalculate_quality() -> None:
@@ -673,7 +682,7 @@ async def _recalculate_quality() -> None:
 @click.option("--days", "-d", type=int, default=90, help="Delete logs older than N days")
 def cleanup_logs(days: int) -> None:
     """Clean up old access logs."""
-    asyncio.run(_cleanup_logs(days))
+    _run(_cleanup_logs(days))
 
 
 async def _cleanup_logs(days: int) -> None:
@@ -694,7 +703,7 @@ async def _cleanup_logs(days: int) -> None:
 @click.option("--limit", "-l", type=int, default=20, help="Maximum conflicts to show")
 def show_conflicts(limit: int) -> None:
     """Show open conflicts awaiting resolution."""
-    asyncio.run(_show_conflicts(limit))
+    _run(_show_conflicts(limit))
 
 
 async def _show_conflicts(limit: int) -> None:
@@ -731,7 +740,7 @@ async def _show_conflicts(limit: int) -> None:
 @click.option("--limit", "-l", type=int, default=20, help="Maximum feedback items to show")
 def show_feedback(unreviewed: bool, high_impact: bool, limit: int) -> None:
     """Show user feedback on content chunks."""
-    asyncio.run(_show_feedback(unreviewed, high_impact, limit))
+    _run(_show_feedback(unreviewed, high_impact, limit))
 
 
 async def _show_feedback(unreviewed: bool, high_impact: bool, limit: int) -> None:
@@ -772,7 +781,7 @@ async def _show_feedback(unreviewed: bool, high_impact: bool, limit: int) -> Non
 @lifecycle.command(name="run-all")
 def run_all_lifecycle() -> None:
     """Run all lifecycle maintenance tasks."""
-    asyncio.run(_run_all_lifecycle())
+    _run(_run_all_lifecycle())
 
 
 async def _run_all_lifecycle() -> None:
@@ -821,7 +830,7 @@ async def _run_all_lifecycle() -> None:
 @lifecycle.command(name="score-stats")
 def score_stats() -> None:
     """Show quality score statistics (Phase 11)."""
-    asyncio.run(_score_stats())
+    _run(_score_stats())
 
 
 async def _score_stats() -> None:
@@ -850,7 +859,7 @@ async def _score_stats() -> None:
 @click.argument("chunk_id")
 def show_score(chunk_id: str) -> None:
     """Show quality score for a specific chunk."""
-    asyncio.run(_show_score(chunk_id))
+    _run(_show_score(chunk_id))
 
 
 async def _show_score(chunk_id: str) -> None:
@@ -961,7 +970,7 @@ def pipeline(
     By default, already-indexed chunks are skipped (resume mode).
     Use --reindex to clear checkpoints and start from scratch.
     """
-    asyncio.run(_pipeline(spaces, verbose, force_parse, reindex))
+    _run(_pipeline(spaces, verbose, force_parse, reindex))
 
 
 async def _pipeline(
@@ -1209,7 +1218,7 @@ def keboola_info(table_id: str | None) -> None:
     click.echo(f"  Last change: {info.get('lastChangeDate', 'unknown')}")
 
     # Show sync state
-    asyncio.run(_show_keboola_sync_state(effective_table_id))
+    _run(_show_keboola_sync_state(effective_table_id))
 
     # Show first 3 rows with parsed metadata
     click.echo(f"\nSample rows (first 3):")
@@ -1280,7 +1289,7 @@ def keboola_sync(
 
     Requires KEBOOLA_API_TOKEN and KEBOOLA_API_URL to be set.
     """
-    asyncio.run(_keboola_sync(table_id, verbose, dry_run, reindex, sample_size))
+    _run(_keboola_sync(table_id, verbose, dry_run, reindex, sample_size))
 
 
 async def _keboola_sync(
@@ -1477,7 +1486,7 @@ def keboola_batch_import(
 
     Requires KEBOOLA_API_TOKEN, KEBOOLA_API_URL, and BATCH_GCS_BUCKET to be set.
     """
-    asyncio.run(
+    _run(
         _keboola_batch_import(
             table_id, verbose, dry_run, resume, clear_graph, sample_size
         )
@@ -1588,7 +1597,7 @@ async def _keboola_batch_import(
 @click.option("--verbose", "-v", is_flag=True, help="Show detailed progress")
 def fuzzy_merge(dry_run: bool, threshold: float | None, verbose: bool) -> None:
     """Find and merge near-duplicate entities using HNSW vector index."""
-    asyncio.run(_fuzzy_merge(dry_run, threshold, verbose))
+    _run(_fuzzy_merge(dry_run, threshold, verbose))
 
 
 async def _fuzzy_merge_discover_candidates_hnsw(
@@ -1903,7 +1912,7 @@ for _pat, _label in _JUNK_ENTITY_PATTERNS:
 @click.option("--verbose", "-v", is_flag=True, help="Show detailed progress")
 def prune_entities(dry_run: bool, verbose: bool) -> None:
     """Remove noise entities (UUIDs, hashes, short names, internal IDs)."""
-    asyncio.run(_prune_entities(dry_run, verbose))
+    _run(_prune_entities(dry_run, verbose))
 
 
 async def _prune_entities(dry_run: bool, verbose: bool) -> None:
@@ -2037,7 +2046,7 @@ async def _prune_entities(dry_run: bool, verbose: bool) -> None:
 @click.option("--verbose", "-v", is_flag=True, help="Show detailed progress")
 def build_communities(verbose: bool) -> None:
     """Build topic communities using Graphiti's label propagation."""
-    asyncio.run(_build_communities(verbose))
+    _run(_build_communities(verbose))
 
 
 async def _build_communities(verbose: bool) -> None:
@@ -2086,7 +2095,7 @@ def search() -> None:
 @click.option("--verbose", "-v", is_flag=True, help="Show detailed output")
 def query(query_text: str, method: str, top: int, weights: str | None, verbose: bool) -> None:
     """Search the knowledge base with the given query."""
-    asyncio.run(_query(query_text, method, top, weights, verbose))
+    _run(_query(query_text, method, top, weights, verbose))
 
 
 async def _query(query_text: str, method: str, top: int, weights: str | None, verbose: bool) -> None:
@@ -2127,7 +2136,7 @@ async def _query(query_text: str, method: str, top: int, weights: str | None, ve
 @search.command(name="stats")
 def search_stats() -> None:
     """Show search index statistics."""
-    asyncio.run(_search_stats())
+    _run(_search_stats())
 
 
 async def _search_stats() -> None:
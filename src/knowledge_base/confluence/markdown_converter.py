@@ -1,6 +1,8 @@
 """Convert Confluence HTML to Markdown."""
 
+import functools
 import logging
+import os
 import re
 import secrets
 import sys
@@ -8,7 +10,7 @@ from contextlib import contextmanager
 from pathlib import Path
 
 from bs4 import BeautifulSoup, Tag
-from markdownify import markdownify as md
+from markdownify import MarkdownConverter
 
 from knowledge_base.config import settings
 
@@ -17,6 +19,13 @@ logger = logging.getLogger(__name__)
 # Maximum HTML nesting depth before flattening (safe margin below recursion limit)
 MAX_NESTING_DEPTH = 100
 
+# Cleanup patterns, compiled once at import
+_AC_ELEMENT_RE = re.compile(r"<ac:[^>]*>.*?</ac:[^>]*>", re.DOTALL)
+_RI_SELF_CLOSING_RE = re.compile(r"<ri:[^>]*/>")
+_RI_ELEMENT_RE = re.compile(r"<ri:[^>]*>.*?</ri:[^>]*>", re.DOTALL)
+_EMPTY_TAG_RE = re.compile(r"<[^>]+>\s*</[^>]+>")
+_BLANK_LINES_RE = re.compile(r"\n{3,}")
+
 
 @contextmanager
 def _increased_recursion_limit(limit: int = 2000):
@@ -29,21 +38,17 @@ def _increased_recursion_limit(limit: int = 2000):
         sys.setrecursionlimit(old_limit)
 
 
-def _limit_html_depth(html: str, max_depth: int = MAX_NESTING_DEPTH) -> str:
+def _limit_html_depth(soup: BeautifulSoup, max_depth: int = MAX_NESTING_DEPTH) -> None:
     """
-    Flatten HTML that exceeds max nesting depth.
+    Flatten parsed HTML that exceeds max nesting depth, in place.
 
     Also detects and breaks cyclical DOM references (e.g., from malformed HTML
     where an element becomes its own ancestor).
 
     Args:
-        html: Raw HTML string
+        soup: Parsed HTML tree (modified in place)
         max_depth: Maximum allowed nesting depth
-
-    Returns:
-        HTML string with deep nesting flattened to text
     """
-    soup = BeautifulSoup(html, "html.parser")
     seen_ids: set[int] = set()  # For cycle detection using object ids
 
     def flatten_deep_nodes(element, current_depth: int = 0) -> None:
@@ -69,7 +74,6 @@ def _limit_html_depth(html: str, max_depth: int = MAX_NESTING_DEPTH) -> str:
                 flatten_deep_nodes(child, current_depth + 1)
 
     flatten_deep_nodes(soup)
-    return str(soup)
 
 
 def html_to_markdown(html_content: str) -> str:
@@ -91,17 +95,15 @@ def html_to_markdown(html_content: str) -> str:
     html_content = _clean_confluence_html(html_content)
 
     try:
-        # Layer 1: Limit nesting depth and break any cycles
-        safe_html = _limit_html_depth(html_content)
+        # Layer 1: Limit nesting depth and break any cycles; the flattened
+        # tree goes straight to markdownify instead of being re-serialized
+        # and parsed a second time
+        soup = BeautifulSoup(html_content, "html.parser")
+        _limit_html_depth(soup)
 
         # Layer 2: Temporarily increase recursion limit for edge cases
         with _increased_recursion_limit(2000):
-            markdown = md(
-                safe_html,
-                heading_style="ATX",
-                bullets="-",
-                code_language_callback=_detect_code_language,
-            )
+            markdown = _MARKDOWN_CONVERTER.convert_soup(soup)
 
         # Clean up the markdown
         return _clean_markdown(markdown)
@@ -114,19 +116,6 @@ def html_to_markdown(html_content: str) -> str:
         return f"[Content extracted as plain text due to complex formatting]\n\n{plain_text}"
 
 
-def _clean_confluence_html(html: str) -> str:
-    """Remove Confluence-specific elements."""
-    # Remove ac: and ri: namespace elements
-    html = re.sub(r"<ac:[^>]*>.*?</ac:[^>]*>", "", html, flags=re.DOTALL)
-    html = re.sub(r"<ri:[^>]*/>", "", html)
-    html = re.sub(r"<ri:[^>]*>.*?</ri:[^>]*>", "", html, flags=re.DOTALL)
-
-    # Remove empty tags
-    html = re.sub(r"<[^>]+>\s*</[^>]+>", "", html)
-
-    return html
-
-
 def _detect_code_language(el) -> str | None:
     """Detect code language from element attributes."""
     if el.get("class"):
@@ -137,10 +126,31 @@ def _detect_code_language(el) -> str | None:
     return None
 
 
+# Converter options are fixed, so one instance serves every page
+_MARKDOWN_CONVERTER = MarkdownConverter(
+    heading_style="ATX",
+    bullets="-",
+    code_language_callback=_detect_code_language,
+)
+
+
+def _clean_confluence_html(html: str) -> str:
+    """Remove Confluence-specific elements."""
+    # Remove ac: and ri: namespace elements
+    html = _AC_ELEMENT_RE.sub("", html)
+    html = _RI_SELF_CLOSING_RE.sub("", html)
+    html = _RI_ELEMENT_RE.sub("", html)
+
+    # Remove empty tags
+    html = _EMPTY_TAG_RE.sub("", html)
+
+    return html
+
+
 def _clean_markdown(markdown: str) -> str:
     """Clean up generated markdown."""
     # Remove excessive blank lines (more than 2)
-    markdown = re.sub(r"\n{3,}", "\n\n", markdown)
+    markdown = _BLANK_LINES_RE.sub("\n\n", markdown)
 
     # Remove trailing whitespace from lines
     lines = [line.rstrip() for line in markdown.split("\n")]
@@ -157,11 +167,23 @@ def generate_random_filename() -> str:
     return secrets.token_hex(8)  # 8 bytes = 16 hex chars
 
 
+def generate_random_filenames(count: int) -> list[str]:
+    """Generate ``count`` random 16-character hex filenames from one CSPRNG read."""
+    raw = secrets.token_bytes(8 * count)
+    return [raw[i:i + 8].hex() for i in range(0, len(raw), 8)]
+
+
 def get_pages_dir() -> Path:
     """Get the pages directory, creating it if needed."""
-    pages_dir = Path(settings.PAGES_DIR)
-    pages_dir.mkdir(parents=True, exist_ok=True)
-    return pages_dir
+    return _ensure_pages_dir(settings.PAGES_DIR)
+
+
+@functools.lru_cache(maxsize=1)
+def _ensure_pages_dir(pages_dir: str) -> Path:
+    """Create the pages directory once per configured path instead of per file."""
+    path = Path(pages_dir)
+    path.mkdir(parents=True, exist_ok=True)
+    return path
 
 
 def save_markdown_file(markdown_content: str, filename: str | None = None) -> str:
@@ -181,7 +203,17 @@ def save_markdown_file(markdown_content: str, filename: str | None = None) -> st
         filename = generate_random_filename()
 
     file_path = pages_dir / f"{filename}.md"
-    file_path.write_text(markdown_content, encoding="utf-8")
+    # Write a sibling temp file and rename it, so readers never see a partial page
+    tmp_path = file_path.with_name(f"{file_path.name}.tmp")
+    data = markdown_content.encode("utf-8")
+    try:
+        tmp_path.write_bytes(data)
+    except FileNotFoundError:
+        # Directory removed since it was cached; recreate it and retry once
+        _ensure_pages_dir.cache_clear()
+        get_pages_dir()
+        tmp_path.write_bytes(data)
+    os.replace(tmp_path, file_path)
 
     return str(file_path)
 
@@ -142,6 +142,9 @@ class GapAnalyzer:
         clusters: list[QueryCluster] = []
         used: set[int] = set()
 
+        # Tokenize each query once instead of once per pairwise comparison
+        word_sets = [set(q.lower().split()) for q, _ in queries]
+
         for i, (q1, score1) in enumerate(queries):
             if i in used:
                 continue
@@ -150,13 +153,13 @@ class GapAnalyzer:
             cluster_scores = [score1]
             used.add(i)
 
-            words1 = set(q1.lower().split())
+            words1 = word_sets[i]
 
             for j, (q2, score2) in enumerate(queries):
                 if j in used:
                     continue
 
-                words2 = set(q2.lower().split())
+                words2 = word_sets[j]
                 overlap = len(words1 & words2) / max(len(words1 | words2), 1)
 
                 if overlap > 0.5:
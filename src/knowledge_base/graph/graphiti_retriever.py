@@ -11,6 +11,7 @@ Key features:
 - Can traverse the graph for multi-hop reasoning
 """
 
+import heapq
 import json
 import logging
 from dataclasses import dataclass
@@ -402,13 +403,17 @@ class GraphitiRetriever:
                 empty_content_count = 0
                 total_raw = raw_edge_count + raw_episode_count
 
+                # Loop-invariant filter settings, read once per search
+                governance_enabled = settings.GOVERNANCE_ENABLED
+                min_content_length = settings.SEARCH_MIN_CONTENT_LENGTH
+
                 for sr in scored_candidates:
                     # Skip deleted chunks
                     if sr.metadata.get('deleted'):
                         continue
 
                     # Governance filter
-                    if settings.GOVERNANCE_ENABLED:
+                    if governance_enabled:
                         governance_status = sr.metadata.get('governance_status', 'approved')
                         if governance_status not in VALID_GOVERNANCE_STATUSES:
                             governance_status = 'approved'
@@ -424,7 +429,7 @@ class GraphitiRetriever:
                         continue
 
                     # Skip results with no meaningful content
-                    if len(sr.content.strip()) < settings.SEARCH_MIN_CONTENT_LENGTH:
+                    if len(sr.content.strip()) < min_content_length:
                         empty_content_count += 1
                         continue
 
@@ -436,7 +441,7 @@ class GraphitiRetriever:
                 if empty_content_count > 0:
                     logger.info(
                         f"Filtered out {empty_content_count}/{total_raw} empty-content results "
-                        f"(min_length={settings.SEARCH_MIN_CONTENT_LENGTH})"
+                        f"(min_length={min_content_length})"
                     )
 
                 if total_raw > 0 and len(search_results) == 0:
@@ -500,23 +505,21 @@ class GraphitiRetriever:
         # Apply quality boost
         # normalized_quality = quality_score / 100 (0-1)
         # boosted_score = score * (1 + quality_boost_weight * (normalized_quality - 0.5))
-        boosted_results = []
-        for r in results:
-            normalized_quality = r.quality_score / 100.0
-            quality_factor = 1 + quality_boost_weight * (normalized_quality - 0.5)
-            boosted_score = r.score * quality_factor
-
-            boosted_results.append(SearchResult(
+        # The factor is linear in quality_score, so hoist its coefficients
+        factor_base = 1 - quality_boost_weight * 0.5
+        factor_slope = quality_boost_weight / 100.0
+        boosted_results = [
+            SearchResult(
                 chunk_id=r.chunk_id,
                 content=r.content,
-                score=boosted_score,
+                score=r.score * (factor_base + factor_slope * r.quality_score),
                 metadata=r.metadata,
-            ))
-
-        # Sort by boosted score
-        boosted_results.sort(key=lambda x: x.score, reverse=True)
+            )
+            for r in results
+        ]
 
-        return boosted_results[:num_results]
+        # Only the top num_results are kept, so select them without a full sort
+        return heapq.nlargest(num_results, boosted_results, key=lambda x: x.score)
 
     async def search(
         self,
@@ -1,16 +1,29 @@
 """FastAPI application entry point."""
 
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from knowledge_base.api.health import router as health_router
 from knowledge_base.api.search import router as search_router
 from knowledge_base.config import settings
+from knowledge_base.rag.factory import close_shared_client
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Release pooled LLM HTTP connections on shutdown."""
+    yield
+    await close_shared_client()
+
 
 app = FastAPI(
     title=settings.APP_NAME,
     description="AI-powered knowledge base with semantic search and RAG capabilities",
     version="0.1.0",
+    lifespan=lifespan,
 )
 
 # CORS Configuration
@@ -27,12 +40,16 @@ app.include_router(health_router)
 app.include_router(search_router)
 
 
+# Root payload depends only on settings, so it is built once at import
+_ROOT_PAYLOAD = {
+    "name": settings.APP_NAME,
+    "version": "0.1.0",
+    "docs": "/docs",
+    "streamlit_ui": "Run: streamlit run src/knowledge_base/web/streamlit_app.py",
+}
+
+
 @app.get("/")
 async def root() -> dict[str, str]:
     """Root endpoint with basic application info."""
-    return {
-        "name": settings.APP_NAME,
-        "version": "0.1.0",
-        "docs": "/docs",
-        "streamlit_ui": "Run: streamlit run src/knowledge_base/web/streamlit_app.py",
-    }
+    return _ROOT_PAYLOAD
@@ -1,10 +1,11 @@
 """LLM-based metadata extraction."""
 
 import asyncio
-import json
 import logging
 from typing import Any
 
+import orjson
+
 from knowledge_base.config import settings
 from knowledge_base.metadata.normalizer import VocabularyNormalizer
 from knowledge_base.metadata.schemas import DocumentMetadata
@@ -12,14 +13,8 @@ from knowledge_base.rag.llm import BaseLLM
 
 logger = logging.getLogger(__name__)
 
-# Metadata extraction prompt template
-METADATA_EXTRACTION_PROMPT = """Analyze this Confluence document and extract structured metadata.
-
-Title: {title}
-Content: {content}
-
-Extract as JSON:
-{{
+# JSON shape requested for each document (braces doubled for str.format)
+_METADATA_JSON_SCHEMA = """{{
     "topics": ["3-5 main topics covered in this document"],
     "intents": ["2-3 use cases when this document would be useful"],
     "audience": ["who should read this - e.g., all_employees, engineering, sales, hr, new_hires, managers"],
@@ -27,9 +22,38 @@ Extract as JSON:
     "key_entities": ["specific products, services, tools, locations, or systems mentioned"],
     "summary": "1-2 sentence summary of what this document is about",
     "complexity": "one of: beginner, intermediate, advanced"
-}}
+}}"""
+
+_METADATA_GUIDANCE = (
+    "Be specific with topics and entities. For audience, use canonical values "
+    'like "all_employees", "engineering", "new_hires", etc.'
+)
+
+# Metadata extraction prompt template
+METADATA_EXTRACTION_PROMPT = f"""Analyze this Confluence document and extract structured metadata.
+
+Title: {{title}}
+Content: {{content}}
+
+Extract as JSON:
+{_METADATA_JSON_SCHEMA}
+
+{_METADATA_GUIDANCE}"""
+
+# Static text around the placeholders, rendered once so extract() only joins
+_PROMPT_PREFIX, _PROMPT_MIDDLE, _PROMPT_SUFFIX = METADATA_EXTRACTION_PROMPT.format(
+    title="\0", content="\0"
+).split("\0")
+
+# Several documents per prompt; the LLM returns one metadata object per document
+MARSHALED_EXTRACTION_PROMPT = f"""Analyze these {{count}} Confluence documents and extract structured metadata for each.
 
-Be specific with topics and entities. For audience, use canonical values like "all_employees", "engineering", "new_hires", etc."""
+{{documents}}
+
+Respond with JSON of the form {{{{"results": [...]}}}} where "results" holds exactly {{count}} objects, one per DOCUMENT block and in the same order, each shaped like:
+{_METADATA_JSON_SCHEMA}
+
+{_METADATA_GUIDANCE}"""
 
 
 class MetadataExtractor:
@@ -64,15 +88,9 @@ class MetadataExtractor:
         Returns:
             DocumentMetadata with extracted and normalized values
         """
-        # Truncate content if needed
-        truncated_content = content[: self.max_content_chars]
-        if len(content) > self.max_content_chars:
-            truncated_content += "..."
-
         # Build prompt
-        prompt = METADATA_EXTRACTION_PROMPT.format(
-            title=page_title,
-            content=truncated_content,
+        prompt = "".join(
+            (_PROMPT_PREFIX, page_title, _PROMPT_MIDDLE, self._truncate(content), _PROMPT_SUFFIX)
         )
 
         # Generate metadata using LLM
@@ -85,6 +103,12 @@ class MetadataExtractor:
         # Parse and normalize the response
         return self._normalize_metadata(raw_metadata)
 
+    def _truncate(self, content: str) -> str:
+        """Truncate content to max_content_chars, marking the cut."""
+        if len(content) > self.max_content_chars:
+            return content[: self.max_content_chars] + "..."
+        return content
+
     def _normalize_metadata(self, raw: dict[str, Any]) -> DocumentMetadata:
         """Normalize raw LLM output to canonical forms."""
         # Get raw values with defaults
@@ -147,45 +171,117 @@ class MetadataExtractor:
         Returns:
             Dictionary mapping chunk_id to DocumentMetadata
         """
+        if not items:
+            return {}
+        if len(items) == 1:
+            # Incremental updates often send one chunk; skip the semaphore/gather setup
+            chunk_id, content, page_title = items[0]
+            return {chunk_id: await self._extract_item(chunk_id, content, page_title)}
+
         concurrency = concurrency or settings.METADATA_BATCH_SIZE
         semaphore = asyncio.Semaphore(concurrency)
-        results: dict[str, DocumentMetadata] = {}
 
-        async def process_item(chunk_id: str, content: str, page_title: str) -> None:
+        async def process_item(chunk_id: str, content: str, page_title: str) -> DocumentMetadata:
             async with semaphore:
-                try:
-                    metadata = await self.extract(content, page_title)
-                    results[chunk_id] = metadata
-                    logger.debug(f"Extracted metadata for chunk {chunk_id}")
-                except Exception as e:
-                    logger.error(f"Failed to extract metadata for chunk {chunk_id}: {e}")
-                    # Store default metadata on failure
-                    results[chunk_id] = DocumentMetadata()
-
-        # Create tasks for all items
-        tasks = [
-            asyncio.create_task(process_item(chunk_id, content, page_title))
-            for chunk_id, content, page_title in items
-        ]
+                return await self._extract_item(chunk_id, content, page_title)
+
+        # gather keeps input order, so the result mapping is deterministic
+        extracted = await asyncio.gather(*(process_item(*item) for item in items))
+
+        return {chunk_id: metadata for (chunk_id, _, _), metadata in zip(items, extracted)}
+
+    async def _extract_item(self, chunk_id: str, content: str, page_title: str) -> DocumentMetadata:
+        """Extract one batch item, falling back to default metadata on failure."""
+        try:
+            metadata = await self.extract(content, page_title)
+            logger.debug(f"Extracted metadata for chunk {chunk_id}")
+            return metadata
+        except Exception as e:
+            logger.error(f"Failed to extract metadata for chunk {chunk_id}: {e}")
+            # Store default metadata on failure
+            return DocumentMetadata()
+
+    async def extract_marshaled(
+        self,
+        items: list[tuple[str, str, str]],
+        rows_per_call: int = 8,
+        concurrency: int | None = None,
+    ) -> dict[str, DocumentMetadata]:
+        """
+        Extract metadata for multiple chunks, packing several chunks per LLM call.
 
-        # Wait for all to complete
-        await asyncio.gather(*tasks, return_exceptions=True)
+        Amortizes prompt boilerplate and request latency across rows_per_call
+        chunks. Groups whose response does not contain one object per chunk
+        fall back to per-chunk extraction.
 
+        Args:
+            items: List of (chunk_id, content, page_title) tuples
+            rows_per_call: Max chunks packed into a single prompt
+            concurrency: Max concurrent LLM calls (defaults to METADATA_BATCH_SIZE)
+
+        Returns:
+            Dictionary mapping chunk_id to DocumentMetadata
+        """
+        concurrency = concurrency or settings.METADATA_BATCH_SIZE
+        semaphore = asyncio.Semaphore(concurrency)
+        groups = [items[i:i + rows_per_call] for i in range(0, len(items), rows_per_call)]
+
+        async def process_group(group: list[tuple[str, str, str]]) -> list[DocumentMetadata]:
+            async with semaphore:
+                return await self._extract_group(group)
+
+        extracted = await asyncio.gather(*(process_group(group) for group in groups))
+
+        results: dict[str, DocumentMetadata] = {}
+        for group, metadata_list in zip(groups, extracted):
+            for (chunk_id, _, _), metadata in zip(group, metadata_list):
+                results[chunk_id] = metadata
         return results
 
+    async def _extract_group(self, group: list[tuple[str, str, str]]) -> list[DocumentMetadata]:
+        """Extract metadata for one packed group, in group order."""
+        if len(group) == 1:
+            return [await self._extract_item(*group[0])]
+
+        documents = "\n\n".join(
+            f"---DOCUMENT {i}---\nTitle: {page_title}\nContent: {self._truncate(content)}"
+            for i, (_, content, page_title) in enumerate(group, start=1)
+        )
+        prompt = MARSHALED_EXTRACTION_PROMPT.format(count=len(group), documents=documents)
+
+        try:
+            raw = await self.llm.generate_json(prompt)
+        except Exception as e:
+            logger.error(f"Marshaled LLM extraction failed for {len(group)} chunks: {e}")
+            raw = {}
+
+        raw_results = raw.get("results") if isinstance(raw, dict) else None
+        if not isinstance(raw_results, list) or len(raw_results) != len(group):
+            logger.warning(
+                f"Marshaled extraction returned an unusable result for {len(group)} chunks, "
+                "falling back to per-chunk extraction"
+            )
+            # Sequential: the caller's concurrency slot covers one LLM call at a time
+            return [await self._extract_item(*item) for item in group]
+
+        return [
+            self._normalize_metadata(item if isinstance(item, dict) else {})
+            for item in raw_results
+        ]
+
 
 def metadata_to_db_dict(metadata: DocumentMetadata) -> dict[str, Any]:
     """
     Convert DocumentMetadata to dictionary for database storage.
 
-    JSON fields are serialized to strings for SQLite storage.
+    JSON fields are serialized to compact strings for SQLite storage.
     """
     return {
-        "topics": json.dumps(metadata.topics),
-        "intents": json.dumps(metadata.intents),
-        "audience": json.dumps(metadata.audience),
+        "topics": orjson.dumps(metadata.topics).decode(),
+        "intents": orjson.dumps(metadata.intents).decode(),
+        "audience": orjson.dumps(metadata.audience).decode(),
         "doc_type": metadata.doc_type,
-        "key_entities": json.dumps(metadata.key_entities),
+        "key_entities": orjson.dumps(metadata.key_entities).decode(),
         "summary": metadata.summary,
         "complexity": metadata.complexity,
     }
@@ -198,11 +294,11 @@ def db_dict_to_metadata(data: dict[str, Any]) -> DocumentMetadata:
     JSON fields are deserialized from strings.
     """
     return DocumentMetadata(
-        topics=json.loads(data.get("topics", "[]")),
-        intents=json.loads(data.get("intents", "[]")),
-        audience=json.loads(data.get("audience", "[]")),
+        topics=orjson.loads(data.get("topics", "[]")),
+        intents=orjson.loads(data.get("intents", "[]")),
+        audience=orjson.loads(data.get("audience", "[]")),
         doc_type=data.get("doc_type", "general"),
-        key_entities=json.loads(data.get("key_entities", "[]")),
+        key_entities=orjson.loads(data.get("key_entities", "[]")),
         summary=data.get("summary", ""),
         complexity=data.get("complexity", "intermediate"),
     )
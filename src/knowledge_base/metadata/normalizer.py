@@ -1,5 +1,6 @@
 """Vocabulary normalization for metadata."""
 
+import functools
 import re
 
 
@@ -51,6 +52,174 @@ DOC_TYPES = [
 # Valid complexity levels
 COMPLEXITY_LEVELS = ["beginner", "intermediate", "advanced"]
 
+# Audience synonyms mapping to canonical values
+AUDIENCE_SYNONYMS: dict[str, str] = {
+    "everyone": "all_employees",
+    "all": "all_employees",
+    "engineers": "engineering",
+    "developers": "engineering",
+    "dev": "engineering",
+    "eng": "engineering",
+    "tech": "engineering",
+    "technical": "engineering",
+    "new employees": "new_hires",
+    "new hire": "new_hires",
+    "newcomers": "new_hires",
+    "manager": "managers",
+    "management": "managers",
+    "leader": "leadership",
+    "leaders": "leadership",
+    "executives": "leadership",
+    "sales team": "sales",
+    "hr team": "hr",
+    "human resources": "hr",
+    "finance team": "finance",
+    "marketing team": "marketing",
+    "support team": "support",
+    "product team": "product",
+}
+
+# Document type synonyms mapping to canonical types
+DOC_TYPE_SYNONYMS: dict[str, str] = {
+    "guide": "how-to",
+    "tutorial": "how-to",
+    "instructions": "how-to",
+    "manual": "reference",
+    "documentation": "reference",
+    "docs": "reference",
+    "faq": "FAQ",
+    "faqs": "FAQ",
+    "questions": "FAQ",
+    "news": "announcement",
+    "update": "announcement",
+    "newsletter": "announcement",
+    "notes": "meeting-notes",
+    "minutes": "meeting-notes",
+    "summary": "meeting-notes",
+}
+
+# Complexity synonyms mapping to canonical levels
+COMPLEXITY_SYNONYMS: dict[str, str] = {
+    "basic": "beginner",
+    "easy": "beginner",
+    "simple": "beginner",
+    "medium": "intermediate",
+    "moderate": "intermediate",
+    "normal": "intermediate",
+    "complex": "advanced",
+    "expert": "advanced",
+    "difficult": "advanced",
+}
+
+_DOC_TYPES_SET = frozenset(DOC_TYPES)
+_COMPLEXITY_LEVELS_SET = frozenset(COMPLEXITY_LEVELS)
+_AUDIENCE_SEPARATORS_RE = re.compile(r"[_\s-]+")
+
+
+# Inflections tolerated between a vocabulary term and an LLM-produced variant
+_INFLECTION_SUFFIXES = ("s", "es", "ed", "ing")
+# Shorter stems are mostly abbreviations ("hr", "pm"), where a suffix is not an inflection
+_MIN_INFLECTION_STEM = 4
+
+
+class _TrieNode:
+    """Node of the vocabulary trie; canonical is set where a term ends."""
+
+    __slots__ = ("children", "canonical")
+
+    def __init__(self) -> None:
+        self.children: dict[str, _TrieNode] = {}
+        self.canonical: str | None = None
+
+
+class _VocabularyTrie:
+    """Character trie over vocabulary terms for inflection-tolerant lookup.
+
+    Resolves variants such as "tool" -> "tools" or "trainings" -> "training"
+    without listing every form as a synonym. A variant only matches when it
+    differs from a known term by one of _INFLECTION_SUFFIXES and the shorter
+    form has at least _MIN_INFLECTION_STEM characters, so unrelated words that
+    merely share a prefix ("devastating" vs "dev", "hrs" vs "hr") are left alone.
+    """
+
+    def __init__(self, terms: dict[str, str]) -> None:
+        self._root = _TrieNode()
+        for term, canonical in terms.items():
+            node = self._root
+            for char in term:
+                node = node.children.setdefault(char, _TrieNode())
+            node.canonical = canonical
+
+    def _descend(self, node: _TrieNode, chars: str) -> _TrieNode | None:
+        for char in chars:
+            node = node.children.get(char)
+            if node is None:
+                return None
+        return node
+
+    def lookup(self, word: str) -> str | None:
+        """Return the canonical form for word or an inflection of a known term."""
+        node: _TrieNode | None = self._root
+        prefix_ends: list[tuple[int, str]] = []
+        for i, char in enumerate(word):
+            node = node.children.get(char)
+            if node is None:
+                break
+            if node.canonical is not None:
+                prefix_ends.append((i + 1, node.canonical))
+        else:
+            if node.canonical is not None:
+                return node.canonical
+            if len(word) < _MIN_INFLECTION_STEM:
+                return None
+            # word is a known term minus an inflection ("tool" -> "tools")
+            for suffix in _INFLECTION_SUFFIXES:
+                end = self._descend(node, suffix)
+                if end is not None and end.canonical is not None:
+                    return end.canonical
+
+        # word is a known term plus an inflection ("trainings" -> "training")
+        for end, canonical in reversed(prefix_ends):
+            if end < _MIN_INFLECTION_STEM:
+                break
+            if word[end:] in _INFLECTION_SUFFIXES:
+                return canonical
+        return None
+
+
+def _build_topic_reverse(topic_synonyms: dict[str, list[str]]) -> dict[str, str]:
+    """Map every lowercased canonical topic and synonym to its canonical topic."""
+    reverse: dict[str, str] = {}
+    for canonical, synonyms in topic_synonyms.items():
+        reverse[canonical.lower()] = canonical
+        for syn in synonyms:
+            reverse[syn.lower()] = canonical
+    return reverse
+
+
+# Reverse mapping and trie for the default vocabulary, built once at import
+_DEFAULT_TOPIC_REVERSE = _build_topic_reverse(TOPIC_SYNONYMS)
+_DEFAULT_TOPIC_TRIE = _VocabularyTrie(_DEFAULT_TOPIC_REVERSE)
+
+
+# Doc type and complexity inputs are low-cardinality LLM strings, so memoize them
+@functools.lru_cache(maxsize=512)
+def _normalize_doc_type(doc_type: str) -> str:
+    """Map a document type to one of DOC_TYPES, defaulting to general."""
+    doc_type_normalized = doc_type.lower().strip().replace(" ", "-")
+    if doc_type_normalized in _DOC_TYPES_SET:
+        return doc_type_normalized
+    return DOC_TYPE_SYNONYMS.get(doc_type_normalized, "general")
+
+
+@functools.lru_cache(maxsize=512)
+def _normalize_complexity(complexity: str) -> str:
+    """Map a complexity value to one of COMPLEXITY_LEVELS, defaulting to intermediate."""
+    complexity_lower = complexity.lower().strip()
+    if complexity_lower in _COMPLEXITY_LEVELS_SET:
+        return complexity_lower
+    return COMPLEXITY_SYNONYMS.get(complexity_lower, "intermediate")
+
 
 class VocabularyNormalizer:
     """Normalizes vocabulary to canonical forms."""
@@ -62,12 +231,14 @@ class VocabularyNormalizer:
     ):
         self.topic_synonyms = topic_synonyms or TOPIC_SYNONYMS
         self.audience_canonical = audience_canonical or AUDIENCE_CANONICAL
-        # Build reverse mapping for topics
-        self._topic_reverse: dict[str, str] = {}
-        for canonical, synonyms in self.topic_synonyms.items():
-            self._topic_reverse[canonical.lower()] = canonical
-            for syn in synonyms:
-                self._topic_reverse[syn.lower()] = canonical
+        self._audience_canonical_set = frozenset(self.audience_canonical)
+        # Reverse mapping for topics (the default vocabulary's is prebuilt)
+        if self.topic_synonyms is TOPIC_SYNONYMS:
+            self._topic_reverse = _DEFAULT_TOPIC_REVERSE
+            self._topic_trie = _DEFAULT_TOPIC_TRIE
+        else:
+            self._topic_reverse = _build_topic_reverse(self.topic_synonyms)
+            self._topic_trie = _VocabularyTrie(self._topic_reverse)
 
     def normalize_topics(self, raw_topics: list[str]) -> list[str]:
         """Normalize topics to canonical forms."""
@@ -75,8 +246,8 @@ class VocabularyNormalizer:
         seen = set()
         for topic in raw_topics:
             topic_lower = topic.lower().strip()
-            # Check if it maps to a canonical form
-            canonical = self._topic_reverse.get(topic_lower)
+            # Check if it (or an inflection of it) maps to a canonical form
+            canonical = self._topic_reverse.get(topic_lower) or self._topic_trie.lookup(topic_lower)
             if canonical and canonical not in seen:
                 normalized.append(canonical)
                 seen.add(canonical)
@@ -99,89 +270,18 @@ class VocabularyNormalizer:
 
     def _normalize_audience_value(self, value: str) -> str | None:
         """Map a single audience value to canonical form."""
-        value_lower = value.lower().strip()
-        value_normalized = re.sub(r"[_\s-]+", "_", value_lower)
+        value_normalized = _AUDIENCE_SEPARATORS_RE.sub("_", value.lower().strip())
 
         # Direct match
-        if value_normalized in self.audience_canonical:
+        if value_normalized in self._audience_canonical_set:
             return value_normalized
 
-        # Common mappings
-        mappings = {
-            "everyone": "all_employees",
-            "all": "all_employees",
-            "engineers": "engineering",
-            "developers": "engineering",
-            "dev": "engineering",
-            "eng": "engineering",
-            "tech": "engineering",
-            "technical": "engineering",
-            "new employees": "new_hires",
-            "new hire": "new_hires",
-            "newcomers": "new_hires",
-            "manager": "managers",
-            "management": "managers",
-            "leader": "leadership",
-            "leaders": "leadership",
-            "executives": "leadership",
-            "sales team": "sales",
-            "hr team": "hr",
-            "human resources": "hr",
-            "finance team": "finance",
-            "marketing team": "marketing",
-            "support team": "support",
-            "product team": "product",
-        }
-
-        return mappings.get(value_normalized, value_normalized)
+        return AUDIENCE_SYNONYMS.get(value_normalized, value_normalized)
 
     def normalize_doc_type(self, doc_type: str) -> str:
         """Normalize document type."""
-        doc_type_lower = doc_type.lower().strip()
-        doc_type_normalized = doc_type_lower.replace(" ", "-")
-
-        if doc_type_normalized in DOC_TYPES:
-            return doc_type_normalized
-
-        # Common mappings
-        mappings = {
-            "guide": "how-to",
-            "tutorial": "how-to",
-            "instructions": "how-to",
-            "manual": "reference",
-            "documentation": "reference",
-            "docs": "reference",
-            "faq": "FAQ",
-            "faqs": "FAQ",
-            "questions": "FAQ",
-            "news": "announcement",
-            "update": "announcement",
-            "newsletter": "announcement",
-            "notes": "meeting-notes",
-            "minutes": "meeting-notes",
-            "summary": "meeting-notes",
-        }
-
-        return mappings.get(doc_type_normalized, "general")
+        return _normalize_doc_type(doc_type)
 
     def normalize_complexity(self, complexity: str) -> str:
         """Normalize complexity level."""
-        complexity_lower = complexity.lower().strip()
-
-        if complexity_lower in COMPLEXITY_LEVELS:
-            return complexity_lower
-
-        # Common mappings
-        mappings = {
-            "basic": "beginner",
-            "easy": "beginner",
-            "simple": "beginner",
-            "medium": "intermediate",
-            "moderate": "intermediate",
-            "normal": "intermediate",
-            "complex": "advanced",
-            "expert": "advanced",
-            "difficult": "advanced",
-        }
-
-        return mappings.get(complexity_lower, "intermediate")
+        return _normalize_complexity(complexity)
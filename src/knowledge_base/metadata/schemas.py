@@ -29,13 +29,25 @@ class DocumentMetadata(BaseModel):
 
     @classmethod
     def from_dict(cls, data: dict) -> "DocumentMetadata":
-        """Create from a dictionary, handling missing or invalid fields."""
-        return cls(
-            topics=data.get("topics", []) if isinstance(data.get("topics"), list) else [],
-            intents=data.get("intents", []) if isinstance(data.get("intents"), list) else [],
-            audience=data.get("audience", []) if isinstance(data.get("audience"), list) else [],
-            doc_type=data.get("doc_type", "general") if isinstance(data.get("doc_type"), str) else "general",
-            key_entities=data.get("key_entities", []) if isinstance(data.get("key_entities"), list) else [],
-            summary=data.get("summary", "") if isinstance(data.get("summary"), str) else "",
-            complexity=data.get("complexity", "intermediate") if isinstance(data.get("complexity"), str) else "intermediate",
-        )
+        """Create from a dictionary, handling missing or invalid fields.
+
+        Fields that are missing or of the wrong type are omitted so the
+        model defaults apply.
+        """
+        return cls(**{
+            name: value
+            for name, expected_type in _FIELD_TYPES
+            if isinstance(value := data.get(name), expected_type)
+        })
+
+
+# (field name, expected type) pairs checked by DocumentMetadata.from_dict
+_FIELD_TYPES: tuple[tuple[str, type], ...] = (
+    ("topics", list),
+    ("intents", list),
+    ("audience", list),
+    ("doc_type", str),
+    ("key_entities", list),
+    ("summary", str),
+    ("complexity", str),
+)
@@ -1,7 +1,13 @@
 """LLM provider factory with registry pattern."""
 
+import asyncio
+import contextlib
+import functools
 import logging
-from typing import Callable, TypeVar
+import threading
+from typing import Any, AsyncIterator, Callable, Coroutine, TypeVar
+
+import httpx
 
 from knowledge_base.config import settings
 from knowledge_base.rag.exceptions import LLMProviderNotConfiguredError
@@ -14,6 +20,14 @@ T = TypeVar("T")
 # Provider registry: maps provider names to factory functions
 _PROVIDER_REGISTRY: dict[str, Callable[[], "BaseLLM"]] = {}
 
+# Pooled HTTP clients injected into the httpx-based providers. Connections cannot
+# cross event loops, so each loop gets its own client (None keys the one built
+# outside any loop). Whoever runs the loop owns its client and closes it before
+# the loop ends: the FastAPI lifespan, or shared_client_scope() in asyncio.run()
+# entry points.
+_shared_clients: dict[asyncio.AbstractEventLoop | None, httpx.AsyncClient] = {}
+_shared_clients_lock = threading.Lock()
+
 
 def register_provider(name: str) -> Callable[[Callable[[], T]], Callable[[], T]]:
     """Decorator to register an LLM provider factory.
@@ -27,15 +41,97 @@ def register_provider(name: str) -> Callable[[Callable[[], T]], Callable[[], T]]
 
     def decorator(factory: Callable[[], T]) -> Callable[[], T]:
         _PROVIDER_REGISTRY[name.lower()] = factory
+        _provider_names.cache_clear()
         logger.debug(f"Registered LLM provider: {name}")
         return factory
 
     return decorator
 
 
+def _new_shared_client() -> httpx.AsyncClient:
+    """Build a pooled client sized for every provider sharing it."""
+    return httpx.AsyncClient(
+        limits=httpx.Limits(max_keepalive_connections=20, max_connections=50),
+    )
+
+
+def get_shared_client() -> httpx.AsyncClient:
+    """Get the pooled HTTP client for the running event loop, creating it lazily.
+
+    A closed client is replaced. Clients whose loop ended without
+    close_shared_client() are dropped with a warning, since their connections
+    can no longer be closed cleanly.
+    """
+    try:
+        loop: asyncio.AbstractEventLoop | None = asyncio.get_running_loop()
+    except RuntimeError:
+        loop = None
+
+    with _shared_clients_lock:
+        client = _shared_clients.get(loop)
+        if client is None or client.is_closed:
+            for stale in [key for key in _shared_clients if key is not None and key.is_closed()]:
+                del _shared_clients[stale]
+                logger.warning(
+                    "Shared LLM HTTP client outlived its event loop; "
+                    "wrap asyncio.run() entry points in shared_client_scope()"
+                )
+            client = _shared_clients[loop] = _new_shared_client()
+        return client
+
+
+async def close_shared_client() -> None:
+    """Close the running loop's shared HTTP client and any loop-less one.
+
+    Call before the loop ends: on application shutdown, or in the ``finally``
+    of an ``asyncio.run()`` entry point (see shared_client_scope()).
+    """
+    with _shared_clients_lock:
+        clients = [
+            _shared_clients.pop(key, None) for key in (asyncio.get_running_loop(), None)
+        ]
+    for client in clients:
+        if client is not None:
+            await client.aclose()
+
+
+@contextlib.asynccontextmanager
+async def shared_client_scope() -> AsyncIterator[None]:
+    """Close the running loop's shared HTTP client, if one was created, on exit.
+
+    Usage:
+        async def main():
+            async with shared_client_scope():
+                llm = await get_llm()
+                ...
+
+        asyncio.run(main())
+    """
+    try:
+        yield
+    finally:
+        await close_shared_client()
+
+
+def run_with_shared_client(coro: Coroutine[Any, Any, T]) -> T:
+    """asyncio.run() ``coro`` inside shared_client_scope(), for sync entry points."""
+
+    async def scoped() -> T:
+        async with shared_client_scope():
+            return await coro
+
+    return asyncio.run(scoped())
+
+
+@functools.lru_cache(maxsize=1)
+def _provider_names() -> tuple[str, ...]:
+    """Registered provider names, cached until the next registration."""
+    return tuple(_PROVIDER_REGISTRY)
+
+
 def get_available_providers() -> list[str]:
     """Get list of registered provider names."""
-    return list(_PROVIDER_REGISTRY.keys())
+    return list(_provider_names())
 
 
 def get_provider(name: str) -> "BaseLLM":
@@ -50,15 +146,15 @@ def get_provider(name: str) -> "BaseLLM":
     Raises:
         LLMProviderNotConfiguredError: If provider is not registered
     """
-    name_lower = name.lower()
-    if name_lower not in _PROVIDER_REGISTRY:
+    factory = _PROVIDER_REGISTRY.get(name.lower())
+    if factory is None:
         available = ", ".join(get_available_providers())
         raise LLMProviderNotConfiguredError(
             f"Unknown provider '{name}'. Available: {available}",
             provider=name,
         )
 
-    return _PROVIDER_REGISTRY[name_lower]()
+    return factory()
 
 
 async def get_llm(provider: str | None = None) -> "BaseLLM":
@@ -106,7 +202,7 @@ def _create_ollama() -> BaseLLM:
     """Create Ollama LLM instance."""
     from knowledge_base.rag.llm import OllamaLLM
 
-    return OllamaLLM()
+    return OllamaLLM(client=get_shared_client())
 
 
 @register_provider("claude")
@@ -114,7 +210,7 @@ def _create_claude() -> BaseLLM:
     """Create Claude LLM instance."""
     from knowledge_base.rag.providers.claude import ClaudeLLM
 
-    return ClaudeLLM()
+    return ClaudeLLM(client=get_shared_client())
 
 
 @register_provider("gemini")
@@ -1,11 +1,12 @@
 """LLM client implementations."""
 
-import json
+import asyncio
 import logging
 from abc import ABC, abstractmethod
 from typing import Any, AsyncIterator
 
 import httpx
+import orjson
 from tenacity import retry, stop_after_attempt, wait_exponential
 
 from knowledge_base.config import settings
@@ -62,6 +63,15 @@ class BaseLLM(ABC):
         """
         return True
 
+    async def close(self) -> None:
+        """Release resources held by the provider; the default holds none."""
+
+    async def __aenter__(self) -> "BaseLLM":
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.close()
+
     def _parse_json_response(self, response_text: str) -> dict[str, Any]:
         """Parse JSON from LLM response, handling common formatting issues.
 
@@ -71,22 +81,28 @@ class BaseLLM(ABC):
         Returns:
             Parsed JSON object, or empty dict on parse failure
         """
-        try:
-            text = response_text.strip()
+        text = response_text.strip()
 
-            # Remove markdown code blocks if present
-            if text.startswith("```json"):
-                text = text[7:]
-            elif text.startswith("```"):
-                text = text[3:]
+        # Remove markdown code blocks (with any language tag) if present
+        if text.startswith("```"):
+            newline = text.find("\n")
+            text = text[newline + 1:] if newline != -1 else text[3:]
 
-            if text.endswith("```"):
-                text = text[:-3]
+        if text.endswith("```"):
+            text = text[:-3]
 
-            text = text.strip()
-            return json.loads(text)
+        text = text.strip()
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError as e:
+            # Recover an object embedded in surrounding prose
+            start, end = text.find("{"), text.rfind("}")
+            if 0 <= start < end:
+                try:
+                    return orjson.loads(text[start:end + 1])
+                except orjson.JSONDecodeError:
+                    pass
 
-        except json.JSONDecodeError as e:
             logger.warning(f"Failed to parse {self.provider_name} response as JSON: {e}")
             logger.debug(f"Raw response: {response_text}")
             return {}
@@ -100,19 +116,51 @@ class OllamaLLM(BaseLLM):
         base_url: str | None = None,
         model: str | None = None,
         timeout: float = 120.0,
+        client: httpx.AsyncClient | None = None,
     ):
         self.base_url = (base_url or settings.OLLAMA_BASE_URL).rstrip("/")
         self.model = model or settings.OLLAMA_LLM_MODEL
         self.timeout = timeout
+        # An injected client (e.g. the factory's shared pool) belongs to the caller;
+        # otherwise one pooled client is created on first use and owned here
+        self._client = client
+        self._owns_client = client is None
+        self._closed = False
 
     @property
     def provider_name(self) -> str:
         """Return the provider name."""
         return "ollama"
 
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get the HTTP client, creating the owned pooled client on first use."""
+        if self._closed:
+            raise RuntimeError("OllamaLLM is closed")
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout,
+                limits=httpx.Limits(max_keepalive_connections=10, max_connections=20),
+            )
+        return self._client
+
+    async def close(self) -> None:
+        """Close the owned client; an injected client is left to its owner.
+
+        The instance cannot be used afterwards.
+        """
+        self._closed = True
+        if self._owns_client and self._client is not None:
+            await self._client.aclose()
+        self._client = None
+
+    @property
+    def available(self) -> bool:
+        """Whether Ollama is configured (URL exists); cheap sync check for hot paths."""
+        return bool(self.base_url)
+
     async def is_available(self) -> bool:
         """Check if Ollama is configured (URL exists)."""
-        return bool(self.base_url)
+        return self.available
 
     @retry(
         stop=stop_after_attempt(3),
@@ -120,19 +168,40 @@ class OllamaLLM(BaseLLM):
     )
     async def generate(self, prompt: str, **kwargs: Any) -> str:
         """Generate text from a prompt using Ollama."""
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.post(
-                f"{self.base_url}/api/generate",
-                json={
-                    "model": self.model,
-                    "prompt": prompt,
-                    "stream": False,
-                    **kwargs,
-                },
-            )
-            response.raise_for_status()
-            data = response.json()
-            return data.get("response", "")
+        response = await self._get_client().post(
+            f"{self.base_url}/api/generate",
+            json={
+                "model": self.model,
+                "prompt": prompt,
+                "stream": False,
+                **kwargs,
+            },
+            timeout=self.timeout,
+        )
+        response.raise_for_status()
+        data = orjson.loads(response.content)
+        return data.get("response", "")
+
+    async def generate_many(
+        self, prompts: list[str], concurrency: int = 8, **kwargs: Any
+    ) -> list[str]:
+        """Generate responses for several prompts concurrently over the pooled client.
+
+        Args:
+            prompts: Prompts to send
+            concurrency: Max requests in flight at once
+            **kwargs: Additional generation parameters passed to generate()
+
+        Returns:
+            Responses in the same order as prompts
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def generate_one(prompt: str) -> str:
+            async with semaphore:
+                return await self.generate(prompt, **kwargs)
+
+        return list(await asyncio.gather(*(generate_one(p) for p in prompts)))
 
     async def generate_json(self, prompt: str, **kwargs: Any) -> dict[str, Any]:
         """Generate a JSON response from a prompt."""
@@ -147,9 +216,8 @@ IMPORTANT: Respond ONLY with valid JSON. No markdown, no explanation, just the J
     async def check_health(self) -> bool:
         """Check if Ollama is accessible."""
         try:
-            async with httpx.AsyncClient(timeout=5.0) as client:
-                response = await client.get(f"{self.base_url}/api/tags")
-                return response.status_code == 200
+            response = await self._get_client().get(f"{self.base_url}/api/tags", timeout=5.0)
+            return response.status_code == 200
         except Exception as e:
             logger.error(f"Ollama health check failed: {e}")
             return False
@@ -157,11 +225,10 @@ IMPORTANT: Respond ONLY with valid JSON. No markdown, no explanation, just the J
     async def list_models(self) -> list[str]:
         """List available models."""
         try:
-            async with httpx.AsyncClient(timeout=5.0) as client:
-                response = await client.get(f"{self.base_url}/api/tags")
-                response.raise_for_status()
-                data = response.json()
-                return [m["name"] for m in data.get("models", [])]
+            response = await self._get_client().get(f"{self.base_url}/api/tags", timeout=5.0)
+            response.raise_for_status()
+            data = orjson.loads(response.content)
+            return [m["name"] for m in data.get("models", [])]
         except Exception as e:
             logger.error(f"Failed to list models: {e}")
             return []
@@ -38,6 +38,7 @@ class ClaudeLLM(BaseLLM):
         model: str | None = None,
         timeout: float = 60.0,
         max_tokens: int = 4096,
+        client: httpx.AsyncClient | None = None,
     ):
         """Initialize Claude LLM client.
 
@@ -46,11 +47,16 @@ class ClaudeLLM(BaseLLM):
             model: Model to use (defaults to settings.ANTHROPIC_MODEL)
             timeout: Request timeout in seconds
             max_tokens: Default max tokens for responses
+            client: Shared HTTP client to use; left open by close() (created and
+                owned by this instance if omitted)
         """
         self.api_key = api_key or settings.ANTHROPIC_API_KEY
         self.model = model or settings.ANTHROPIC_MODEL
         self.timeout = timeout
         self.max_tokens = max_tokens
+        self._client = client
+        self._owns_client = client is None
+        self._closed = False
 
         if not self.api_key:
             logger.warning("Claude API key not configured")
@@ -64,6 +70,24 @@ class ClaudeLLM(BaseLLM):
         """Check if Claude is configured (API key exists)."""
         return bool(self.api_key)
 
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get the HTTP client, creating the owned pooled client on first use."""
+        if self._closed:
+            raise RuntimeError("ClaudeLLM is closed")
+        if self._client is None:
+            self._client = httpx.AsyncClient(timeout=self.timeout)
+        return self._client
+
+    async def close(self) -> None:
+        """Close the owned client; an injected client is left to its owner.
+
+        The instance cannot be used afterwards.
+        """
+        self._closed = True
+        if self._owns_client and self._client is not None:
+            await self._client.aclose()
+        self._client = None
+
     def _get_headers(self) -> dict[str, str]:
         """Get API request headers."""
         return {
@@ -97,50 +121,50 @@ class ClaudeLLM(BaseLLM):
                 "API key not configured", provider=self.provider_name
             )
 
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            try:
-                response = await client.post(
-                    ANTHROPIC_API_URL,
-                    headers=self._get_headers(),
-                    json={
-                        "model": self.model,
-                        "max_tokens": kwargs.get("max_tokens", self.max_tokens),
-                        "messages": [{"role": "user", "content": prompt}],
-                    },
+        try:
+            response = await self._get_client().post(
+                ANTHROPIC_API_URL,
+                headers=self._get_headers(),
+                json={
+                    "model": self.model,
+                    "max_tokens": kwargs.get("max_tokens", self.max_tokens),
+                    "messages": [{"role": "user", "content": prompt}],
+                },
+                timeout=self.timeout,
+            )
+
+            if response.status_code == 401:
+                raise LLMAuthenticationError(
+                    "Invalid API key", provider=self.provider_name
                 )
+            elif response.status_code == 429:
+                retry_after = response.headers.get("retry-after")
+                raise LLMRateLimitError(
+                    "Rate limit exceeded",
+                    provider=self.provider_name,
+                    retry_after=float(retry_after) if retry_after else None,
+                )
+
+            response.raise_for_status()
+            data = response.json()
 
-                if response.status_code == 401:
-                    raise LLMAuthenticationError(
-                        "Invalid API key", provider=self.provider_name
-                    )
-                elif response.status_code == 429:
-                    retry_after = response.headers.get("retry-after")
-                    raise LLMRateLimitError(
-                        "Rate limit exceeded",
-                        provider=self.provider_name,
-                        retry_after=float(retry_after) if retry_after else None,
-                    )
-
-                response.raise_for_status()
-                data = response.json()
-
-                # Extract text from Claude response format
-                content_blocks = data.get("content", [])
-                text_parts = [
-                    block.get("text", "")
-                    for block in content_blocks
-                    if block.get("type") == "text"
-                ]
-                return "".join(text_parts)
-
-            except httpx.ConnectError as e:
-                raise LLMConnectionError(
-                    f"Failed to connect: {e}", provider=self.provider_name
-                ) from e
-            except httpx.TimeoutException as e:
-                raise LLMConnectionError(
-                    f"Request timed out: {e}", provider=self.provider_name
-                ) from e
+            # Extract text from Claude response format
+            content_blocks = data.get("content", [])
+            text_parts = [
+                block.get("text", "")
+                for block in content_blocks
+                if block.get("type") == "text"
+            ]
+            return "".join(text_parts)
+
+        except httpx.ConnectError as e:
+            raise LLMConnectionError(
+                f"Failed to connect: {e}", provider=self.provider_name
+            ) from e
+        except httpx.TimeoutException as e:
+            raise LLMConnectionError(
+                f"Request timed out: {e}", provider=self.provider_name
+            ) from e
 
     async def generate_json(self, prompt: str, **kwargs: Any) -> dict[str, Any]:
         """Generate a JSON response from a prompt.
@@ -171,19 +195,19 @@ IMPORTANT: Respond ONLY with valid JSON. No markdown, no explanation, just the J
             return False
 
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.post(
-                    ANTHROPIC_API_URL,
-                    headers=self._get_headers(),
-                    json={
-                        "model": self.model,
-                        "max_tokens": 1,
-                        "messages": [{"role": "user", "content": "Hi"}],
-                    },
-                )
-                logger.info(f"Claude health check status: {response.status_code}")
-                # 200 = success, 400 = bad request but API is reachable
-                return response.status_code in (200, 400)
+            response = await self._get_client().post(
+                ANTHROPIC_API_URL,
+                headers=self._get_headers(),
+                json={
+                    "model": self.model,
+                    "max_tokens": 1,
+                    "messages": [{"role": "user", "content": "Hi"}],
+                },
+                timeout=30.0,
+            )
+            logger.info(f"Claude health check status: {response.status_code}")
+            # 200 = success, 400 = bad request but API is reachable
+            return response.status_code in (200, 400)
         except httpx.TimeoutException as e:
             logger.error(f"Claude health check timed out: {e}")
             return False
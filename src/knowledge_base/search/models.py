@@ -4,16 +4,19 @@ This module provides a shared SearchResult class that can be imported
 without ChromaDB dependencies.
 """
 
+import json
 from dataclasses import dataclass
 from typing import Any
 
 
-@dataclass
+@dataclass(slots=True)
 class SearchResult:
     """A single search result from any search backend.
 
     This class is used by both GraphitiRetriever and HybridRetriever
-    to provide a consistent interface for search results.
+    to provide a consistent interface for search results. Slotted, since
+    rankers hold many of them; metadata-derived fields stay properties so
+    they track later metadata edits.
     """
 
     chunk_id: str
@@ -64,7 +67,6 @@ class SearchResult:
     @property
     def topics(self) -> list[str]:
         """Topics from metadata (JSON array stored as string)."""
-        import json
         topics_str = self.metadata.get("topics", "[]")
         if isinstance(topics_str, list):
             return topics_str
@@ -29,6 +29,7 @@ from knowledge_base.core.qa import (
     generate_quick_answer,
     search_with_expansion,
 )
+from knowledge_base.rag.factory import run_with_shared_client
 from knowledge_base.search.models import SearchResult
 from knowledge_base.slack.modals import (
     build_incorrect_feedback_modal,
@@ -283,7 +284,7 @@ def create_app() -> App:
         """Handle @mentions of the bot."""
         if _is_duplicate_event(event):
             return
-        asyncio.run(_handle_question(event, say, client))
+        run_with_shared_client(_handle_question(event, say, client))
 
     @app.event("message")
     def handle_dm(event: dict, say: Any, client: WebClient) -> None:
@@ -292,18 +293,18 @@ def create_app() -> App:
         if event.get("channel_type") == "im" and not event.get("bot_id"):
             if _is_duplicate_event(event):
                 return
-            asyncio.run(_handle_question(event, say, client))
+            run_with_shared_client(_handle_question(event, say, client))
 
     @app.action(re.compile(r"feedback_(helpful|outdated|incorrect|confusing)_.*"))
     def handle_feedback(ack: Any, body: dict, client: WebClient) -> None:
         """Handle feedback button clicks."""
         ack()
-        asyncio.run(_handle_feedback_action(body, client))
+        run_with_shared_client(_handle_feedback_action(body, client))
 
     @app.event("reaction_added")
     def handle_reaction(event: dict, client: WebClient) -> None:
         """Handle emoji reactions for behavioral signals (Phase 10.5)."""
-        asyncio.run(_handle_reaction_event(event, client))
+        run_with_shared_client(_handle_reaction_event(event, client))
 
     @app.event("message")
     def handle_thread_message(event: dict, say: Any, client: WebClient) -> None:
@@ -328,7 +329,7 @@ def create_app() -> App:
             return
 
         # Process for behavioral signals
-        asyncio.run(_handle_thread_message_event(event))
+        run_with_shared_client(_handle_thread_message_event(event))
 
     return app
 
@@ -31,6 +31,18 @@ from knowledge_base.slack.modals import (
 
 logger = logging.getLogger(__name__)
 
+# Action ID patterns, compiled once at import so registration stays cheap
+_APPROVE_DOC_RE = re.compile(r"approve_doc_.*")
+_REJECT_DOC_RE = re.compile(r"reject_doc_.*")
+_SUBMIT_DOC_RE = re.compile(r"submit_doc_.*")
+_VIEW_DOC_RE = re.compile(r"view_doc_.*")
+_EDIT_DOC_RE = re.compile(r"edit_doc_.*")
+
+
+def _selected_value(values: dict, block_id: str, action_id: str) -> str:
+    """Return the value of a static_select element from modal state values."""
+    return values[block_id][action_id]["selected_option"]["value"]
+
 
 async def _get_document_creator(slack_client=None) -> DocumentCreator:
     """Get a DocumentCreator instance with database session.
@@ -122,12 +134,10 @@ async def handle_create_doc_submit(
     try:
         # Extract form values
         title = values["title_block"]["title_input"]["value"]
-        area = values["area_block"]["area_select"]["selected_option"]["value"]
-        doc_type = values["type_block"]["type_select"]["selected_option"]["value"]
-        classification = values["classification_block"]["classification_select"][
-            "selected_option"
-        ]["value"]
-        mode = values["mode_block"]["mode_select"]["selected_option"]["value"]
+        area = _selected_value(values, "area_block", "area_select")
+        doc_type = _selected_value(values, "type_block", "type_select")
+        classification = _selected_value(values, "classification_block", "classification_select")
+        mode = _selected_value(values, "mode_block", "mode_select")
         description = values["description_block"]["description_input"]["value"]
 
         await init_db()
@@ -232,11 +242,9 @@ async def handle_thread_to_doc_submit(
             return
 
         # Extract form values
-        area = values["area_block"]["area_select"]["selected_option"]["value"]
-        doc_type = values["type_block"]["type_select"]["selected_option"]["value"]
-        classification = values["classification_block"]["classification_select"][
-            "selected_option"
-        ]["value"]
+        area = _selected_value(values, "area_block", "area_select")
+        doc_type = _selected_value(values, "type_block", "type_select")
+        classification = _selected_value(values, "classification_block", "classification_select")
 
         # Fetch thread messages
         result = await client.conversations_replies(channel=channel_id, ts=thread_ts)
@@ -504,8 +512,8 @@ def register_doc_handlers(app) -> None:
     app.view("rejection_reason_modal")(handle_rejection_submit)
 
     # Action Handlers
-    app.action(re.compile(r"approve_doc_.*"))(handle_approve_doc)
-    app.action(re.compile(r"reject_doc_.*"))(handle_reject_doc)
-    app.action(re.compile(r"submit_doc_.*"))(handle_submit_for_approval)
-    app.action(re.compile(r"view_doc_.*"))(handle_view_doc)
-    app.action(re.compile(r"edit_doc_.*"))(handle_edit_doc)
+    app.action(_APPROVE_DOC_RE)(handle_approve_doc)
+    app.action(_REJECT_DOC_RE)(handle_reject_doc)
+    app.action(_SUBMIT_DOC_RE)(handle_submit_for_approval)
+    app.action(_VIEW_DOC_RE)(handle_view_doc)
+    app.action(_EDIT_DOC_RE)(handle_edit_doc)
@@ -1,6 +1,7 @@
 """Embeddings providers for vector indexing."""
 
 import asyncio
+import functools
 import logging
 from abc import ABC, abstractmethod
 from typing import Callable
@@ -22,11 +23,18 @@ logger = logging.getLogger(__name__)
 _EMBEDDING_REGISTRY: dict[str, Callable[[], "BaseEmbeddings"]] = {}
 
 
+@functools.lru_cache(maxsize=8)
+def _build_embeddings(provider_name: str) -> "BaseEmbeddings":
+    """Build one shared instance per provider, so models and clients load once."""
+    return _EMBEDDING_REGISTRY[provider_name]()
+
+
 def register_embedding_provider(name: str):
     """Decorator to register an embedding provider factory."""
 
     def decorator(factory: Callable[[], "BaseEmbeddings"]):
         _EMBEDDING_REGISTRY[name.lower()] = factory
+        _build_embeddings.cache_clear()
         return factory
 
     return decorator
@@ -128,6 +136,17 @@ class SentenceTransformerEmbeddings(BaseEmbeddings):
         embeddings = self._model.encode(texts, convert_to_numpy=True)
         return embeddings.tolist()
 
+    async def embed_single(self, text: str) -> list[float]:
+        """Generate embedding for a single text.
+
+        Encodes the bare string so the model returns one 1-D vector, skipping
+        the one-element batch round trip of the base implementation.
+        """
+        self._load_model()
+
+        embedding = self._model.encode(text, convert_to_numpy=True)
+        return embedding.tolist()
+
 
 class OllamaEmbeddings(BaseEmbeddings):
     """Embeddings using Ollama (requires Ollama server)."""
@@ -334,7 +353,7 @@ def get_available_embedding_providers() -> list[str]:
 
 
 def get_embeddings(provider: str | None = None) -> BaseEmbeddings:
-    """Get an embeddings instance.
+    """Get the shared embeddings instance for a provider.
 
     Args:
         provider: Provider name (defaults to settings.EMBEDDING_PROVIDER)
@@ -353,4 +372,4 @@ def get_embeddings(provider: str | None = None) -> BaseEmbeddings:
             f"Unknown embedding provider '{provider_name}'. Available: {available}"
         )
 
-    return _EMBEDDING_REGISTRY[provider_name]()
+    return _build_embeddings(provider_name)
@@ -1,13 +1,18 @@
 """Streamlit Web UI for the Knowledge Base."""
 
 import asyncio
+import hmac
 import json
 import requests
+import threading
+import time
 from datetime import datetime
 from pathlib import Path
 
+import orjson
 import streamlit as st
-from sqlalchemy import create_engine, func, select
+from requests.adapters import HTTPAdapter
+from sqlalchemy import create_engine, func, or_, select
 from sqlalchemy.orm import sessionmaker
 
 from knowledge_base.config import settings
@@ -43,117 +48,149 @@ SessionLocal = sessionmaker(bind=engine)
 
 
 def get_session():
-    """Get a database session."""
+    """Get a database session; use it as a context manager so it is always closed."""
     return SessionLocal()
 
 
+# Admin credentials, snapshotted once for constant-time comparison
+_ADMIN_USER = settings.ADMIN_USERNAME.encode()
+_ADMIN_PASS = settings.ADMIN_PASSWORD.encode()
+
+
 def check_auth(username: str, password: str) -> bool:
     """Verify admin credentials."""
-    return (
-        username == settings.ADMIN_USERNAME
-        and password == settings.ADMIN_PASSWORD
+    # Bitwise & so both digests are always compared (no short-circuit timing leak)
+    return hmac.compare_digest(username.encode(), _ADMIN_USER) & hmac.compare_digest(
+        password.encode(), _ADMIN_PASS
     )
 
 
+# Seconds a database size reading is reused across Streamlit reruns
+DB_SIZE_TTL_SECONDS = 5
+
+
+@st.cache_data(ttl=DB_SIZE_TTL_SECONDS)
 def get_db_size() -> str:
-    """Get the database file size."""
+    """Get the database file size, cached for DB_SIZE_TTL_SECONDS."""
     db_path = Path("knowledge_base.db")
     if db_path.exists():
-        size = db_path.stat().st_size
-        if size < 1024:
-            return f"{size} B"
-        elif size < 1024 * 1024:
-            return f"{size / 1024:.1f} KB"
-        else:
-            return f"{size / (1024 * 1024):.1f} MB"
+        return _format_size(db_path.stat().st_size)
     return "N/A"
 
 
+# (unit, power-of-two shift), indexed by bit_length // 10
+_SIZE_UNITS = (("B", 0), ("KB", 10), ("MB", 20), ("GB", 30))
+
+
+def _format_size(size: int) -> str:
+    """Format a byte count with a table lookup instead of a comparison ladder."""
+    unit, shift = _SIZE_UNITS[min(len(_SIZE_UNITS) - 1, max(0, size.bit_length() - 1) // 10)]
+    if not shift:
+        return f"{size} B"
+    return f"{size / (1 << shift):.1f} {unit}"
+
+
+def _count_subquery(column, *criteria):
+    """Scalar COUNT(column) subquery, so several counts share one SELECT."""
+    return select(func.count(column)).where(*criteria).scalar_subquery()
+
+
 def get_admin_stats() -> dict:
     """Get statistics for the admin dashboard."""
-    session = get_session()
-    try:
-        total_pages = session.execute(select(func.count(RawPage.id))).scalar() or 0
-        active_pages = (
-            session.execute(
-                select(func.count(RawPage.id)).where(RawPage.status == "active")
-            ).scalar()
-            or 0
-        )
-        total_chunks = session.execute(select(func.count(Chunk.id))).scalar() or 0
-        total_docs = session.execute(select(func.count(Document.id))).scalar() or 0
-        published_docs = (
-            session.execute(
-                select(func.count(Document.id)).where(Document.status == "published")
-            ).scalar()
-            or 0
-        )
-        draft_docs = (
-            session.execute(
-                select(func.count(Document.id)).where(Document.status == "draft")
-            ).scalar()
-            or 0
-        )
-        open_issues = (
-            session.execute(
-                select(func.count(GovernanceIssue.id)).where(
-                    GovernanceIssue.status == "open"
-                )
-            ).scalar()
-            or 0
-        )
-        gap_count = (
-            session.execute(
-                select(func.count(DocumentationGap.id)).where(
-                    DocumentationGap.status == "open"
-                )
-            ).scalar()
-            or 0
-        )
-        last_sync = session.execute(
-            select(RawPage.downloaded_at).order_by(RawPage.downloaded_at.desc()).limit(1)
-        ).scalar()
+    with get_session() as session:
+        # One round trip for every counter instead of a query per figure
+        (
+            total_pages,
+            active_pages,
+            total_chunks,
+            total_docs,
+            published_docs,
+            draft_docs,
+            open_issues,
+            gap_count,
+            last_sync,
+        ) = session.execute(
+            select(
+                _count_subquery(RawPage.id),
+                _count_subquery(RawPage.id, RawPage.status == "active"),
+                _count_subquery(Chunk.id),
+                _count_subquery(Document.id),
+                _count_subquery(Document.id, Document.status == "published"),
+                _count_subquery(Document.id, Document.status == "draft"),
+                _count_subquery(GovernanceIssue.id, GovernanceIssue.status == "open"),
+                _count_subquery(DocumentationGap.id, DocumentationGap.status == "open"),
+                select(func.max(RawPage.downloaded_at)).scalar_subquery(),
+            )
+        ).one()
 
         return {
-            "total_pages": total_pages,
-            "active_pages": active_pages,
-            "total_chunks": total_chunks,
-            "total_documents": total_docs,
-            "published_documents": published_docs,
-            "draft_documents": draft_docs,
-            "open_issues": open_issues,
-            "documentation_gaps": gap_count,
+            "total_pages": total_pages or 0,
+            "active_pages": active_pages or 0,
+            "total_chunks": total_chunks or 0,
+            "total_documents": total_docs or 0,
+            "published_documents": published_docs or 0,
+            "draft_documents": draft_docs or 0,
+            "open_issues": open_issues or 0,
+            "documentation_gaps": gap_count or 0,
             "last_sync": last_sync.isoformat() if last_sync else "Never",
             "database_size": get_db_size(),
         }
-    finally:
-        session.close()
 
 
+# Seconds governance dashboard data is reused across Streamlit reruns
+GOVERNANCE_CACHE_TTL_SECONDS = 30
+
+
+@st.cache_data(ttl=GOVERNANCE_CACHE_TTL_SECONDS)
 def get_governance_data() -> dict:
-    """Get data for the governance dashboard."""
-    session = get_session()
-    try:
+    """Get data for the governance dashboard, cached for GOVERNANCE_CACHE_TTL_SECONDS."""
+    with get_session() as session:
+        # Fresh installs have nothing to show; one EXISTS probe skips four queries
+        has_data = session.execute(
+            select(
+                or_(
+                    select(GovernanceIssue.id).where(GovernanceIssue.status == "open").exists(),
+                    select(DocumentationGap.id).where(DocumentationGap.status == "open").exists(),
+                    select(RawPage.id).exists(),
+                )
+            )
+        ).scalar()
+        if not has_data:
+            return {"recent_issues": [], "gaps": [], "stale_pages": [], "space_stats": []}
+
+        # Plain dicts of the rendered columns: cache_data pickles its value, and
+        # detached ORM instances would fail on any attribute that was not loaded
         recent_issues = session.execute(
-            select(GovernanceIssue)
+            select(
+                GovernanceIssue.issue_type,
+                GovernanceIssue.severity,
+                GovernanceIssue.page_id,
+                GovernanceIssue.description,
+                GovernanceIssue.detected_at,
+            )
             .where(GovernanceIssue.status == "open")
             .order_by(GovernanceIssue.detected_at.desc())
             .limit(10)
-        ).scalars().all()
+        ).mappings().all()
 
         gaps = session.execute(
-            select(DocumentationGap)
+            select(
+                DocumentationGap.topic,
+                DocumentationGap.query_count,
+                DocumentationGap.suggested_title,
+                DocumentationGap.sample_queries,
+            )
             .where(DocumentationGap.status == "open")
             .order_by(DocumentationGap.query_count.desc())
             .limit(10)
-        ).scalars().all()
+        ).mappings().all()
 
         stale_pages = session.execute(
-            select(RawPage)
+            select(RawPage.title, RawPage.space_key, RawPage.updated_at, RawPage.staleness_reason)
             .where(RawPage.is_potentially_stale == True)  # noqa: E712
             .order_by(RawPage.updated_at.asc())
             .limit(10)
-        ).scalars().all()
+        ).mappings().all()
 
         space_stats = session.execute(
             select(RawPage.space_key, func.count(RawPage.id).label("count"))
@@ -161,29 +198,97 @@ def get_governance_data() -> dict:
         ).all()
 
         return {
-            "recent_issues": recent_issues,
-            "gaps": gaps,
-            "stale_pages": stale_pages,
-            "space_stats": space_stats,
+            "recent_issues": [dict(row) for row in recent_issues],
+            "gaps": [dict(row) for row in gaps],
+            "stale_pages": [dict(row) for row in stale_pages],
+            "space_stats": [tuple(row) for row in space_stats],
         }
-    finally:
-        session.close()
+
+
+@st.cache_resource
+def _http_session() -> requests.Session:
+    """Keep-alive HTTP session for API calls, built once and shared across reruns."""
+    session = requests.Session()
+    session.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
+    session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
+    return session
+
+
+# Successful search responses are reused for identical queries across reruns
+SEARCH_CACHE_TTL_SECONDS = 60
+SEARCH_CACHE_MAX_ENTRIES = 256
+
+# After a connection failure, skip connecting again for this long
+SEARCH_OUTAGE_BACKOFF_SECONDS = 10
+_SEARCH_CONNECT_ERROR = "Cannot connect to API. Is the server running?"
+
+
+class _SearchAPIError(Exception):
+    """Non-200 search response; raised so st.cache_data does not cache it."""
+
+
+class _SearchOutageError(_SearchAPIError):
+    """Raised instead of connecting while a recent connection failure is remembered."""
+
+
+class _SearchOutage:
+    """Deadline before which search calls skip connecting, shared by all sessions."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._until = 0.0
+
+    def active(self) -> bool:
+        with self._lock:
+            return time.monotonic() < self._until
+
+    def record(self) -> None:
+        with self._lock:
+            self._until = time.monotonic() + SEARCH_OUTAGE_BACKOFF_SECONDS
+
+    def reset(self) -> None:
+        with self._lock:
+            self._until = 0.0
+
+
+@st.cache_resource
+def _search_outage() -> _SearchOutage:
+    """Outage state held outside the script, so it survives reruns."""
+    return _SearchOutage()
+
+
+@st.cache_data(ttl=SEARCH_CACHE_TTL_SECONDS, max_entries=SEARCH_CACHE_MAX_ENTRIES)
+def _search(query: str, top_k: int) -> dict:
+    """POST a search to the API and return the decoded response."""
+    # Checked here rather than in search_api so cached responses are still served
+    if _search_outage().active():
+        raise _SearchOutageError(_SEARCH_CONNECT_ERROR)
+
+    response = _http_session().post(
+        "http://localhost:8000/api/v1/search",
+        json={"query": query, "top_k": top_k},
+        timeout=30,
+    )
+    if response.status_code != 200:
+        raise _SearchAPIError(f"API returned status {response.status_code}")
+    return orjson.loads(response.content)
+
+
+def clear_search_cache() -> None:
+    """Drop all cached search responses and any remembered outage."""
+    _search.clear()
+    _search_outage().reset()
 
 
 def search_api(query: str, top_k: int = 5) -> dict:
-    """Call the search API."""
+    """Call the search API, caching successful responses for SEARCH_CACHE_TTL_SECONDS."""
     try:
-        response = requests.post(
-            "http://localhost:8000/api/v1/search",
-            json={"query": query, "top_k": top_k},
-            timeout=30,
-        )
-        if response.status_code == 200:
-            return response.json()
-        else:
-            return {"error": f"API returned status {response.status_code}"}
+        return _search(query, top_k)
+    except _SearchAPIError as e:
+        return {"error": str(e)}
     except requests.exceptions.ConnectionError:
-        return {"error": "Cannot connect to API. Is the server running?"}
+        _search_outage().record()
+        return {"error": _SEARCH_CONNECT_ERROR}
     except Exception as e:
         return {"error": str(e)}
 
@@ -200,8 +305,7 @@ def get_documents(
     limit: int = 50,
 ) -> list[Document]:
     """Get documents with optional filtering."""
-    session = get_session()
-    try:
+    with get_session() as session:
         stmt = select(Document)
         if status and status != "All":
             stmt = stmt.where(Document.status == status)
@@ -212,25 +316,19 @@ def get_documents(
         stmt = stmt.order_by(Document.created_at.desc()).limit(limit)
         result = session.execute(stmt)
         return list(result.scalars().all())
-    finally:
-        session.close()
 
 
 def get_document_by_id(doc_id: str) -> Document | None:
     """Get a document by ID."""
-    session = get_session()
-    try:
+    with get_session() as session:
         stmt = select(Document).where(Document.doc_id == doc_id)
         result = session.execute(stmt)
         return result.scalars().first()
-    finally:
-        session.close()
 
 
 def get_pending_approvals(approver_id: str) -> list[Document]:
     """Get documents pending approval by a specific user."""
-    session = get_session()
-    try:
+    with get_session() as session:
         stmt = select(Document).where(Document.status == DocumentStatus.IN_REVIEW.value)
         result = session.execute(stmt)
         documents = result.scalars().all()
@@ -241,8 +339,6 @@ def get_pending_approvals(approver_id: str) -> list[Document]:
             if approver_id in pending_approvers:
                 pending.append(doc)
         return pending
-    finally:
-        session.close()
 
 
 def get_document_creator():
@@ -253,11 +349,16 @@ def get_document_creator():
     session = get_session()
     config = ApprovalConfig(require_all_approvers=False)
 
-    # Try to get LLM
+    # Try to get LLM. Resolved outside any event loop, it borrows the loop-less
+    # shared HTTP client, which safe_async_call() closes after the creator's call
     llm = None
     try:
-        from knowledge_base.rag.factory import get_llm as get_llm_async
-        llm = asyncio.run(get_llm_async())
+        from knowledge_base.rag.factory import get_provider
+
+        if settings.LLM_PROVIDER:
+            llm = get_provider(settings.LLM_PROVIDER)
+            if not asyncio.run(llm.is_available()):
+                llm = None
     except Exception:
         pass
 
@@ -278,9 +379,11 @@ def status_badge(status: str) -> str:
 
 
 def safe_async_call(coro, error_message: str = "Operation failed"):
-    """Safely execute an async coroutine."""
+    """Safely execute an async coroutine, closing shared LLM connections afterwards."""
+    from knowledge_base.rag.factory import run_with_shared_client
+
     try:
-        return asyncio.run(coro)
+        return run_with_shared_client(coro)
     except Exception as e:
         st.error(f"{error_message}: {e}")
         return None
@@ -692,13 +795,10 @@ elif page == "📄 Documents":
             st.caption("Documents awaiting your approval")
 
             # Get all documents in review
-            session = get_session()
-            try:
+            with get_session() as session:
                 stmt = select(Document).where(Document.status == DocumentStatus.IN_REVIEW.value)
                 result = session.execute(stmt)
                 pending_docs = list(result.scalars().all())
-            finally:
-                session.close()
 
             if not pending_docs:
                 st.success("No documents pending approval!")
@@ -893,7 +993,7 @@ elif page == "📋 Governance":
             if data["space_stats"]:
                 import pandas as pd
                 df = pd.DataFrame(
-                    [(s[0], s[1]) for s in data["space_stats"]],
+                    data["space_stats"],
                     columns=["Space", "Pages"],
                 )
                 st.dataframe(df, use_container_width=True, hide_index=True)
@@ -904,20 +1004,20 @@ elif page == "📋 Governance":
         with tab2:
             if data["gaps"]:
                 for gap in data["gaps"]:
-                    with st.expander(f"**{gap.topic}** ({gap.query_count} queries)"):
-                        st.markdown(f"**Suggested Title:** {gap.suggested_title or 'N/A'}")
-                        if gap.sample_queries:
+                    with st.expander(f"**{gap['topic']}** ({gap['query_count']} queries)"):
+                        st.markdown(f"**Suggested Title:** {gap['suggested_title'] or 'N/A'}")
+                        if gap["sample_queries"]:
                             st.markdown("**Sample Queries:**")
-                            st.code(gap.sample_queries)
+                            st.code(gap["sample_queries"])
             else:
                 st.success("No documentation gaps detected!")
 
         with tab3:
             if data["stale_pages"]:
                 for page in data["stale_pages"]:
-                    with st.expander(f"**{page.title}** ({page.space_key})"):
-                        st.markdown(f"**Last Updated:** {page.updated_at}")
-                        st.markdown(f"**Reason:** {page.staleness_reason or 'Age'}")
+                    with st.expander(f"**{page['title']}** ({page['space_key']})"):
+                        st.markdown(f"**Last Updated:** {page['updated_at']}")
+                        st.markdown(f"**Reason:** {page['staleness_reason'] or 'Age'}")
             else:
                 st.success("No stale pages detected!")
 
@@ -928,13 +1028,13 @@ elif page == "📋 Governance":
                         "high": "🔴",
                         "medium": "🟡",
                         "low": "🟢",
-                    }.get(issue.severity, "⚪")
+                    }.get(issue["severity"], "⚪")
 
-                    with st.expander(f"{severity_color} **{issue.issue_type}** - {issue.description[:50]}..."):
-                        st.markdown(f"**Severity:** {issue.severity}")
-                        st.markdown(f"**Page ID:** {issue.page_id}")
-                        st.markdown(f"**Description:** {issue.description}")
-                        st.markdown(f"**Detected:** {issue.detected_at}")
+                    with st.expander(f"{severity_color} **{issue['issue_type']}** - {issue['description'][:50]}..."):
+                        st.markdown(f"**Severity:** {issue['severity']}")
+                        st.markdown(f"**Page ID:** {issue['page_id']}")
+                        st.markdown(f"**Description:** {issue['description']}")
+                        st.markdown(f"**Detected:** {issue['detected_at']}")
             else:
                 st.success("No open issues!")
 
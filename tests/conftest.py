@@ -0,0 +1,181 @@
+"""Shared fixtures for unit tests."""
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, NonCallableMock
+
+from sqlalchemy import create_engine
+from sqlalchemy.pool import StaticPool
+
+from knowledge_base.db.models import Base
+from knowledge_base.documents.models import DocumentArea, DocumentDraft, DocumentType
+from knowledge_base.graph.models import ExtractedEntities
+
+
+@pytest.fixture(scope="module")
+def mock_llm():
+    """Create a mock LLM shared by the module (reset after each test).
+
+    Specced to ``generate`` only, so no other child mocks are auto-created.
+    """
+    llm = MagicMock(spec=["generate"])
+    llm.generate = AsyncMock(return_value="Generated content here")
+    return llm
+
+
+class _FakeLLM:
+    """Plain async stand-in for an LLM's ``generate_json``, configured by attribute.
+
+    Returns queued ``responses`` first, then ``response``; raises ``error`` if
+    set. Prompts are recorded in ``calls``.
+    """
+
+    def __init__(self):
+        self.response = {}
+        self.responses = []
+        self.error = None
+        self.calls = []
+
+    async def generate_json(self, prompt, **kwargs):
+        self.calls.append(prompt)
+        if self.error is not None:
+            raise self.error
+        if self.responses:
+            return self.responses.pop(0)
+        return self.response
+
+
+@pytest.fixture
+def fake_llm():
+    """A fresh _FakeLLM; cheaper than building MagicMock/AsyncMock per test."""
+    return _FakeLLM()
+
+
+@pytest.fixture(scope="module")
+def mock_session():
+    """Create a mock database session shared by the module (reset after each test)."""
+    session = MagicMock()
+    session.execute = MagicMock()
+    session.add = MagicMock()
+    session.commit = MagicMock()
+    return session
+
+
+@pytest.fixture(scope="session")
+def db_engine():
+    """In-memory SQLite engine with the full schema, for tests that need a real session.
+
+    StaticPool rather than NullPool: every new ``:memory:`` connection is a
+    fresh empty database, so the engine must keep reusing the one connection.
+    """
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture(scope="session")
+def _generate_mock_cache():
+    """Pre-built ``generate`` AsyncMocks keyed by their configured outcome."""
+    return {}
+
+
+@pytest.fixture
+def llm_generates(mock_llm, _generate_mock_cache):
+    """Point ``mock_llm.generate`` at a cached AsyncMock for this test.
+
+    Usage: ``llm_generates("response text")`` or ``llm_generates(error=Exception("boom"))``.
+    The mock is built once per distinct outcome and its call history is
+    cleared before reuse; the autouse reset restores the default afterwards.
+    """
+
+    def configure(response=None, *, error=None):
+        key = (response, type(error), str(error) if error else None)
+        generate = _generate_mock_cache.get(key)
+        if generate is None:
+            if error is not None:
+                generate = AsyncMock(side_effect=error)
+            else:
+                generate = AsyncMock(return_value=response)
+            _generate_mock_cache[key] = generate
+        generate.reset_mock()
+        mock_llm.generate = generate
+        return generate
+
+    return configure
+
+
+@pytest.fixture(autouse=True)
+def _reset_shared_mocks(request):
+    """Isolate tests that share the module-scoped mock_llm / mock_session.
+
+    Restores a ``generate`` mock the test replaced and clears recorded calls
+    and configured return values, so ``assert_called_once()`` stays reliable.
+    """
+    llm = request.getfixturevalue("mock_llm") if "mock_llm" in request.fixturenames else None
+    session = (
+        request.getfixturevalue("mock_session") if "mock_session" in request.fixturenames else None
+    )
+    generate = getattr(llm, "generate", None)
+
+    yield
+
+    if isinstance(generate, NonCallableMock):
+        llm.generate = generate
+        generate.reset_mock()
+    if isinstance(session, NonCallableMock):
+        session.reset_mock(return_value=True, side_effect=True)
+
+
+@pytest.fixture
+def session_returns(mock_session):
+    """Configure what ``mock_session.execute(...).scalars()`` yields.
+
+    Usage: ``session_returns(all_=[doc])`` or ``session_returns(first=None)``.
+    """
+    _unset = object()
+
+    def configure(*, all_=_unset, first=_unset):
+        result = MagicMock()
+        scalars = result.scalars.return_value
+        if all_ is not _unset:
+            scalars.all.return_value = all_
+        if first is not _unset:
+            scalars.first.return_value = first
+        mock_session.execute.return_value = result
+        return mock_session
+
+    return configure
+
+
+@pytest.fixture(scope="session")
+def draft_proto():
+    """A prototype DocumentDraft; ``copy.deepcopy`` it in tests that mutate it."""
+    return DocumentDraft(
+        title="Test",
+        content="Original content",
+        area=DocumentArea.GENERAL,
+        doc_type=DocumentType.INFORMATION,
+    )
+
+
+@pytest.fixture(scope="session")
+def sample_entities():
+    """Baseline ExtractedEntities covering every entity type; treat as read-only."""
+    return ExtractedEntities(
+        people=["Alice", "Bob"],
+        teams=["Engineering"],
+        products=["Snowflake"],
+        locations=["Prague"],
+    )
+
+
+@pytest.fixture(scope="session")
+def app():
+    """The FastAPI app, imported once per session for every API test module."""
+    from knowledge_base.main import app
+
+    return app
@@ -193,8 +193,8 @@ class TestUserLinkManager:
         mock_link.confluence_account_id = "conf456"
         mock_link.confluence_email = "test@example.com"
         mock_link.is_active = True
-        mock_link.linked_at = datetime.utcnow()
-        mock_link.last_used_at = datetime.utcnow()
+        mock_link.linked_at = datetime(2024, 1, 1, 12, 0, 0)
+        mock_link.last_used_at = datetime(2024, 1, 1, 12, 0, 0)
         mock_session.execute.return_value.scalar_one_or_none.return_value = mock_link
 
         manager = UserLinkManager(mock_session)
@@ -12,6 +12,9 @@ from knowledge_base.confluence.models import (
     Permission,
 )
 
+# Arbitrary fixed timestamp; the models only store it
+_NOW = datetime(2024, 1, 1, 12, 0, 0)
+
 
 class TestGovernanceInfo:
     """Tests for GovernanceInfo extraction from labels."""
@@ -128,8 +131,8 @@ class TestPage:
             space_key="TEST",
             url="https://example.com/page/123",
             status="current",
-            created_at=datetime.utcnow(),
-            updated_at=datetime.utcnow(),
+            created_at=_NOW,
+            updated_at=_NOW,
             author="john.doe",
         )
         assert page.id == "page-123"
@@ -151,8 +154,8 @@ class TestPageContent:
             author="john.doe",
             author_name="John Doe",
             parent_id=None,
-            created_at=datetime.utcnow(),
-            updated_at=datetime.utcnow(),
+            created_at=_NOW,
+            updated_at=_NOW,
             version_number=5,
             status="current",
         )
@@ -5,8 +5,11 @@ in GraphitiRetriever.search_chunks() and _lookup_episodes().
 """
 
 import pytest
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 
+from neo4j.exceptions import ServiceUnavailable, SessionExpired
+
 from knowledge_base.graph.graphiti_retriever import (
     _is_connection_error,
     GraphitiRetriever,
@@ -37,23 +40,16 @@ class TestIsConnectionError:
         exc = ConnectionRefusedError("Connection refused")
         assert _is_connection_error(exc) is True
 
-    def test_service_unavailable(self):
-        """neo4j.exceptions.ServiceUnavailable is a connection error."""
-        try:
-            from neo4j.exceptions import ServiceUnavailable
-            exc = ServiceUnavailable("Server unavailable")
-            assert _is_connection_error(exc) is True
-        except ImportError:
-            pytest.skip("neo4j package not installed")
-
-    def test_session_expired(self):
-        """neo4j.exceptions.SessionExpired is a connection error."""
-        try:
-            from neo4j.exceptions import SessionExpired
-            exc = SessionExpired("Session expired")
-            assert _is_connection_error(exc) is True
-        except ImportError:
-            pytest.skip("neo4j package not installed")
+    @pytest.mark.parametrize(
+        "exc",
+        [
+            ServiceUnavailable("Server unavailable"),
+            SessionExpired("Session expired"),
+        ],
+    )
+    def test_neo4j_driver_errors(self, exc):
+        """neo4j ServiceUnavailable and SessionExpired are connection errors."""
+        assert _is_connection_error(exc) is True
 
     def test_value_error_not_connection(self):
         """ValueError is NOT a connection error."""
@@ -198,17 +194,17 @@ class TestLookupEpisodesRetry:
     @pytest.mark.asyncio
     async def test_retries_on_connection_error(self, retriever):
         """_lookup_episodes retries on connection error."""
-        mock_driver = MagicMock()
         mock_record = {"uuid": "abc-123", "name": "test", "content": "hello", "source_desc": None}
-        mock_driver.execute_query = AsyncMock(
-            side_effect=[
-                RuntimeError("unable to perform operation on <TCPTransport closed=True>"),
-                ([mock_record], None, None),
-            ]
+        mock_driver = SimpleNamespace(
+            execute_query=AsyncMock(
+                side_effect=[
+                    RuntimeError("unable to perform operation on <TCPTransport closed=True>"),
+                    ([mock_record], None, None),
+                ]
+            )
         )
 
-        mock_graphiti = MagicMock()
-        mock_graphiti.driver = mock_driver
+        mock_graphiti = SimpleNamespace(driver=mock_driver)
         retriever._graphiti = mock_graphiti
         retriever._get_graphiti = AsyncMock(return_value=mock_graphiti)
 
@@ -220,11 +216,9 @@ class TestLookupEpisodesRetry:
     @pytest.mark.asyncio
     async def test_no_retry_on_regular_error(self, retriever):
         """_lookup_episodes does NOT retry on non-connection errors."""
-        mock_driver = MagicMock()
-        mock_driver.execute_query = AsyncMock(side_effect=ValueError("bad query"))
+        mock_driver = SimpleNamespace(execute_query=AsyncMock(side_effect=ValueError("bad query")))
 
-        mock_graphiti = MagicMock()
-        mock_graphiti.driver = mock_driver
+        mock_graphiti = SimpleNamespace(driver=mock_driver)
         retriever._graphiti = mock_graphiti
         retriever._get_graphiti = AsyncMock(return_value=mock_graphiti)
 
@@ -3,6 +3,7 @@
 import inspect
 import json
 import re
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -23,46 +24,76 @@ from knowledge_base.slack.doc_creation import (
 )
 
 
+def _action_body(action_id, *, trigger_id=None, include_channel=True, include_user=True):
+    """Build a Slack block-action body for the document button handlers."""
+    body = {"actions": [{"action_id": action_id}]}
+    if include_user:
+        body["user"] = {"id": "U123"}
+    if include_channel:
+        body["channel"] = {"id": "C123"}
+    if trigger_id:
+        body["trigger_id"] = trigger_id
+    return body
+
+
+def _selected(value):
+    return {"selected_option": {"value": value}}
+
+
+def _create_doc_view(
+    *,
+    title="Test",
+    area="general",
+    doc_type="information",
+    classification="internal",
+    mode="manual",
+    description="content",
+):
+    """Build a create_doc_modal submission view with the given field values."""
+    return {
+        "state": {
+            "values": {
+                "title_block": {"title_input": {"value": title}},
+                "area_block": {"area_select": _selected(area)},
+                "type_block": {"type_select": _selected(doc_type)},
+                "classification_block": {"classification_select": _selected(classification)},
+                "mode_block": {"mode_select": _selected(mode)},
+                "description_block": {"description_input": {"value": description}},
+            }
+        }
+    }
+
+
 # =============================================================================
 # All handlers must be async coroutines
 # =============================================================================
 
 
-class TestHandlersAreAsync:
-    """Verify all handlers are async — required for Slack Bolt AsyncApp."""
-
-    def test_handle_create_doc_command_is_async(self):
-        assert inspect.iscoroutinefunction(handle_create_doc_command)
-
-    def test_handle_save_as_doc_is_async(self):
-        assert inspect.iscoroutinefunction(handle_save_as_doc)
-
-    def test_handle_create_doc_submit_is_async(self):
-        assert inspect.iscoroutinefunction(handle_create_doc_submit)
-
-    def test_handle_thread_to_doc_submit_is_async(self):
-        assert inspect.iscoroutinefunction(handle_thread_to_doc_submit)
+# Evaluated once at import rather than introspecting inside every test
+_ASYNC_HANDLERS = {
+    handler.__name__: inspect.iscoroutinefunction(handler)
+    for handler in (
+        handle_create_doc_command,
+        handle_save_as_doc,
+        handle_create_doc_submit,
+        handle_thread_to_doc_submit,
+        handle_rejection_submit,
+        handle_approve_doc,
+        handle_reject_doc,
+        handle_submit_for_approval,
+        handle_view_doc,
+        handle_edit_doc,
+        _get_document_creator,
+    )
+}
 
-    def test_handle_rejection_submit_is_async(self):
-        assert inspect.iscoroutinefunction(handle_rejection_submit)
 
-    def test_handle_approve_doc_is_async(self):
-        assert inspect.iscoroutinefunction(handle_approve_doc)
-
-    def test_handle_reject_doc_is_async(self):
-        assert inspect.iscoroutinefunction(handle_reject_doc)
-
-    def test_handle_submit_for_approval_is_async(self):
-        assert inspect.iscoroutinefunction(handle_submit_for_approval)
-
-    def test_handle_view_doc_is_async(self):
-        assert inspect.iscoroutinefunction(handle_view_doc)
-
-    def test_handle_edit_doc_is_async(self):
-        assert inspect.iscoroutinefunction(handle_edit_doc)
+class TestHandlersAreAsync:
+    """Verify all handlers are async — required for Slack Bolt AsyncApp."""
 
-    def test_get_document_creator_is_async(self):
-        assert inspect.iscoroutinefunction(_get_document_creator)
+    @pytest.mark.parametrize("name", list(_ASYNC_HANDLERS))
+    def test_handler_is_async(self, name):
+        assert _ASYNC_HANDLERS[name], f"{name} must be a coroutine function"
 
 
 # =============================================================================
@@ -123,11 +154,7 @@ class TestEditDoc:
     async def test_acks_and_sends_ephemeral(self):
         ack = AsyncMock()
         client = AsyncMock()
-        body = {
-            "user": {"id": "U123"},
-            "actions": [{"action_id": "edit_doc_DOC001"}],
-            "channel": {"id": "C123"},
-        }
+        body = _action_body("edit_doc_DOC001")
 
         await handle_edit_doc(ack=ack, body=body, client=client)
 
@@ -148,23 +175,20 @@ class TestApproveDoc:
     async def test_acks_and_processes_approval(self, mock_creator_fn, mock_init_db):
         mock_creator = MagicMock()
         mock_creator.approval.process_decision = AsyncMock(
-            return_value=MagicMock(status="approved")
+            return_value=SimpleNamespace(status="approved")
         )
         mock_creator_fn.return_value = mock_creator
 
         ack = AsyncMock()
         client = AsyncMock()
-        body = {
-            "user": {"id": "U123"},
-            "actions": [{"action_id": "approve_doc_DOC001"}],
-            "channel": {"id": "C123"},
-        }
+        body = _action_body("approve_doc_DOC001")
 
         await handle_approve_doc(ack=ack, body=body, client=client)
 
         ack.assert_awaited_once()
         mock_init_db.assert_awaited_once()
         client.chat_postEphemeral.assert_awaited_once()
+        assert "approved" in client.chat_postEphemeral.call_args[1]["text"]
 
 
 @pytest.mark.asyncio
@@ -174,18 +198,16 @@ class TestRejectDoc:
     @patch("knowledge_base.slack.doc_creation.init_db", new_callable=AsyncMock)
     @patch("knowledge_base.slack.doc_creation._get_document_creator")
     async def test_acks_and_opens_rejection_modal(self, mock_creator_fn, mock_init_db):
-        mock_doc = MagicMock()
-        mock_doc.title = "Test Document"
+        mock_doc = SimpleNamespace(title="Test Document")
         mock_creator = MagicMock()
         mock_creator.get_document.return_value = mock_doc
         mock_creator_fn.return_value = mock_creator
 
         ack = AsyncMock()
         client = AsyncMock()
-        body = {
-            "actions": [{"action_id": "reject_doc_DOC001"}],
-            "trigger_id": "T789",
-        }
+        body = _action_body(
+            "reject_doc_DOC001", trigger_id="T789", include_channel=False, include_user=False
+        )
 
         await handle_reject_doc(ack=ack, body=body, client=client)
 
@@ -193,7 +215,6 @@ class TestRejectDoc:
         client.views_open.assert_awaited_once()
 
 
-@pytest.mark.asyncio
 class TestRegisterDocHandlers:
     """Tests for handler registration."""
 
@@ -221,6 +242,20 @@ class TestRegisterDocHandlers:
         # Action handlers (5 regex patterns)
         assert app.action.call_count == 5
 
+    def test_action_patterns_are_precompiled(self):
+        """Registration reuses module-level patterns instead of recompiling."""
+        app = MagicMock()
+
+        with patch("knowledge_base.config.settings") as mock_settings:
+            mock_settings.SLACK_COMMAND_PREFIX = ""
+            register_doc_handlers(app)
+            register_doc_handlers(app)
+
+        patterns = [call[0][0] for call in app.action.call_args_list]
+        assert all(isinstance(p, re.Pattern) for p in patterns)
+        assert all(first is second for first, second in zip(patterns[:5], patterns[5:]))
+        assert patterns[0].match("approve_doc_DOC001")
+
 
 @pytest.mark.asyncio
 class TestCreateDocSubmit:
@@ -229,12 +264,13 @@ class TestCreateDocSubmit:
     @patch("knowledge_base.slack.doc_creation.init_db", new_callable=AsyncMock)
     @patch("knowledge_base.slack.doc_creation._get_document_creator")
     async def test_manual_mode_creates_document(self, mock_creator_fn, mock_init_db):
-        mock_doc = MagicMock()
-        mock_doc.doc_id = "DOC001"
-        mock_doc.title = "Test Doc"
-        mock_doc.status = "draft"
-        mock_doc.doc_type = "information"
-        mock_doc.area = "engineering"
+        mock_doc = SimpleNamespace(
+            doc_id="DOC001",
+            title="Test Doc",
+            status="draft",
+            doc_type="information",
+            area="engineering",
+        )
 
         mock_creator = MagicMock()
         mock_creator.create_manual = AsyncMock(return_value=mock_doc)
@@ -243,25 +279,18 @@ class TestCreateDocSubmit:
         ack = AsyncMock()
         client = AsyncMock()
         body = {"user": {"id": "U123"}}
-        view = {
-            "state": {
-                "values": {
-                    "title_block": {"title_input": {"value": "Test Doc"}},
-                    "area_block": {"area_select": {"selected_option": {"value": "engineering"}}},
-                    "type_block": {"type_select": {"selected_option": {"value": "information"}}},
-                    "classification_block": {
-                        "classification_select": {"selected_option": {"value": "internal"}}
-                    },
-                    "mode_block": {"mode_select": {"selected_option": {"value": "manual"}}},
-                    "description_block": {"description_input": {"value": "Test content"}},
-                }
-            }
-        }
+        view = _create_doc_view(
+            title="Test Doc", area="engineering", description="Test content"
+        )
 
         await handle_create_doc_submit(ack=ack, body=body, client=client, view=view)
 
         ack.assert_awaited_once()
         mock_creator.create_manual.assert_awaited_once()
+        call_kwargs = mock_creator.create_manual.call_args[1]
+        assert call_kwargs["area"] == "engineering"
+        assert call_kwargs["doc_type"] == "information"
+        assert call_kwargs["classification"] == "internal"
         client.chat_postMessage.assert_awaited_once()
 
     @patch("knowledge_base.slack.doc_creation.init_db", new_callable=AsyncMock)
@@ -274,20 +303,7 @@ class TestCreateDocSubmit:
         ack = AsyncMock()
         client = AsyncMock()
         body = {"user": {"id": "U123"}}
-        view = {
-            "state": {
-                "values": {
-                    "title_block": {"title_input": {"value": "Test"}},
-                    "area_block": {"area_select": {"selected_option": {"value": "general"}}},
-                    "type_block": {"type_select": {"selected_option": {"value": "information"}}},
-                    "classification_block": {
-                        "classification_select": {"selected_option": {"value": "internal"}}
-                    },
-                    "mode_block": {"mode_select": {"selected_option": {"value": "manual"}}},
-                    "description_block": {"description_input": {"value": "content"}},
-                }
-            }
-        }
+        view = _create_doc_view()
 
         await handle_create_doc_submit(ack=ack, body=body, client=client, view=view)
 
@@ -1,8 +1,9 @@
 """Tests for the document creation module."""
 
+import asyncio
+
 import pytest
-from unittest.mock import AsyncMock, MagicMock, patch
-from datetime import datetime
+from types import SimpleNamespace
 
 from knowledge_base.documents.models import (
     APPROVAL_REQUIRED,
@@ -25,6 +26,32 @@ from knowledge_base.documents.approval import (
 from knowledge_base.documents.creator import DocumentCreator
 
 
+# =============================================================================
+# Shared Mock Helpers
+# =============================================================================
+
+
+_PENDING_APPROVERS_JSON = '["U123ABC"]'
+
+_SUGGESTIONS_TEXT = """Main content here.
+
+## Suggestions
+- Add more examples
+- Clarify the scope
+"""
+
+_TITLE_TEXT = """# My Document Title
+
+This is the content.
+"""
+
+# Read-only Slack thread shared by the thread-based tests (deepcopy before mutating)
+_THREAD_MESSAGES = [
+    {"user": "U123", "text": "How do I reset my password?"},
+    {"user": "U456", "text": "Go to settings, then security..."},
+]
+
+
 # =============================================================================
 # Model Tests
 # =============================================================================
@@ -33,81 +60,104 @@ from knowledge_base.documents.creator import DocumentCreator
 class TestDocumentArea:
     """Tests for DocumentArea enum."""
 
-    def test_values(self):
+    @pytest.mark.parametrize(
+        "member,value",
+        [
+            (DocumentArea.PEOPLE, "people"),
+            (DocumentArea.FINANCE, "finance"),
+            (DocumentArea.ENGINEERING, "engineering"),
+            (DocumentArea.OPERATIONS, "operations"),
+            (DocumentArea.GENERAL, "general"),
+        ],
+    )
+    def test_values(self, member, value):
         """Test all area values exist."""
-        assert DocumentArea.PEOPLE.value == "people"
-        assert DocumentArea.FINANCE.value == "finance"
-        assert DocumentArea.ENGINEERING.value == "engineering"
-        assert DocumentArea.OPERATIONS.value == "operations"
-        assert DocumentArea.GENERAL.value == "general"
-
-    def test_string_conversion(self):
-        """Test string conversion via value."""
-        assert DocumentArea.PEOPLE.value == "people"
+        assert member.value == value
 
 
 class TestDocumentType:
     """Tests for DocumentType enum."""
 
-    def test_values(self):
+    @pytest.mark.parametrize(
+        "member,value",
+        [
+            (DocumentType.POLICY, "policy"),
+            (DocumentType.PROCEDURE, "procedure"),
+            (DocumentType.GUIDELINE, "guideline"),
+            (DocumentType.INFORMATION, "information"),
+        ],
+    )
+    def test_values(self, member, value):
         """Test all type values exist."""
-        assert DocumentType.POLICY.value == "policy"
-        assert DocumentType.PROCEDURE.value == "procedure"
-        assert DocumentType.GUIDELINE.value == "guideline"
-        assert DocumentType.INFORMATION.value == "information"
+        assert member.value == value
 
 
 class TestClassification:
     """Tests for Classification enum."""
 
-    def test_values(self):
+    @pytest.mark.parametrize(
+        "member,value",
+        [
+            (Classification.PUBLIC, "public"),
+            (Classification.INTERNAL, "internal"),
+            (Classification.CONFIDENTIAL, "confidential"),
+        ],
+    )
+    def test_values(self, member, value):
         """Test all classification values exist."""
-        assert Classification.PUBLIC.value == "public"
-        assert Classification.INTERNAL.value == "internal"
-        assert Classification.CONFIDENTIAL.value == "confidential"
+        assert member.value == value
 
 
 class TestDocumentStatus:
     """Tests for DocumentStatus enum."""
 
-    def test_values(self):
+    @pytest.mark.parametrize(
+        "member,value",
+        [
+            (DocumentStatus.DRAFT, "draft"),
+            (DocumentStatus.IN_REVIEW, "in_review"),
+            (DocumentStatus.APPROVED, "approved"),
+            (DocumentStatus.PUBLISHED, "published"),
+            (DocumentStatus.REJECTED, "rejected"),
+            (DocumentStatus.ARCHIVED, "archived"),
+        ],
+    )
+    def test_values(self, member, value):
         """Test all status values exist."""
-        assert DocumentStatus.DRAFT.value == "draft"
-        assert DocumentStatus.IN_REVIEW.value == "in_review"
-        assert DocumentStatus.APPROVED.value == "approved"
-        assert DocumentStatus.PUBLISHED.value == "published"
-        assert DocumentStatus.REJECTED.value == "rejected"
-        assert DocumentStatus.ARCHIVED.value == "archived"
+        assert member.value == value
 
 
 class TestSourceType:
     """Tests for SourceType enum."""
 
-    def test_values(self):
+    @pytest.mark.parametrize(
+        "member,value",
+        [
+            (SourceType.MANUAL, "manual"),
+            (SourceType.THREAD_SUMMARY, "thread_summary"),
+            (SourceType.AI_DRAFT, "ai_draft"),
+        ],
+    )
+    def test_values(self, member, value):
         """Test all source type values exist."""
-        assert SourceType.MANUAL.value == "manual"
-        assert SourceType.THREAD_SUMMARY.value == "thread_summary"
-        assert SourceType.AI_DRAFT.value == "ai_draft"
+        assert member.value == value
 
 
 class TestApprovalRequired:
     """Tests for APPROVAL_REQUIRED dict."""
 
-    def test_policy_requires_approval(self):
-        """Test policy requires approval."""
-        assert APPROVAL_REQUIRED[DocumentType.POLICY] is True
-
-    def test_procedure_requires_approval(self):
-        """Test procedure requires approval."""
-        assert APPROVAL_REQUIRED[DocumentType.PROCEDURE] is True
-
-    def test_guideline_no_approval(self):
-        """Test guideline doesn't require approval."""
-        assert APPROVAL_REQUIRED[DocumentType.GUIDELINE] is False
-
-    def test_information_no_approval(self):
-        """Test information doesn't require approval."""
-        assert APPROVAL_REQUIRED[DocumentType.INFORMATION] is False
+    @pytest.mark.parametrize(
+        "doc_type,expected",
+        [
+            (DocumentType.POLICY, True),
+            (DocumentType.PROCEDURE, True),
+            (DocumentType.GUIDELINE, False),
+            (DocumentType.INFORMATION, False),
+        ],
+    )
+    def test_approval_required(self, doc_type, expected):
+        """Test policies and procedures require approval, others don't."""
+        assert APPROVAL_REQUIRED[doc_type] is expected
 
 
 class TestRequiresApproval:
@@ -131,31 +181,38 @@ class TestRequiresApproval:
 class TestDocumentDraft:
     """Tests for DocumentDraft dataclass."""
 
-    def test_creation_with_enums(self):
-        """Test creating draft with enum values."""
+    @pytest.mark.parametrize(
+        "area,doc_type,classification",
+        [
+            (DocumentArea.FINANCE, DocumentType.PROCEDURE, Classification.CONFIDENTIAL),
+            ("finance", "procedure", "confidential"),
+        ],
+        ids=["enums", "strings"],
+    )
+    def test_creation_normalizes_enums(self, area, doc_type, classification):
+        """Test enum and string inputs are both normalized to enum members."""
+        draft = DocumentDraft(
+            title="Test",
+            content="Content",
+            area=area,
+            doc_type=doc_type,
+            classification=classification,
+        )
+        assert draft.title == "Test"
+        assert draft.area is DocumentArea.FINANCE
+        assert draft.doc_type is DocumentType.PROCEDURE
+        assert draft.classification is Classification.CONFIDENTIAL
+
+    def test_default_classification(self):
+        """Test classification defaults to internal."""
         draft = DocumentDraft(
             title="Test Policy",
             content="This is test content",
             area=DocumentArea.ENGINEERING,
             doc_type=DocumentType.POLICY,
         )
-        assert draft.title == "Test Policy"
-        assert draft.area == DocumentArea.ENGINEERING
         assert draft.classification == Classification.INTERNAL
 
-    def test_creation_with_strings(self):
-        """Test creating draft with string values (auto-converted)."""
-        draft = DocumentDraft(
-            title="Test",
-            content="Content",
-            area="finance",
-            doc_type="procedure",
-            classification="confidential",
-        )
-        assert draft.area == DocumentArea.FINANCE
-        assert draft.doc_type == DocumentType.PROCEDURE
-        assert draft.classification == Classification.CONFIDENTIAL
-
     def test_source_fields(self):
         """Test source tracking fields."""
         draft = DocumentDraft(
@@ -220,20 +277,14 @@ class TestApprovalDecision:
 # =============================================================================
 
 
-class TestAIDrafter:
-    """Tests for AIDrafter class."""
+@pytest.fixture(scope="module")
+def drafter(mock_llm):
+    """Create a drafter with mock LLM."""
+    return AIDrafter(mock_llm)
 
-    @pytest.fixture
-    def mock_llm(self):
-        """Create a mock LLM."""
-        llm = MagicMock()
-        llm.generate = AsyncMock(return_value="Generated content here")
-        return llm
 
-    @pytest.fixture
-    def drafter(self, mock_llm):
-        """Create a drafter with mock LLM."""
-        return AIDrafter(mock_llm)
+class TestAIDrafter:
+    """Tests for AIDrafter class."""
 
     @pytest.mark.asyncio
     async def test_draft_from_description(self, drafter, mock_llm):
@@ -268,19 +319,12 @@ class TestAIDrafter:
         assert result.draft.classification == Classification.CONFIDENTIAL
 
     @pytest.mark.asyncio
-    async def test_draft_from_thread(self, drafter, mock_llm):
+    async def test_draft_from_thread(self, drafter, llm_generates):
         """Test drafting from a Slack thread."""
-        mock_llm.generate = AsyncMock(
-            return_value="# How to Reset Password\n\nStep 1: Go to settings..."
-        )
-
-        messages = [
-            {"user": "U123", "text": "How do I reset my password?"},
-            {"user": "U456", "text": "Go to settings, then security..."},
-        ]
+        llm_generates("# How to Reset Password\n\nStep 1: Go to settings...")
 
         result = await drafter.draft_from_thread(
-            thread_messages=messages,
+            thread_messages=_THREAD_MESSAGES,
             channel_id="C123ABC",
             thread_ts="1234567890.123456",
             area=DocumentArea.OPERATIONS,
@@ -292,34 +336,23 @@ class TestAIDrafter:
         assert result.confidence == 0.7
 
     @pytest.mark.asyncio
-    async def test_improve_draft(self, drafter, mock_llm):
+    async def test_improve_draft(self, drafter, draft_proto, llm_generates):
         """Test improving a draft with feedback."""
-        mock_llm.generate = AsyncMock(return_value="Improved content here")
-
-        original = DocumentDraft(
-            title="Test Doc",
-            content="Original content",
-            area=DocumentArea.GENERAL,
-            doc_type=DocumentType.INFORMATION,
-        )
+        llm_generates("Improved content here")
 
         result = await drafter.improve_draft(
-            draft=original,
+            draft=draft_proto,
             feedback="Add more details about X",
         )
 
         assert result.draft.content == "Improved content here"
+        assert result.draft.title == draft_proto.title
+        assert draft_proto.content == "Original content"  # Original left untouched
         assert result.confidence == 0.85
 
     def test_extract_suggestions(self, drafter):
         """Test extracting suggestions from content."""
-        content = """Main content here.
-
-## Suggestions
-- Add more examples
-- Clarify the scope
-"""
-        main, suggestions = drafter._extract_suggestions(content)
+        main, suggestions = drafter._extract_suggestions(_SUGGESTIONS_TEXT)
 
         assert "Main content here" in main
         assert len(suggestions) == 2
@@ -327,25 +360,17 @@ class TestAIDrafter:
 
     def test_extract_title_content(self, drafter):
         """Test extracting title and content."""
-        text = """# My Document Title
-
-This is the content.
-"""
-        title, content = drafter._extract_title_content(text)
+        title, content = drafter._extract_title_content(_TITLE_TEXT)
 
         assert title == "My Document Title"
         assert "This is the content" in content
 
     def test_format_thread(self, drafter):
         """Test formatting Slack thread messages."""
-        messages = [
-            {"user": "U123", "text": "Hello"},
-            {"user": "U456", "text": "Hi there"},
-        ]
-        formatted = drafter._format_thread(messages)
+        formatted = drafter._format_thread(_THREAD_MESSAGES)
 
-        assert "[U123]: Hello" in formatted
-        assert "[U456]: Hi there" in formatted
+        assert "[U123]: How do I reset my password?" in formatted
+        assert "[U456]: Go to settings, then security..." in formatted
 
 
 # =============================================================================
@@ -356,64 +381,54 @@ This is the content.
 class TestApprovalConfig:
     """Tests for ApprovalConfig dataclass."""
 
-    def test_defaults(self):
-        """Test default configuration."""
-        config = ApprovalConfig()
-        assert config.require_all_approvers is False
-        assert config.auto_approve_updates is False
-        assert config.expiry_days == 14
-
-    def test_custom(self):
-        """Test custom configuration."""
-        config = ApprovalConfig(
-            require_all_approvers=True,
-            expiry_days=7,
-        )
-        assert config.require_all_approvers is True
-        assert config.expiry_days == 7
+    @pytest.mark.parametrize(
+        "kwargs,expected",
+        [
+            (
+                {},
+                {"require_all_approvers": False, "auto_approve_updates": False, "expiry_days": 14},
+            ),
+            (
+                {"require_all_approvers": True, "expiry_days": 7},
+                {"require_all_approvers": True, "expiry_days": 7},
+            ),
+        ],
+        ids=["defaults", "custom"],
+    )
+    def test_config(self, kwargs, expected):
+        """Test default and custom configuration."""
+        config = ApprovalConfig(**kwargs)
+        for name, value in expected.items():
+            assert getattr(config, name) == value
 
 
 class TestApprovalStatus:
     """Tests for ApprovalStatus dataclass."""
 
-    def test_pending_status(self):
-        """Test pending approval status."""
-        status = ApprovalStatus(
-            doc_id="doc123",
-            status="pending",
-            pending_approvers=["U123", "U456"],
-        )
-        assert status.status == "pending"
-        assert len(status.pending_approvers) == 2
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"status": "pending", "pending_approvers": ["U123", "U456"]},
+            {"status": "rejected", "rejected_by": "U789", "rejection_reason": "Incomplete"},
+        ],
+        ids=["pending", "rejected"],
+    )
+    def test_status(self, kwargs):
+        """Test pending and rejected approval statuses."""
+        status = ApprovalStatus(doc_id="doc123", **kwargs)
+        for name, value in kwargs.items():
+            assert getattr(status, name) == value
 
-    def test_rejected_status(self):
-        """Test rejected approval status."""
-        status = ApprovalStatus(
-            doc_id="doc123",
-            status="rejected",
-            rejected_by="U789",
-            rejection_reason="Incomplete",
-        )
-        assert status.rejected_by == "U789"
+
+@pytest.fixture(scope="module")
+def workflow(mock_session):
+    """Create a workflow with mock session."""
+    return ApprovalWorkflow(mock_session)
 
 
 class TestApprovalWorkflow:
     """Tests for ApprovalWorkflow class."""
 
-    @pytest.fixture
-    def mock_session(self):
-        """Create a mock database session."""
-        session = MagicMock()
-        session.execute = MagicMock()
-        session.add = MagicMock()
-        session.commit = MagicMock()
-        return session
-
-    @pytest.fixture
-    def workflow(self, mock_session):
-        """Create a workflow with mock session."""
-        return ApprovalWorkflow(mock_session)
-
     def test_needs_approval_policy(self, workflow):
         """Test policy needs approval."""
         assert workflow.needs_approval(DocumentType.POLICY) is True
@@ -426,20 +441,17 @@ class TestApprovalWorkflow:
         """Test with string value."""
         assert workflow.needs_approval("procedure") is True
 
-    def test_get_approvers_empty(self, workflow, mock_session):
+    def test_get_approvers_empty(self, workflow, session_returns):
         """Test getting approvers when none exist."""
-        mock_session.execute.return_value.scalars.return_value.all.return_value = []
+        session_returns(all_=[])
 
         approvers = workflow.get_approvers(DocumentArea.ENGINEERING)
         assert approvers == []
 
-    def test_get_approvers(self, workflow, mock_session):
+    def test_get_approvers(self, workflow, session_returns):
         """Test getting approvers."""
-        mock_approver = MagicMock()
-        mock_approver.approver_slack_id = "U123ABC"
-        mock_session.execute.return_value.scalars.return_value.all.return_value = [
-            mock_approver
-        ]
+        mock_approver = SimpleNamespace(approver_slack_id="U123ABC")
+        session_returns(all_=[mock_approver])
 
         approvers = workflow.get_approvers(DocumentArea.ENGINEERING)
         assert approvers == ["U123ABC"]
@@ -455,22 +467,20 @@ class TestApprovalWorkflow:
         mock_session.add.assert_called_once()
         mock_session.commit.assert_called_once()
 
-    def test_get_approval_status_not_found(self, workflow, mock_session):
+    def test_get_approval_status_not_found(self, workflow, session_returns):
         """Test getting status for non-existent document."""
-        mock_session.execute.return_value.scalars.return_value.first.return_value = None
+        session_returns(first=None)
 
         status = workflow.get_approval_status("nonexistent")
         assert status is None
 
-    def test_get_pending_approvals(self, workflow, mock_session):
+    def test_get_pending_approvals(self, workflow, session_returns):
         """Test getting pending approvals for a user."""
-        import json
-        mock_doc = MagicMock()
-        mock_doc.status = "in_review"
-        mock_doc.pending_approvers = json.dumps(["U123ABC"])  # JSON string
-        mock_session.execute.return_value.scalars.return_value.all.return_value = [
-            mock_doc
-        ]
+        mock_doc = SimpleNamespace(
+            status="in_review",
+            pending_approvers=_PENDING_APPROVERS_JSON,  # JSON string
+        )
+        session_returns(all_=[mock_doc])
 
         pending = workflow.get_pending_approvals("U123ABC")
         assert len(pending) == 1
@@ -481,64 +491,44 @@ class TestApprovalWorkflow:
 # =============================================================================
 
 
+@pytest.fixture(scope="module")
+def creator(mock_session, mock_llm):
+    """Create a DocumentCreator with mocks."""
+    return DocumentCreator(mock_session, mock_llm)
+
+
+@pytest.fixture(scope="module")
+def creator_no_llm(mock_session):
+    """Create a DocumentCreator without LLM."""
+    return DocumentCreator(mock_session)
+
+
 class TestDocumentCreator:
     """Tests for DocumentCreator class."""
 
-    @pytest.fixture
-    def mock_session(self):
-        """Create a mock database session."""
-        session = MagicMock()
-        session.execute = MagicMock()
-        session.add = MagicMock()
-        session.commit = MagicMock()
-        return session
-
-    @pytest.fixture
-    def mock_llm(self):
-        """Create a mock LLM."""
-        llm = MagicMock()
-        llm.generate = AsyncMock(return_value="Generated content")
-        return llm
-
-    @pytest.fixture
-    def creator(self, mock_session, mock_llm):
-        """Create a DocumentCreator with mocks."""
-        return DocumentCreator(mock_session, mock_llm)
-
-    @pytest.fixture
-    def creator_no_llm(self, mock_session):
-        """Create a DocumentCreator without LLM."""
-        return DocumentCreator(mock_session)
-
+    @pytest.mark.parametrize(
+        "doc_type,expected_status",
+        [
+            (DocumentType.INFORMATION, "published"),  # Information auto-publishes
+            (DocumentType.POLICY, "draft"),  # Policies wait for approval
+        ],
+    )
     @pytest.mark.asyncio
-    async def test_create_manual(self, creator, mock_session):
+    async def test_create_manual(self, creator, mock_session, doc_type, expected_status):
         """Test creating a document manually."""
         doc = await creator.create_manual(
             title="Manual Doc",
             content="Some content",
             area=DocumentArea.GENERAL,
-            doc_type=DocumentType.INFORMATION,
+            doc_type=doc_type,
             created_by="U123ABC",
         )
 
         assert doc.title == "Manual Doc"
-        assert doc.status == "published"  # Information auto-publishes
+        assert doc.status == expected_status
         mock_session.add.assert_called_once()
         mock_session.commit.assert_called_once()
 
-    @pytest.mark.asyncio
-    async def test_create_manual_policy(self, creator, mock_session):
-        """Test creating a policy manually (stays draft)."""
-        doc = await creator.create_manual(
-            title="New Policy",
-            content="Policy content",
-            area=DocumentArea.FINANCE,
-            doc_type=DocumentType.POLICY,
-            created_by="U123ABC",
-        )
-
-        assert doc.status == "draft"
-
     @pytest.mark.asyncio
     async def test_create_from_description(self, creator, mock_llm):
         """Test creating from description with AI."""
@@ -554,32 +544,26 @@ class TestDocumentCreator:
         assert draft_result is not None
         assert draft_result.confidence > 0
 
-    @pytest.mark.asyncio
-    async def test_create_from_description_no_llm(self, creator_no_llm):
+    def test_create_from_description_no_llm(self, creator_no_llm):
         """Test create_from_description without LLM raises error."""
         with pytest.raises(ValueError, match="LLM not configured"):
-            await creator_no_llm.create_from_description(
-                title="Test",
-                description="Test",
-                area=DocumentArea.GENERAL,
-                doc_type=DocumentType.INFORMATION,
-                created_by="U123",
+            asyncio.run(
+                creator_no_llm.create_from_description(
+                    title="Test",
+                    description="Test",
+                    area=DocumentArea.GENERAL,
+                    doc_type=DocumentType.INFORMATION,
+                    created_by="U123",
+                )
             )
 
     @pytest.mark.asyncio
-    async def test_create_from_thread(self, creator, mock_llm):
+    async def test_create_from_thread(self, creator, llm_generates):
         """Test creating from Slack thread."""
-        mock_llm.generate = AsyncMock(
-            return_value="# Thread Summary\n\nContent from thread..."
-        )
-
-        messages = [
-            {"user": "U123", "text": "Question here"},
-            {"user": "U456", "text": "Answer here"},
-        ]
+        llm_generates("# Thread Summary\n\nContent from thread...")
 
         doc, draft_result = await creator.create_from_thread(
-            thread_messages=messages,
+            thread_messages=_THREAD_MESSAGES,
             channel_id="C123",
             thread_ts="1234567890.123456",
             area=DocumentArea.OPERATIONS,
@@ -589,58 +573,48 @@ class TestDocumentCreator:
         assert doc.source_thread_ts == "1234567890.123456"
         assert draft_result.draft.source_type == SourceType.THREAD_SUMMARY
 
-    def test_get_document(self, creator, mock_session):
+    def test_get_document(self, creator, session_returns):
         """Test getting a document by ID."""
-        mock_doc = MagicMock()
-        mock_doc.id = "doc123"
-        mock_session.execute.return_value.scalars.return_value.first.return_value = (
-            mock_doc
-        )
+        mock_doc = SimpleNamespace(id="doc123")
+        session_returns(first=mock_doc)
 
         doc = creator.get_document("doc123")
         assert doc.id == "doc123"
 
-    def test_get_document_not_found(self, creator, mock_session):
+    def test_get_document_not_found(self, creator, session_returns):
         """Test getting non-existent document."""
-        mock_session.execute.return_value.scalars.return_value.first.return_value = None
+        session_returns(first=None)
 
         doc = creator.get_document("nonexistent")
         assert doc is None
 
-    def test_list_documents(self, creator, mock_session):
+    def test_list_documents(self, creator, session_returns):
         """Test listing documents."""
-        mock_docs = [MagicMock(), MagicMock()]
-        mock_session.execute.return_value.scalars.return_value.all.return_value = (
-            mock_docs
-        )
+        mock_docs = [SimpleNamespace(), SimpleNamespace()]
+        session_returns(all_=mock_docs)
 
         docs = creator.list_documents(area=DocumentArea.ENGINEERING)
         assert len(docs) == 2
 
-    def test_search_documents(self, creator, mock_session):
+    def test_search_documents(self, creator, session_returns):
         """Test searching documents."""
-        mock_docs = [MagicMock()]
-        mock_session.execute.return_value.scalars.return_value.all.return_value = (
-            mock_docs
-        )
+        mock_docs = [SimpleNamespace()]
+        session_returns(all_=mock_docs)
 
         docs = creator.search_documents("VPN")
         assert len(docs) == 1
 
-    @pytest.mark.asyncio
-    async def test_archive_document(self, creator, mock_session):
+    def test_archive_document(self, creator, session_returns):
         """Test archiving a document."""
-        mock_doc = MagicMock()
-        mock_doc.id = "doc123"
-        mock_doc.status = "published"
-        mock_session.execute.return_value.scalars.return_value.first.return_value = (
-            mock_doc
-        )
-
-        doc = await creator.archive_document(
-            doc_id="doc123",
-            archived_by="U123ABC",
-            reason="Outdated",
+        mock_doc = SimpleNamespace(id="doc123", status="published", archive_reason=None)
+        session_returns(first=mock_doc)
+
+        doc = asyncio.run(
+            creator.archive_document(
+                doc_id="doc123",
+                archived_by="U123ABC",
+                reason="Outdated",
+            )
         )
 
         assert doc.status == "archived"
@@ -655,62 +629,13 @@ class TestDocumentCreator:
 class TestDraftResult:
     """Tests for DraftResult dataclass."""
 
-    def test_creation(self):
+    def test_creation(self, draft_proto):
         """Test creating a draft result."""
-        draft = DocumentDraft(
-            title="Test",
-            content="Content",
-            area=DocumentArea.GENERAL,
-            doc_type=DocumentType.INFORMATION,
-        )
         result = DraftResult(
-            draft=draft,
+            draft=draft_proto,
             confidence=0.85,
             suggestions=["Add more details"],
         )
 
         assert result.confidence == 0.85
         assert len(result.suggestions) == 1
-
-
-class TestDocumentLifecycle:
-    """Test the full document lifecycle."""
-
-    @pytest.fixture
-    def mock_session(self):
-        """Create a mock database session."""
-        session = MagicMock()
-        session.execute = MagicMock()
-        session.add = MagicMock()
-        session.commit = MagicMock()
-        return session
-
-    @pytest.mark.asyncio
-    async def test_information_doc_auto_publishes(self, mock_session):
-        """Test that information docs are auto-published."""
-        creator = DocumentCreator(mock_session)
-
-        doc = await creator.create_manual(
-            title="FAQ",
-            content="Questions and answers",
-            area=DocumentArea.GENERAL,
-            doc_type=DocumentType.INFORMATION,
-            created_by="U123",
-        )
-
-        assert doc.status == "published"
-
-    @pytest.mark.asyncio
-    async def test_policy_stays_draft(self, mock_session):
-        """Test that policies stay in draft."""
-        creator = DocumentCreator(mock_session)
-
-        doc = await creator.create_manual(
-            title="Security Policy",
-            content="Policy content",
-            area=DocumentArea.ENGINEERING,
-            doc_type=DocumentType.POLICY,
-            created_by="U123",
-        )
-
-        assert doc.status == "draft"
@@ -0,0 +1,119 @@
+"""Tests for the LLM-as-judge evaluation module."""
+
+import pytest
+from unittest.mock import MagicMock
+
+from knowledge_base.evaluation.llm_judge import (
+    LLMJudge,
+    EvaluationScores,
+)
+
+_LONG_DOC = "x" * 5000
+
+
+class TestEvaluationScores:
+    """Tests for EvaluationScores dataclass."""
+
+    def test_overall_calculation(self):
+        """Test overall score is average of three metrics."""
+        scores = EvaluationScores(
+            groundedness=0.9,
+            relevance=0.8,
+            completeness=0.7,
+        )
+        assert scores.overall == pytest.approx(0.8, 0.01)
+
+    def test_all_perfect(self):
+        """Test overall score when all metrics are 1.0."""
+        scores = EvaluationScores(
+            groundedness=1.0,
+            relevance=1.0,
+            completeness=1.0,
+        )
+        assert scores.overall == 1.0
+
+    def test_all_zero(self):
+        """Test overall score when all metrics are 0.0."""
+        scores = EvaluationScores(
+            groundedness=0.0,
+            relevance=0.0,
+            completeness=0.0,
+        )
+        assert scores.overall == 0.0
+
+
+class TestLLMJudge:
+    """Tests for LLMJudge."""
+
+    @pytest.mark.asyncio
+    async def test_evaluate_returns_scores(self, mock_llm, llm_generates):
+        """Test evaluate returns EvaluationScores."""
+        llm_generates("0.85")
+        judge = LLMJudge(mock_llm)
+
+        scores = await judge.evaluate(
+            query="What is X?",
+            answer="X is a thing.",
+            documents=["Document about X."],
+        )
+
+        assert isinstance(scores, EvaluationScores)
+        assert scores.groundedness == 0.85
+        assert 0.0 <= scores.groundedness <= 1.0
+        assert 0.0 <= scores.relevance <= 1.0
+        assert 0.0 <= scores.completeness <= 1.0
+
+    @pytest.mark.asyncio
+    async def test_empty_inputs_return_zero(self, mock_llm):
+        """Test empty documents or answers short-circuit to 0 without the LLM."""
+        judge = LLMJudge(mock_llm)
+
+        assert await judge.evaluate_groundedness("answer", []) == 0.0
+        assert await judge.evaluate_relevance("query", []) == 0.0
+        assert await judge.evaluate_completeness("query", "") == 0.0
+        mock_llm.generate.assert_not_called()
+
+    @pytest.mark.parametrize(
+        "response,expected",
+        [
+            ("0.85", 0.85),
+            ("0.5", 0.5),
+            ("1.0", 1.0),
+            ("The score is 0.75", 0.75),
+            ("Score: 0.9", 0.9),
+            ("1.5", 1.0),  # Clamped to maximum
+            ("2.0", 1.0),
+            # Negative numbers aren't matched by the regex, so default is returned
+            ("-0.5", 0.5),
+        ],
+    )
+    def test_parse_score(self, response, expected):
+        """Test parsing scores from LLM responses, clamped to [0, 1]."""
+        judge = LLMJudge(MagicMock())
+        assert judge._parse_score(response) == expected
+
+    def test_format_docs_truncates(self, mock_llm):
+        """Test document formatting truncates long content."""
+        judge = LLMJudge(mock_llm)
+        formatted = judge._format_docs([_LONG_DOC], max_length=1000)
+        assert len(formatted) <= 1100  # Some buffer for formatting
+
+    def test_format_docs_multiple(self, mock_llm):
+        """Test formatting multiple documents."""
+        judge = LLMJudge(mock_llm)
+        docs = ["Doc 1 content", "Doc 2 content", "Doc 3 content"]
+        formatted = judge._format_docs(docs)
+
+        assert "[Document 1]" in formatted
+        assert "[Document 2]" in formatted
+        assert "[Document 3]" in formatted
+
+    @pytest.mark.asyncio
+    async def test_handles_llm_error(self, mock_llm, llm_generates):
+        """Test graceful handling of LLM errors."""
+        llm_generates(error=Exception("LLM error"))
+        judge = LLMJudge(mock_llm)
+
+        score = await judge.evaluate_groundedness("answer", ["doc"])
+        # Should return default score
+        assert score == 0.5
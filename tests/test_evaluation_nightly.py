@@ -0,0 +1,133 @@
+"""Tests for the nightly evaluation module."""
+
+import pytest
+from datetime import datetime
+
+from knowledge_base.evaluation.nightly_eval import (
+    NightlyEvaluator,
+    DailyReportData,
+    EvalResultData,
+)
+
+# Fixed report date keeps tests deterministic
+_NOW = datetime(2024, 1, 1)
+
+
+class TestEvalResultData:
+    """Tests for EvalResultData dataclass."""
+
+    def test_creation(self):
+        """Test creating EvalResultData."""
+        result = EvalResultData(
+            query_id="q123",
+            groundedness=0.9,
+            relevance=0.8,
+            completeness=0.7,
+            overall=0.8,
+        )
+        assert result.query_id == "q123"
+        assert result.overall == 0.8
+
+
+class TestDailyReportData:
+    """Tests for DailyReportData dataclass."""
+
+    def test_creation(self):
+        """Test creating DailyReportData."""
+        report = DailyReportData(
+            report_date=_NOW,
+            sample_size=10,
+            total_queries=100,
+            avg_groundedness=0.85,
+            avg_relevance=0.80,
+            avg_completeness=0.75,
+            avg_overall=0.80,
+        )
+        assert report.sample_size == 10
+        assert report.avg_overall == 0.80
+
+    def test_below_threshold_default_empty(self):
+        """Test below_threshold defaults to empty list."""
+        report = DailyReportData(
+            report_date=_NOW,
+            sample_size=0,
+            total_queries=0,
+            avg_groundedness=0.0,
+            avg_relevance=0.0,
+            avg_completeness=0.0,
+            avg_overall=0.0,
+        )
+        assert report.below_threshold == []
+
+
+class TestNightlyEvaluator:
+    """Tests for NightlyEvaluator."""
+
+    @pytest.mark.parametrize(
+        "sample_size,total_queries,overall,expected",
+        [
+            (10, 100, 0.5, True),  # Low overall score
+            (10, 100, 0.9, False),  # High overall score
+            (0, 0, 0.0, False),  # Empty sample never alerts
+        ],
+        ids=["low_overall", "high_overall", "empty_sample"],
+    )
+    def test_should_alert(
+        self, mock_llm, mock_session, sample_size, total_queries, overall, expected
+    ):
+        """Test alerting depends on overall score and a non-empty sample."""
+        evaluator = NightlyEvaluator(mock_llm, mock_session, overall_threshold=0.7)
+
+        report = DailyReportData(
+            report_date=_NOW,
+            sample_size=sample_size,
+            total_queries=total_queries,
+            avg_groundedness=overall,
+            avg_relevance=overall,
+            avg_completeness=overall,
+            avg_overall=overall,
+        )
+
+        assert evaluator.should_alert(report) is expected
+
+    def test_empty_report(self, mock_llm, mock_session):
+        """Test empty report generation."""
+        evaluator = NightlyEvaluator(mock_llm, mock_session)
+        report = evaluator._empty_report()
+
+        assert report.sample_size == 0
+        assert report.total_queries == 0
+        assert report.avg_overall == 0.0
+
+    def test_generate_report(self, mock_llm, mock_session):
+        """Test report generation from results."""
+        evaluator = NightlyEvaluator(
+            mock_llm,
+            mock_session,
+            groundedness_threshold=0.7,
+            relevance_threshold=0.6,
+        )
+
+        results = [
+            EvalResultData("q1", 0.9, 0.8, 0.7, 0.8),
+            EvalResultData("q2", 0.5, 0.5, 0.5, 0.5),  # Below threshold
+            EvalResultData("q3", 0.8, 0.7, 0.6, 0.7),
+        ]
+
+        report = evaluator._generate_report(results, total_queries=30)
+
+        assert report.sample_size == 3
+        assert report.total_queries == 30
+        assert len(report.below_threshold) == 1
+        assert report.below_threshold[0].query_id == "q2"
+
+    @pytest.mark.asyncio
+    async def test_run_nightly_no_queries(self, mock_llm, mock_session, session_returns):
+        """Test nightly run with no queries returns empty report."""
+        session_returns(all_=[])
+
+        evaluator = NightlyEvaluator(mock_llm, mock_session)
+        report = await evaluator.run_nightly()
+
+        assert report.sample_size == 0
+        assert report.total_queries == 0
@@ -1,9 +1,12 @@
 """Tests for the governance module."""
 
 import pytest
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import patch
 from datetime import datetime, timedelta
 
+from sqlalchemy.orm import Session
+
 from knowledge_base.governance.obsolete_detector import (
     ObsoleteDetector,
     ObsoleteDocument,
@@ -21,58 +24,121 @@ from knowledge_base.governance.reports import (
     TopicCoverage,
 )
 
+# Fixed timestamp keeps report construction deterministic
+_NOW = datetime(2024, 1, 1, 12, 0, 0)
+
+_REPORT_KWARGS = dict(
+    generated_at=_NOW,
+    period_days=30,
+    total_pages=100,
+    active_pages=90,
+    obsolete_count=5,
+    gap_count=3,
+    open_issues=2,
+    avg_quality=0.75,
+    below_threshold_count=10,
+    total_feedback=50,
+    positive_feedback=40,
+    negative_feedback=10,
+)
 
-class TestFeedbackStats:
-    """Tests for FeedbackStats dataclass."""
-
-    def test_total_count(self):
-        """Test total count calculation."""
-        stats = FeedbackStats(positive_count=5, negative_count=3)
-        assert stats.total == 8
-
-    def test_negative_ratio(self):
-        """Test negative ratio calculation."""
-        stats = FeedbackStats(positive_count=5, negative_count=5)
-        assert stats.negative_ratio == 0.5
-
-    def test_negative_ratio_zero_total(self):
-        """Test negative ratio with zero total."""
-        stats = FeedbackStats(positive_count=0, negative_count=0)
-        assert stats.negative_ratio == 0.0
-
-
-class TestObsoleteDocument:
-    """Tests for ObsoleteDocument dataclass."""
 
-    def test_creation(self):
-        """Test creating ObsoleteDocument."""
-        doc = ObsoleteDocument(
-            page_id="page123",
-            title="Old Document",
-            space_key="TEST",
-            url="https://confluence/page123",
-            last_updated=datetime.utcnow() - timedelta(days=800),
-            quality_score=0.2,
-            reasons=["Not updated in 800 days"],
-            severity="high",
-        )
-        assert doc.page_id == "page123"
-        assert doc.severity == "high"
-        assert len(doc.reasons) == 1
+def _exec_result(rows=(), scalar=0):
+    """Plain stand-in for a SQLAlchemy Result; no child-mock bookkeeping."""
+    return SimpleNamespace(
+        scalars=lambda: SimpleNamespace(all=lambda: list(rows)),
+        scalar=lambda: scalar,
+        all=lambda: list(rows),
+    )
+
+
+@pytest.fixture(autouse=True, scope="module")
+def _freeze_clock():
+    """Pin reports.datetime.utcnow() to _NOW for the whole module."""
+    with patch("knowledge_base.governance.reports.datetime", wraps=datetime) as mock_datetime:
+        mock_datetime.utcnow.return_value = _NOW
+        yield
+
+
+class TestDataclasses:
+    """Tests for governance dataclass fields and derived properties."""
+
+    @pytest.mark.parametrize(
+        "cls,kwargs,expected",
+        [
+            (FeedbackStats, dict(positive_count=5, negative_count=3), {"total": 8}),
+            (FeedbackStats, dict(positive_count=5, negative_count=5), {"negative_ratio": 0.5}),
+            (FeedbackStats, dict(positive_count=0, negative_count=0), {"negative_ratio": 0.0}),
+            (
+                ObsoleteDocument,
+                dict(
+                    page_id="page123",
+                    title="Old Document",
+                    space_key="TEST",
+                    url="https://confluence/page123",
+                    last_updated=_NOW - timedelta(days=800),
+                    quality_score=0.2,
+                    reasons=["Not updated in 800 days"],
+                    severity="high",
+                ),
+                {"page_id": "page123", "severity": "high", "reasons": ["Not updated in 800 days"]},
+            ),
+            (
+                QueryCluster,
+                dict(queries=["q1", "q2", "q3"], representative_query="q1", avg_quality=0.3),
+                {"size": 3},
+            ),
+            (
+                GapInfo,
+                dict(
+                    topic="How to configure X",
+                    query_count=10,
+                    sample_queries=["q1", "q2"],
+                    suggested_title="Guide: How to configure X",
+                    avg_quality=0.25,
+                ),
+                {"topic": "How to configure X", "query_count": 10},
+            ),
+            (
+                TopicCoverage,
+                dict(topic="onboarding", doc_count=5, avg_quality=0.8, query_count=10),
+                {"coverage_ratio": 0.5},
+            ),
+            (
+                TopicCoverage,
+                dict(topic="onboarding", doc_count=5, avg_quality=0.8, query_count=0),
+                {"coverage_ratio": 1.0},
+            ),
+            (
+                SpaceStats,
+                dict(
+                    space_key="ENG",
+                    total_pages=100,
+                    active_pages=90,
+                    obsolete_count=10,
+                    avg_quality=0.75,
+                    feedback_positive=50,
+                    feedback_negative=10,
+                ),
+                {"space_key": "ENG", "total_pages": 100},
+            ),
+            (
+                GovernanceReport,
+                _REPORT_KWARGS,
+                {"total_pages": 100, "gap_count": 3, "obsolete_docs": [], "gaps": []},
+            ),
+        ],
+    )
+    def test_properties(self, cls, kwargs, expected):
+        """Test dataclass construction and derived properties."""
+        obj = cls(**kwargs)
+        for attr, value in expected.items():
+            assert getattr(obj, attr) == value
 
 
 class TestObsoleteDetector:
     """Tests for ObsoleteDetector."""
 
-    @pytest.fixture
-    def mock_session(self):
-        """Create a mock database session."""
-        session = MagicMock()
-        session.execute = MagicMock()
-        session.add = MagicMock()
-        session.commit = MagicMock()
-        return session
-
     def test_init_defaults(self, mock_session):
         """Test default initialization."""
         detector = ObsoleteDetector(mock_session)
@@ -93,53 +159,27 @@ class TestObsoleteDetector:
 
     def test_find_obsolete_no_pages(self, mock_session):
         """Test find_obsolete with no pages."""
-        mock_session.execute.return_value.scalars.return_value.all.return_value = []
+        mock_session.execute.return_value = _exec_result()
         detector = ObsoleteDetector(mock_session)
         result = detector.find_obsolete()
         assert result == []
 
 
-class TestQueryCluster:
-    """Tests for QueryCluster dataclass."""
-
-    def test_size(self):
-        """Test size property."""
-        cluster = QueryCluster(
-            queries=["q1", "q2", "q3"],
-            representative_query="q1",
-            avg_quality=0.3,
-        )
-        assert cluster.size == 3
-
-
-class TestGapInfo:
-    """Tests for GapInfo dataclass."""
-
-    def test_creation(self):
-        """Test creating GapInfo."""
-        gap = GapInfo(
-            topic="How to configure X",
-            query_count=10,
-            sample_queries=["q1", "q2"],
-            suggested_title="Guide: How to configure X",
-            avg_quality=0.25,
-        )
-        assert gap.topic == "How to configure X"
-        assert gap.query_count == 10
+@pytest.fixture(scope="module")
+def query_corpus():
+    """Low-quality queries forming two overlapping groups and one singleton."""
+    return [
+        ("how to configure VPN", 0.3),
+        ("setup email", 0.4),
+        ("how to configure VPN access", 0.2),
+        ("reset password", 0.1),
+        ("Setup email account", 0.2),
+    ]
 
 
 class TestGapAnalyzer:
     """Tests for GapAnalyzer."""
 
-    @pytest.fixture
-    def mock_session(self):
-        """Create a mock database session."""
-        session = MagicMock()
-        session.execute = MagicMock()
-        session.add = MagicMock()
-        session.commit = MagicMock()
-        return session
-
     def test_init_defaults(self, mock_session):
         """Test default initialization."""
         analyzer = GapAnalyzer(mock_session)
@@ -147,17 +187,27 @@ class TestGapAnalyzer:
         assert analyzer.similarity_threshold == 0.75
         assert analyzer.quality_threshold == 0.5
 
-    def test_cluster_queries_simple(self, mock_session):
-        """Test simple query clustering."""
+    def test_cluster_queries_simple(self, mock_session, query_corpus):
+        """Test simple query clustering groups by word overlap."""
         analyzer = GapAnalyzer(mock_session)
-        queries = [
-            ("how to configure VPN", 0.3),
-            ("how to configure VPN access", 0.2),
-            ("setup email", 0.4),
+
+        clusters = analyzer._cluster_queries_simple(query_corpus)
+
+        assert [c.queries for c in clusters] == [
+            ["how to configure VPN", "how to configure VPN access"],
+            ["setup email", "Setup email account"],
+            ["reset password"],
         ]
+        assert [c.avg_quality for c in clusters] == pytest.approx([0.25, 0.3, 0.1])
+
+    def test_find_gaps_respects_min_cluster_size(self, mock_session, query_corpus):
+        """Test only clusters of min_cluster_size become gaps."""
+        analyzer = GapAnalyzer(mock_session, min_cluster_size=2)
 
-        clusters = analyzer._cluster_queries_simple(queries)
-        assert len(clusters) >= 1
+        with patch.object(analyzer, "_get_low_quality_queries", return_value=query_corpus):
+            gaps = analyzer.find_gaps()
+
+        assert sorted(g.topic for g in gaps) == ["how to configure VPN", "setup email"]
 
     def test_generate_title(self, mock_session):
         """Test title generation from cluster."""
@@ -173,65 +223,16 @@ class TestGapAnalyzer:
 
     def test_find_gaps_no_queries(self, mock_session):
         """Test find_gaps with no low-quality queries."""
-        mock_session.execute.return_value.all.return_value = []
+        mock_session.execute.return_value = _exec_result()
         analyzer = GapAnalyzer(mock_session)
 
         gaps = analyzer.find_gaps()
         assert gaps == []
 
 
-class TestTopicCoverage:
-    """Tests for TopicCoverage dataclass."""
-
-    def test_coverage_ratio_with_queries(self):
-        """Test coverage ratio calculation."""
-        coverage = TopicCoverage(
-            topic="onboarding",
-            doc_count=5,
-            avg_quality=0.8,
-            query_count=10,
-        )
-        assert coverage.coverage_ratio == 0.5
-
-    def test_coverage_ratio_no_queries(self):
-        """Test coverage ratio with zero queries."""
-        coverage = TopicCoverage(
-            topic="onboarding",
-            doc_count=5,
-            avg_quality=0.8,
-            query_count=0,
-        )
-        assert coverage.coverage_ratio == 1.0
-
-
-class TestSpaceStats:
-    """Tests for SpaceStats dataclass."""
-
-    def test_creation(self):
-        """Test creating SpaceStats."""
-        stats = SpaceStats(
-            space_key="ENG",
-            total_pages=100,
-            active_pages=90,
-            obsolete_count=10,
-            avg_quality=0.75,
-            feedback_positive=50,
-            feedback_negative=10,
-        )
-        assert stats.space_key == "ENG"
-        assert stats.total_pages == 100
-
-
 class TestGovernanceReporter:
     """Tests for GovernanceReporter."""
 
-    @pytest.fixture
-    def mock_session(self):
-        """Create a mock database session."""
-        session = MagicMock()
-        session.execute = MagicMock()
-        return session
-
     def test_init_defaults(self, mock_session):
         """Test default initialization."""
         reporter = GovernanceReporter(mock_session)
@@ -239,19 +240,27 @@ class TestGovernanceReporter:
 
     def test_get_page_stats_empty(self, mock_session):
         """Test page stats with empty database."""
-        mock_session.execute.return_value.scalar.return_value = 0
+        mock_session.execute.return_value = _exec_result(scalar=0)
         reporter = GovernanceReporter(mock_session)
 
         stats = reporter._get_page_stats()
         assert stats["total"] == 0
         assert stats["active"] == 0
 
+    def test_get_page_stats_real_session(self, db_engine):
+        """Test the page stats queries execute against a real (empty) schema."""
+        with Session(db_engine) as session:
+            reporter = GovernanceReporter(session)
+            assert reporter._get_page_stats() == {"total": 0, "active": 0}
+
     def test_get_feedback_summary_empty(self, mock_session):
         """Test feedback summary with no feedback."""
-        mock_session.execute.return_value.scalars.return_value.all.return_value = []
+        mock_session.execute.return_value = _exec_result()
         reporter = GovernanceReporter(mock_session)
 
         summary = reporter._get_feedback_summary(30)
+        since = mock_session.execute.call_args[0][0].compile().params["created_at_1"]
+        assert since == _NOW - timedelta(days=30)
         assert summary["total"] == 0
         assert summary["positive"] == 0
         assert summary["negative"] == 0
@@ -260,51 +269,12 @@ class TestGovernanceReporter:
         """Test exporting report to dictionary."""
         reporter = GovernanceReporter(mock_session)
 
-        report = GovernanceReport(
-            generated_at=datetime.utcnow(),
-            period_days=30,
-            total_pages=100,
-            active_pages=90,
-            obsolete_count=5,
-            gap_count=3,
-            open_issues=2,
-            avg_quality=0.75,
-            below_threshold_count=10,
-            total_feedback=50,
-            positive_feedback=40,
-            negative_feedback=10,
-        )
+        report = GovernanceReport(**_REPORT_KWARGS)
 
         exported = reporter.export_to_dict(report)
 
-        assert "generated_at" in exported
+        assert exported["generated_at"] == _NOW.isoformat()
         assert exported["period_days"] == 30
         assert exported["summary"]["total_pages"] == 100
         assert exported["quality"]["average"] == 0.75
         assert exported["feedback"]["total"] == 50
-
-
-class TestGovernanceReport:
-    """Tests for GovernanceReport dataclass."""
-
-    def test_creation(self):
-        """Test creating GovernanceReport."""
-        report = GovernanceReport(
-            generated_at=datetime.utcnow(),
-            period_days=30,
-            total_pages=100,
-            active_pages=90,
-            obsolete_count=5,
-            gap_count=3,
-            open_issues=2,
-            avg_quality=0.75,
-            below_threshold_count=10,
-            total_feedback=50,
-            positive_feedback=40,
-            negative_feedback=10,
-        )
-
-        assert report.total_pages == 100
-        assert report.gap_count == 3
-        assert len(report.obsolete_docs) == 0
-        assert len(report.gaps) == 0
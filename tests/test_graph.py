@@ -1,5 +1,7 @@
 """Tests for the knowledge graph module."""
 
+from collections import Counter
+
 import pytest
 
 from knowledge_base.graph.models import (
@@ -14,21 +16,19 @@ from knowledge_base.graph.entity_extractor import EntityResolver
 class TestExtractedEntity:
     """Tests for ExtractedEntity model."""
 
-    def test_entity_id_generation(self):
+    @pytest.mark.parametrize(
+        "name,entity_type,expected",
+        [
+            ("John Smith", EntityType.PERSON, "person:john_smith"),
+            # Dashes become underscores, apostrophes removed
+            ("O'Brien-Jones", EntityType.PERSON, "person:obrien_jones"),
+            ("Google Cloud Platform", EntityType.PRODUCT, "product:google_cloud_platform"),
+        ],
+    )
+    def test_entity_id(self, name, entity_type, expected):
         """Test entity ID generation from name and type."""
-        entity = ExtractedEntity(name="John Smith", entity_type=EntityType.PERSON)
-        assert entity.entity_id == "person:john_smith"
-
-    def test_entity_id_special_chars(self):
-        """Test entity ID handles special characters."""
-        entity = ExtractedEntity(name="O'Brien-Jones", entity_type=EntityType.PERSON)
-        # Dashes become underscores, apostrophes removed
-        assert entity.entity_id == "person:obrien_jones"
-
-    def test_entity_id_product(self):
-        """Test entity ID for product type."""
-        entity = ExtractedEntity(name="Google Cloud Platform", entity_type=EntityType.PRODUCT)
-        assert entity.entity_id == "product:google_cloud_platform"
+        entity = ExtractedEntity(name=name, entity_type=entity_type)
+        assert entity.entity_id == expected
 
 
 class TestExtractedEntities:
@@ -44,30 +44,30 @@ class TestExtractedEntities:
         entities = ExtractedEntities(people=["John"])
         assert entities.is_empty() is False
 
-    def test_to_entity_list(self):
+    def test_to_entity_list(self, sample_entities):
         """Test conversion to entity list."""
-        entities = ExtractedEntities(
-            people=["Alice", "Bob"],
-            teams=["Engineering"],
-            products=["Snowflake"],
-            locations=["Prague"],
-        )
-        entity_list = entities.to_entity_list()
+        entity_list = sample_entities.to_entity_list()
 
         assert len(entity_list) == 5
-        types = [e.entity_type for e in entity_list]
-        assert types.count(EntityType.PERSON) == 2
-        assert types.count(EntityType.TEAM) == 1
-        assert types.count(EntityType.PRODUCT) == 1
-        assert types.count(EntityType.LOCATION) == 1
+        counts = Counter(e.entity_type for e in entity_list)
+        assert counts == {
+            EntityType.PERSON: 2,
+            EntityType.TEAM: 1,
+            EntityType.PRODUCT: 1,
+            EntityType.LOCATION: 1,
+        }
 
 
 class TestEntityResolver:
     """Tests for EntityResolver."""
 
-    def test_add_and_resolve_alias(self):
+    @pytest.fixture
+    def resolver(self):
+        """Fresh resolver per test; add_alias mutates its alias table."""
+        return EntityResolver()
+
+    def test_add_and_resolve_alias(self, resolver):
         """Test adding and resolving aliases."""
-        resolver = EntityResolver()
         resolver.add_alias("GCP", "Google Cloud Platform")
 
         entity = ExtractedEntity(name="GCP", entity_type=EntityType.PRODUCT)
@@ -76,18 +76,16 @@ class TestEntityResolver:
         assert resolved.name == "Google Cloud Platform"
         assert "GCP" in resolved.aliases
 
-    def test_no_alias_passthrough(self):
+    def test_no_alias_passthrough(self, resolver):
         """Test entity without alias passes through unchanged."""
-        resolver = EntityResolver()
         entity = ExtractedEntity(name="Unknown Entity", entity_type=EntityType.PRODUCT)
         resolved = resolver.resolve(entity)
 
         assert resolved.name == "Unknown Entity"
         assert resolved.aliases == []
 
-    def test_resolve_all_merges(self):
+    def test_resolve_all_merges(self, resolver):
         """Test resolve_all merges entities with same canonical name."""
-        resolver = EntityResolver()
         resolver.add_alias("GCP", "Google Cloud Platform")
 
         entities = [
@@ -103,10 +101,16 @@ class TestEntityResolver:
 class TestRelationType:
     """Tests for RelationType enum."""
 
-    def test_relation_types_exist(self):
+    @pytest.mark.parametrize(
+        "relation_type,expected",
+        [
+            (RelationType.MENTIONS_PERSON, "mentions_person"),
+            (RelationType.MENTIONS_TEAM, "mentions_team"),
+            (RelationType.AUTHORED_BY, "authored_by"),
+            (RelationType.BELONGS_TO_SPACE, "belongs_to_space"),
+            (RelationType.RELATED_TO_TOPIC, "related_to_topic"),
+        ],
+    )
+    def test_relation_type_value(self, relation_type, expected):
         """Test all expected relation types exist."""
-        assert RelationType.MENTIONS_PERSON.value == "mentions_person"
-        assert RelationType.MENTIONS_TEAM.value == "mentions_team"
-        assert RelationType.AUTHORED_BY.value == "authored_by"
-        assert RelationType.BELONGS_TO_SPACE.value == "belongs_to_space"
-        assert RelationType.RELATED_TO_TOPIC.value == "related_to_topic"
+        assert relation_type.value == expected
@@ -1,16 +1,22 @@
 """Tests for health check endpoints."""
 
 import pytest
+import pytest_asyncio
+import httpx
 from httpx import ASGITransport, AsyncClient
 
-from knowledge_base.main import app
 
-
-@pytest.fixture
-async def client():
-    """Create an async test client."""
+@pytest_asyncio.fixture(scope="module")
+async def client(app):
+    """Create one async test client for the module; every test here is a read-only GET."""
     transport = ASGITransport(app=app)
-    async with AsyncClient(transport=transport, base_url="http://test") as client:
+    async with AsyncClient(
+        transport=transport,
+        base_url="http://test",
+        limits=httpx.Limits(max_keepalive_connections=1, max_connections=1),
+        follow_redirects=False,
+        timeout=5.0,
+    ) as client:
         yield client
 
 
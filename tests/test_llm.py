@@ -1,15 +1,64 @@
 """Tests for the LLM module."""
 
+import asyncio
 import json
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import patch
 
+import httpx
 import pytest
+from tenacity import wait_none
 
+from knowledge_base.rag import factory
 from knowledge_base.rag.llm import BaseLLM, OllamaLLM
-from knowledge_base.rag.factory import get_llm, get_provider, get_available_providers
+from knowledge_base.rag.factory import (
+    close_shared_client,
+    get_available_providers,
+    get_llm,
+    get_provider,
+    get_shared_client,
+    register_provider,
+    run_with_shared_client,
+)
 from knowledge_base.rag.exceptions import LLMProviderNotConfiguredError
 
 
+@pytest.fixture(scope="module")
+def no_retry_wait():
+    """Drop tenacity's exponential backoff so retried calls cost no wall time."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(OllamaLLM.generate.retry, "wait", wait_none())
+        yield
+
+
+def _mock_ollama(*responses):
+    """OllamaLLM whose HTTP calls are answered, in order, by an httpx MockTransport.
+
+    Each response is an ``httpx.Response`` or an exception to raise; the last
+    one is repeated once the others are used up. Returns the LLM and the list
+    of requests it sent.
+    """
+    requests = []
+    queue = list(responses)
+
+    def handler(request):
+        requests.append(request)
+        result = queue.pop(0) if len(queue) > 1 else queue[0]
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return OllamaLLM(client=client), requests
+
+
+async def _grab_shared_client():
+    """Return the running loop's shared client, checking it is reused."""
+    client = get_shared_client()
+    assert get_shared_client() is client
+    return client
+
+
+@pytest.mark.usefixtures("no_retry_wait")
 class TestOllamaLLM:
     """Tests for OllamaLLM."""
 
@@ -35,154 +84,138 @@ class TestOllamaLLM:
         llm = OllamaLLM(base_url="http://localhost:11434/")
         assert llm.base_url == "http://localhost:11434"
 
-    @pytest.mark.asyncio
     async def test_generate_success(self):
         """Test successful text generation."""
-        with patch("httpx.AsyncClient") as mock_client_class:
-            mock_response = MagicMock()
-            mock_response.json.return_value = {"response": "Hello, World!"}
-            mock_response.raise_for_status = MagicMock()
-
-            mock_client = AsyncMock()
-            mock_client.post = AsyncMock(return_value=mock_response)
-            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_client.__aexit__ = AsyncMock(return_value=None)
-            mock_client_class.return_value = mock_client
-
-            llm = OllamaLLM()
-            result = await llm.generate("Say hello")
-
-            assert result == "Hello, World!"
-            mock_client.post.assert_called_once()
-
-    @pytest.mark.asyncio
-    async def test_generate_json_success(self):
-        """Test successful JSON generation."""
-        with patch("httpx.AsyncClient") as mock_client_class:
-            mock_response = MagicMock()
-            mock_response.json.return_value = {"response": '{"key": "value"}'}
-            mock_response.raise_for_status = MagicMock()
-
-            mock_client = AsyncMock()
-            mock_client.post = AsyncMock(return_value=mock_response)
-            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_client.__aexit__ = AsyncMock(return_value=None)
-            mock_client_class.return_value = mock_client
-
-            llm = OllamaLLM()
-            result = await llm.generate_json("Generate JSON")
-
-            assert result == {"key": "value"}
-
-    @pytest.mark.asyncio
-    async def test_generate_json_handles_markdown(self):
-        """Test that JSON wrapped in markdown is parsed correctly."""
-        with patch("httpx.AsyncClient") as mock_client_class:
-            # Simulate LLM response with markdown code block
-            mock_response = MagicMock()
-            mock_response.json.return_value = {
-                "response": '```json\n{"key": "value"}\n```'
-            }
-            mock_response.raise_for_status = MagicMock()
-
-            mock_client = AsyncMock()
-            mock_client.post = AsyncMock(return_value=mock_response)
-            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_client.__aexit__ = AsyncMock(return_value=None)
-            mock_client_class.return_value = mock_client
-
-            llm = OllamaLLM()
-            result = await llm.generate_json("Generate JSON")
-
-            assert result == {"key": "value"}
-
-    @pytest.mark.asyncio
-    async def test_generate_json_invalid_returns_empty(self):
-        """Test that invalid JSON returns empty dict."""
-        with patch("httpx.AsyncClient") as mock_client_class:
-            mock_response = MagicMock()
-            mock_response.json.return_value = {"response": "not valid json at all"}
-            mock_response.raise_for_status = MagicMock()
-
-            mock_client = AsyncMock()
-            mock_client.post = AsyncMock(return_value=mock_response)
-            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_client.__aexit__ = AsyncMock(return_value=None)
-            mock_client_class.return_value = mock_client
-
-            llm = OllamaLLM()
-            result = await llm.generate_json("Generate JSON")
-
-            assert result == {}
-
-    @pytest.mark.asyncio
+        llm, requests = _mock_ollama(httpx.Response(200, json={"response": "Hello, World!"}))
+        result = await llm.generate("Say hello")
+
+        assert result == "Hello, World!"
+        assert len(requests) == 1
+        assert str(requests[0].url) == f"{llm.base_url}/api/generate"
+        assert json.loads(requests[0].content)["prompt"] == "Say hello"
+
+    async def test_generate_many_preserves_order(self):
+        """Test concurrent generation returns one response per prompt, in order."""
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            prompt = json.loads(request.content)["prompt"]
+            return httpx.Response(200, json={"response": prompt.upper()})
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        llm = OllamaLLM(client=client)
+        result = await llm.generate_many(["a", "b", "c"], concurrency=2)
+
+        assert result == ["A", "B", "C"]
+        assert len(requests) == 3
+
+    @pytest.mark.parametrize(
+        "response_text,expected",
+        [
+            ('{"key": "value"}', {"key": "value"}),
+            # LLM response wrapped in a markdown code block
+            ('```json\n{"key": "value"}\n```', {"key": "value"}),
+            ("not valid json at all", {}),
+        ],
+    )
+    async def test_generate_json(self, response_text, expected):
+        """Test JSON generation parses the response or falls back to {}."""
+        llm, _ = _mock_ollama(httpx.Response(200, json={"response": response_text}))
+        result = await llm.generate_json("Generate JSON")
+
+        assert result == expected
+
+    async def test_generate_retries_transient_error(self):
+        """Test generate retries a failed request without sleeping."""
+        llm, requests = _mock_ollama(
+            httpx.ConnectError("refused"),
+            httpx.Response(200, json={"response": "ok"}),
+        )
+        result = await llm.generate("Say hello")
+
+        assert result == "ok"
+        assert len(requests) == 2
+
+    @pytest.mark.parametrize(
+        "response_text,expected",
+        [
+            ('{"key": "value"}', {"key": "value"}),
+            ('```json\n{"key": "value"}\n```', {"key": "value"}),
+            ('```JSON\n{"key": "value"}\n```', {"key": "value"}),
+            ('```{"key": "value"}```', {"key": "value"}),
+            ('Here you go:\n{"key": "value"}\nHope this helps.', {"key": "value"}),
+            ("not valid json at all", {}),
+            ("{broken", {}),
+        ],
+    )
+    def test_parse_json_response(self, response_text, expected):
+        """Test fence stripping and embedded-object recovery."""
+        assert OllamaLLM()._parse_json_response(response_text) == expected
+
     async def test_check_health_success(self):
         """Test health check returns True when Ollama is available."""
-        with patch("httpx.AsyncClient") as mock_client_class:
-            mock_response = MagicMock()
-            mock_response.status_code = 200
-
-            mock_client = AsyncMock()
-            mock_client.get = AsyncMock(return_value=mock_response)
-            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_client.__aexit__ = AsyncMock(return_value=None)
-            mock_client_class.return_value = mock_client
+        llm, requests = _mock_ollama(httpx.Response(200, json={"models": []}))
+        result = await llm.check_health()
 
-            llm = OllamaLLM()
-            result = await llm.check_health()
+        assert result is True
+        assert requests[0].url.path == "/api/tags"
 
-            assert result is True
-
-    @pytest.mark.asyncio
     async def test_check_health_failure(self):
         """Test health check returns False when Ollama is unavailable."""
-        with patch("httpx.AsyncClient") as mock_client_class:
-            mock_client = AsyncMock()
-            mock_client.get = AsyncMock(side_effect=Exception("Connection refused"))
-            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_client.__aexit__ = AsyncMock(return_value=None)
-            mock_client_class.return_value = mock_client
-
-            llm = OllamaLLM()
-            result = await llm.check_health()
-
-            assert result is False
-
-    @pytest.mark.asyncio
-    async def test_list_models_success(self):
-        """Test listing available models."""
-        with patch("httpx.AsyncClient") as mock_client_class:
-            mock_response = MagicMock()
-            mock_response.json.return_value = {
-                "models": [{"name": "llama3.1:8b"}, {"name": "mistral:7b"}]
-            }
-            mock_response.raise_for_status = MagicMock()
-
-            mock_client = AsyncMock()
-            mock_client.get = AsyncMock(return_value=mock_response)
-            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_client.__aexit__ = AsyncMock(return_value=None)
-            mock_client_class.return_value = mock_client
-
-            llm = OllamaLLM()
-            result = await llm.list_models()
-
-            assert result == ["llama3.1:8b", "mistral:7b"]
-
-    @pytest.mark.asyncio
-    async def test_list_models_failure(self):
-        """Test list models returns empty on failure."""
-        with patch("httpx.AsyncClient") as mock_client_class:
-            mock_client = AsyncMock()
-            mock_client.get = AsyncMock(side_effect=Exception("Error"))
-            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_client.__aexit__ = AsyncMock(return_value=None)
-            mock_client_class.return_value = mock_client
-
-            llm = OllamaLLM()
-            result = await llm.list_models()
-
-            assert result == []
+        llm, _ = _mock_ollama(httpx.ConnectError("Connection refused"))
+        result = await llm.check_health()
+
+        assert result is False
+
+    @pytest.mark.parametrize(
+        "response,expected",
+        [
+            (
+                httpx.Response(200, json={"models": [{"name": "llama3.1:8b"}, {"name": "mistral:7b"}]}),
+                ["llama3.1:8b", "mistral:7b"],
+            ),
+            (httpx.Response(500), []),
+            (httpx.ConnectError("Connection refused"), []),
+        ],
+    )
+    async def test_list_models(self, response, expected):
+        """Test listing models, returning empty on HTTP or connection errors."""
+        llm, _ = _mock_ollama(response)
+        result = await llm.list_models()
+
+        assert result == expected
+
+    async def test_owned_client_is_reused_and_closed(self):
+        """Test one pooled client serves every call until close(), which is final."""
+        llm = OllamaLLM(base_url="http://localhost:11434")
+
+        client = llm._get_client()
+        assert llm._get_client() is client
+
+        await llm.close()
+        assert client.is_closed
+        with pytest.raises(RuntimeError, match="closed"):
+            llm._get_client()
+
+    async def test_close_leaves_injected_client_open(self):
+        """Test close() does not close a client owned by someone else."""
+        client = httpx.AsyncClient()
+        llm = OllamaLLM(client=client)
+
+        assert llm._get_client() is client
+        await llm.close()
+        assert not client.is_closed
+        with pytest.raises(RuntimeError, match="closed"):
+            llm._get_client()
+        await client.aclose()
+
+    async def test_async_context_manager_closes(self):
+        """Test leaving an async with block closes the owned client."""
+        async with OllamaLLM() as llm:
+            client = llm._get_client()
+
+        assert client.is_closed
 
 
 class TestBaseLLM:
@@ -204,6 +237,21 @@ class TestLLMFactory:
         assert "claude" in providers
         assert "ollama" in providers
 
+        # Callers get their own list; mutating it leaves the registry view intact
+        providers.append("mutated")
+        assert "mutated" not in get_available_providers()
+
+    def test_register_provider_refreshes_cache(self, monkeypatch):
+        """Test registering a provider invalidates the cached name list."""
+        monkeypatch.setattr(factory, "_PROVIDER_REGISTRY", dict(factory._PROVIDER_REGISTRY))
+        get_available_providers()
+
+        try:
+            register_provider("Dummy")(lambda: None)
+            assert "dummy" in get_available_providers()
+        finally:
+            factory._provider_names.cache_clear()
+
     def test_get_provider_ollama(self):
         """Test getting Ollama provider by name."""
         llm = get_provider("ollama")
@@ -214,6 +262,42 @@ class TestLLMFactory:
         llm = get_provider("claude")
         assert llm.provider_name == "claude"
 
+    async def test_providers_share_pooled_client(self):
+        """Test httpx-based providers reuse the factory's client until it is closed."""
+        ollama = get_provider("ollama")
+        claude = get_provider("claude")
+        shared = get_shared_client()
+        assert ollama._client is shared
+        assert claude._client is shared
+
+        await ollama.close()
+        assert not shared.is_closed
+
+        await close_shared_client()
+        assert shared.is_closed
+        assert get_shared_client() is not shared
+
+    def test_run_with_shared_client_closes_it(self):
+        """Test each asyncio.run() entry point gets its own client and closes it."""
+
+        first = run_with_shared_client(_grab_shared_client())
+        second = run_with_shared_client(_grab_shared_client())
+
+        assert first is not second
+        assert first.is_closed
+        assert second.is_closed
+
+    def test_unclosed_client_of_ended_loop_is_dropped(self, caplog):
+        """Test a client left open by a finished loop is replaced with a warning."""
+        leaked = asyncio.run(_grab_shared_client())
+
+        with caplog.at_level("WARNING", logger="knowledge_base.rag.factory"):
+            fresh = run_with_shared_client(_grab_shared_client())
+
+        assert fresh is not leaked
+        assert "outlived its event loop" in caplog.text
+        assert leaked not in factory._shared_clients.values()
+
     def test_get_provider_case_insensitive(self):
         """Test that provider names are case insensitive."""
         llm = get_provider("OLLAMA")
@@ -225,13 +309,11 @@ class TestLLMFactory:
             get_provider("unknown_provider")
         assert "unknown_provider" in str(exc_info.value)
 
-    @pytest.mark.asyncio
     async def test_get_llm_with_explicit_provider(self):
         """Test get_llm with explicit provider parameter."""
         llm = await get_llm(provider="ollama")
         assert llm.provider_name == "ollama"
 
-    @pytest.mark.asyncio
     async def test_get_llm_uses_config_provider(self, monkeypatch):
         """Test that get_llm uses LLM_PROVIDER from config."""
         # Need to patch settings before importing
@@ -244,7 +326,6 @@ class TestLLMFactory:
             llm = await get_llm()
             assert llm.provider_name == "ollama"
 
-    @pytest.mark.asyncio
     async def test_get_llm_empty_provider_raises_error(self):
         """Test that empty LLM_PROVIDER raises an error (no auto-fallback)."""
         with patch("knowledge_base.rag.factory.settings") as mock_settings:
@@ -253,7 +334,6 @@ class TestLLMFactory:
             with pytest.raises(LLMProviderNotConfiguredError):
                 await get_llm()
 
-    @pytest.mark.asyncio
     async def test_get_llm_unavailable_provider_raises_error(self):
         """Test that unavailable configured provider raises error (no fallback)."""
         with patch("knowledge_base.rag.factory.settings") as mock_settings:
@@ -273,16 +353,24 @@ class TestOllamaLLMProviderInterface:
         llm = OllamaLLM()
         assert llm.provider_name == "ollama"
 
-    @pytest.mark.asyncio
     async def test_is_available_with_url(self):
         """Test is_available returns True when URL is set."""
         llm = OllamaLLM(base_url="http://localhost:11434")
         assert await llm.is_available() is True
 
-    @pytest.mark.asyncio
     async def test_is_available_checks_base_url(self):
         """Test is_available checks that base_url is truthy."""
         # OllamaLLM with explicit base_url
         llm = OllamaLLM(base_url="http://localhost:11434")
         assert await llm.is_available() is True
         assert llm.base_url == "http://localhost:11434"
+
+    async def test_available_property_matches_is_available(self):
+        """Test the sync available property backs is_available."""
+        llm = OllamaLLM(base_url="http://localhost:11434")
+        assert llm.available is True
+        assert await llm.is_available() is llm.available
+
+        llm.base_url = ""
+        assert llm.available is False
+        assert await llm.is_available() is False
@@ -1,7 +1,6 @@
 """Tests for the markdown converter module."""
 
-import os
-import tempfile
+import shutil
 from pathlib import Path
 from unittest.mock import patch
 
@@ -10,6 +9,7 @@ import pytest
 from knowledge_base.confluence.markdown_converter import (
     html_to_markdown,
     generate_random_filename,
+    generate_random_filenames,
     save_markdown_file,
     read_markdown_file,
     delete_markdown_file,
@@ -94,76 +94,107 @@ class TestRandomFilename:
         filenames = [generate_random_filename() for _ in range(100)]
         assert len(filenames) == len(set(filenames))
 
+    def test_batch(self):
+        """Test batch generation yields unique 16-char hex names."""
+        filenames = generate_random_filenames(100)
+        assert len(filenames) == 100
+        assert len(set(filenames)) == 100
+        assert all(len(name) == 16 and int(name, 16) >= 0 for name in filenames)
+        assert generate_random_filenames(0) == []
+
+
+@pytest.fixture
+def pages_dir(tmp_path):
+    """Point PAGES_DIR at a per-test tmp_path (no TemporaryDirectory setup/teardown)."""
+    with patch('knowledge_base.confluence.markdown_converter.settings') as mock_settings:
+        mock_settings.PAGES_DIR = str(tmp_path)
+        yield tmp_path
+
 
 class TestFileOperations:
     """Tests for file operations."""
 
-    def test_save_and_read_markdown(self):
+    def test_save_and_read_markdown(self, pages_dir):
         """Test saving and reading markdown files."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            with patch('knowledge_base.confluence.markdown_converter.settings') as mock_settings:
-                mock_settings.PAGES_DIR = tmpdir
+        content = "# Test\n\nThis is test content."
+        file_path = save_markdown_file(content)
 
-                content = "# Test\n\nThis is test content."
-                file_path = save_markdown_file(content)
+        # File should exist
+        assert Path(file_path).exists()
 
-                # File should exist
-                assert Path(file_path).exists()
+        # File should have .md extension
+        assert file_path.endswith(".md")
 
-                # File should have .md extension
-                assert file_path.endswith(".md")
-
-                # File should have random name (16 hex chars)
-                filename = Path(file_path).stem
-                assert len(filename) == 16
+        # File should have random name (16 hex chars)
+        filename = Path(file_path).stem
+        assert len(filename) == 16
 
-                # Content should match
-                read_content = read_markdown_file(file_path)
-                assert read_content == content
+        # Content should match
+        read_content = read_markdown_file(file_path)
+        assert read_content == content
 
-    def test_save_with_custom_filename(self):
+    def test_save_with_custom_filename(self, pages_dir):
         """Test saving with a custom filename."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            with patch('knowledge_base.confluence.markdown_converter.settings') as mock_settings:
-                mock_settings.PAGES_DIR = tmpdir
+        content = "Custom content"
+        file_path = save_markdown_file(content, filename="custom-name")
 
-                content = "Custom content"
-                file_path = save_markdown_file(content, filename="custom-name")
+        assert "custom-name.md" in file_path
 
-                assert "custom-name.md" in file_path
+    def test_save_overwrites_atomically(self, pages_dir):
+        """Test re-saving replaces the file and leaves no temp file behind."""
+        save_markdown_file("old", filename="page")
+        file_path = save_markdown_file("new", filename="page")
 
-    def test_delete_markdown_file(self):
-        """Test deleting markdown files."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            with patch('knowledge_base.confluence.markdown_converter.settings') as mock_settings:
-                mock_settings.PAGES_DIR = tmpdir
+        assert read_markdown_file(file_path) == "new"
+        assert [p.name for p in pages_dir.iterdir()] == ["page.md"]
 
-                content = "To be deleted"
-                file_path = save_markdown_file(content)
+    def test_save_recreates_removed_directory(self, pages_dir):
+        """Test saving still works after the cached pages directory is deleted."""
+        save_markdown_file("first", filename="first")
+        shutil.rmtree(pages_dir)
 
-                # File should exist
-                assert Path(file_path).exists()
+        file_path = save_markdown_file("second", filename="second")
 
-                # Delete should return True
-                result = delete_markdown_file(file_path)
-                assert result is True
+        assert read_markdown_file(file_path) == "second"
+        assert [p.name for p in pages_dir.iterdir()] == ["second.md"]
 
-                # File should not exist
-                assert not Path(file_path).exists()
+    def test_delete_markdown_file(self, pages_dir):
+        """Test deleting markdown files."""
+        content = "To be deleted"
+        file_path = save_markdown_file(content)
+
+        # File should exist
+        assert Path(file_path).exists()
+
+        # Delete should return True
+        result = delete_markdown_file(file_path)
+        assert result is True
+
+        # File should not exist
+        assert not Path(file_path).exists()
 
     def test_delete_nonexistent_file(self):
         """Test deleting a file that doesn't exist."""
         result = delete_markdown_file("/nonexistent/path/file.md")
         assert result is False
 
-    def test_get_pages_dir_creates_directory(self):
+    def test_get_pages_dir_creates_directory(self, tmp_path):
         """Test that get_pages_dir creates the directory if needed."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            new_dir = os.path.join(tmpdir, "new_pages")
-            with patch('knowledge_base.confluence.markdown_converter.settings') as mock_settings:
-                mock_settings.PAGES_DIR = new_dir
+        new_dir = tmp_path / "new_pages"
+        with patch('knowledge_base.confluence.markdown_converter.settings') as mock_settings:
+            mock_settings.PAGES_DIR = str(new_dir)
+
+            pages_dir = get_pages_dir()
+
+            assert pages_dir.exists()
+            assert pages_dir == new_dir
 
-                pages_dir = get_pages_dir()
+    def test_get_pages_dir_follows_settings_changes(self, tmp_path):
+        """Test the cached directory is keyed on PAGES_DIR, so a new value is created."""
+        with patch('knowledge_base.confluence.markdown_converter.settings') as mock_settings:
+            mock_settings.PAGES_DIR = str(tmp_path / "first")
+            assert get_pages_dir() == tmp_path / "first"
 
-                assert pages_dir.exists()
-                assert pages_dir == Path(new_dir)
+            mock_settings.PAGES_DIR = str(tmp_path / "second")
+            assert get_pages_dir() == tmp_path / "second"
+            assert (tmp_path / "second").is_dir()
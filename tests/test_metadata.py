@@ -1,11 +1,14 @@
 """Tests for the metadata module."""
 
+import asyncio
 import json
-from unittest.mock import AsyncMock, MagicMock
+from types import SimpleNamespace
+from unittest.mock import patch
 
 import pytest
 
 from knowledge_base.metadata.extractor import (
+    METADATA_EXTRACTION_PROMPT,
     MetadataExtractor,
     db_dict_to_metadata,
     metadata_to_db_dict,
@@ -29,6 +32,33 @@ class TestVocabularyNormalizer:
         result = normalizer.normalize_topics(["eng"])
         assert result == ["engineering"]
 
+    @pytest.mark.parametrize(
+        "raw,expected",
+        [
+            ("engineer", "engineering"),  # known term minus an inflection
+            ("tool", "tools"),
+            ("trainings", "training"),  # known term plus an inflection
+            ("devastating", "devastating"),  # shared prefix only, left alone
+            # Abbreviation stems are too short to inflect safely
+            ("hrs", "hrs"),
+            ("pms", "pms"),
+            ("pmer", "pmer"),
+            ("devs", "devs"),
+            # Agent nouns are different words, not inflections
+            ("emailer", "emailer"),
+            ("slacker", "slacker"),
+        ],
+    )
+    def test_normalize_topics_inflections(self, raw, expected):
+        """Test inflected variants resolve through the vocabulary trie."""
+        assert VocabularyNormalizer().normalize_topics([raw]) == [expected]
+
+    def test_normalize_topics_custom_synonyms(self):
+        """Test custom topic synonyms build their own mapping."""
+        normalizer = VocabularyNormalizer(topic_synonyms={"ops": ["sre", "DevOps"]})
+        assert normalizer.normalize_topics(["devops", "eng"]) == ["ops", "eng"]
+        assert VocabularyNormalizer().normalize_topics(["eng"]) == ["engineering"]
+
     def test_normalize_topics_preserves_unknown(self):
         """Test that unknown topics are preserved."""
         normalizer = VocabularyNormalizer()
@@ -171,23 +201,19 @@ class TestMetadataExtractor:
     """Tests for MetadataExtractor."""
 
     @pytest.mark.asyncio
-    async def test_extract_with_mock_llm(self):
+    async def test_extract_with_mock_llm(self, fake_llm):
         """Test metadata extraction with mocked LLM."""
-        # Create mock LLM
-        mock_llm = MagicMock()
-        mock_llm.generate_json = AsyncMock(
-            return_value={
-                "topics": ["engineering", "onboarding"],
-                "intents": ["learn the tools"],
-                "audience": ["new_hires"],
-                "doc_type": "how-to",
-                "key_entities": ["Git", "GitHub"],
-                "summary": "Guide for setting up development environment",
-                "complexity": "beginner",
-            }
-        )
+        fake_llm.response = {
+            "topics": ["engineering", "onboarding"],
+            "intents": ["learn the tools"],
+            "audience": ["new_hires"],
+            "doc_type": "how-to",
+            "key_entities": ["Git", "GitHub"],
+            "summary": "Guide for setting up development environment",
+            "complexity": "beginner",
+        }
 
-        extractor = MetadataExtractor(llm=mock_llm)
+        extractor = MetadataExtractor(llm=fake_llm)
         metadata = await extractor.extract(
             content="This guide helps new engineers set up their development environment.",
             page_title="Developer Onboarding",
@@ -199,12 +225,11 @@ class TestMetadataExtractor:
         assert len(metadata.summary) > 0
 
     @pytest.mark.asyncio
-    async def test_extract_handles_llm_error(self):
+    async def test_extract_handles_llm_error(self, fake_llm):
         """Test that LLM errors are handled gracefully."""
-        mock_llm = MagicMock()
-        mock_llm.generate_json = AsyncMock(side_effect=Exception("LLM error"))
+        fake_llm.error = Exception("LLM error")
 
-        extractor = MetadataExtractor(llm=mock_llm)
+        extractor = MetadataExtractor(llm=fake_llm)
         metadata = await extractor.extract(
             content="Some content",
             page_title="Test Page",
@@ -215,22 +240,19 @@ class TestMetadataExtractor:
         assert metadata.topics == []
 
     @pytest.mark.asyncio
-    async def test_extract_normalizes_output(self):
+    async def test_extract_normalizes_output(self, fake_llm):
         """Test that extractor normalizes LLM output."""
-        mock_llm = MagicMock()
-        mock_llm.generate_json = AsyncMock(
-            return_value={
-                "topics": ["eng", "dev"],  # Should normalize to engineering
-                "intents": ["test"],
-                "audience": ["developers"],  # Should normalize to engineering
-                "doc_type": "guide",  # Should normalize to how-to
-                "key_entities": [],
-                "summary": "Test",
-                "complexity": "easy",  # Should normalize to beginner
-            }
-        )
+        fake_llm.response = {
+            "topics": ["eng", "dev"],  # Should normalize to engineering
+            "intents": ["test"],
+            "audience": ["developers"],  # Should normalize to engineering
+            "doc_type": "guide",  # Should normalize to how-to
+            "key_entities": [],
+            "summary": "Test",
+            "complexity": "easy",  # Should normalize to beginner
+        }
 
-        extractor = MetadataExtractor(llm=mock_llm)
+        extractor = MetadataExtractor(llm=fake_llm)
         metadata = await extractor.extract(
             content="Test content",
             page_title="Test",
@@ -241,37 +263,43 @@ class TestMetadataExtractor:
         assert metadata.complexity == "beginner"
 
     @pytest.mark.asyncio
-    async def test_extract_truncates_long_content(self):
+    async def test_extract_truncates_long_content(self, fake_llm):
         """Test that long content is truncated."""
-        mock_llm = MagicMock()
-        mock_llm.generate_json = AsyncMock(return_value={})
-
-        extractor = MetadataExtractor(llm=mock_llm, max_content_chars=100)
+        extractor = MetadataExtractor(llm=fake_llm, max_content_chars=100)
         long_content = "x" * 500
 
         await extractor.extract(content=long_content, page_title="Test")
 
         # Check that the prompt was called with truncated content
-        call_args = mock_llm.generate_json.call_args[0][0]
-        assert len(call_args) < 500 + 500  # Content + prompt template
+        prompt = fake_llm.calls[0]
+        assert "x" * 100 + "..." in prompt
+        assert "x" * 101 not in prompt
 
     @pytest.mark.asyncio
-    async def test_extract_batch(self):
-        """Test batch extraction."""
-        mock_llm = MagicMock()
-        mock_llm.generate_json = AsyncMock(
-            return_value={
-                "topics": ["test"],
-                "intents": ["test"],
-                "audience": ["all_employees"],
-                "doc_type": "general",
-                "key_entities": [],
-                "summary": "Test summary",
-                "complexity": "intermediate",
-            }
+    async def test_extract_prompt_matches_template(self, fake_llm):
+        """Test the pre-split prompt equals the formatted template, braces included."""
+        extractor = MetadataExtractor(llm=fake_llm)
+
+        await extractor.extract(content="Use {placeholders} freely", page_title="Config {env}")
+
+        assert fake_llm.calls[0] == METADATA_EXTRACTION_PROMPT.format(
+            title="Config {env}", content="Use {placeholders} freely"
         )
 
-        extractor = MetadataExtractor(llm=mock_llm)
+    @pytest.mark.asyncio
+    async def test_extract_batch(self, fake_llm):
+        """Test batch extraction."""
+        fake_llm.response = {
+            "topics": ["test"],
+            "intents": ["test"],
+            "audience": ["all_employees"],
+            "doc_type": "general",
+            "key_entities": [],
+            "summary": "Test summary",
+            "complexity": "intermediate",
+        }
+
+        extractor = MetadataExtractor(llm=fake_llm)
         items = [
             ("chunk1", "Content 1", "Title 1"),
             ("chunk2", "Content 2", "Title 2"),
@@ -284,7 +312,99 @@ class TestMetadataExtractor:
         assert "chunk1" in results
         assert "chunk2" in results
         assert "chunk3" in results
-        assert mock_llm.generate_json.call_count == 3
+        assert len(fake_llm.calls) == 3
+
+    @pytest.mark.asyncio
+    async def test_extract_batch_runs_concurrently(self):
+        """Test extractions overlap up to the concurrency limit."""
+        barrier = asyncio.Barrier(2)
+
+        async def generate_json(prompt):
+            # Deadlocks (and times out) unless two calls are in flight together
+            await asyncio.wait_for(barrier.wait(), timeout=1.0)
+            return {"summary": prompt.split("Title: ")[1].split("\n")[0]}
+
+        extractor = MetadataExtractor(llm=SimpleNamespace(generate_json=generate_json))
+        items = [(f"chunk{i}", f"Content {i}", f"Title {i}") for i in range(4)]
+
+        results = await extractor.extract_batch(items, concurrency=2)
+
+        assert list(results) == ["chunk0", "chunk1", "chunk2", "chunk3"]
+        assert [m.summary for m in results.values()] == [f"Title {i}" for i in range(4)]
+
+    @pytest.mark.asyncio
+    async def test_extract_batch_small_inputs_skip_semaphore(self, fake_llm):
+        """Test empty and single-item batches bypass the semaphore/gather path."""
+        fake_llm.response = {"summary": "only"}
+        extractor = MetadataExtractor(llm=fake_llm)
+
+        with patch("knowledge_base.metadata.extractor.asyncio.Semaphore") as mock_semaphore:
+            assert await extractor.extract_batch([]) == {}
+            results = await extractor.extract_batch([("chunk1", "Content", "Title")])
+
+        mock_semaphore.assert_not_called()
+        assert results["chunk1"].summary == "only"
+
+    @pytest.mark.asyncio
+    async def test_extract_marshaled_packs_rows(self, fake_llm):
+        """Test several chunks share one LLM call and map back in order."""
+        fake_llm.response = {
+            "results": [{"summary": "first"}, {"summary": "second", "doc_type": "guide"}]
+        }
+
+        extractor = MetadataExtractor(llm=fake_llm)
+        items = [("chunk1", "Content 1", "Title 1"), ("chunk2", "Content 2", "Title 2")]
+
+        results = await extractor.extract_marshaled(items, rows_per_call=2)
+
+        assert len(fake_llm.calls) == 1
+        assert "---DOCUMENT 2---\nTitle: Title 2" in fake_llm.calls[0]
+        assert results["chunk1"].summary == "first"
+        assert results["chunk2"].doc_type == "how-to"
+
+    @pytest.mark.asyncio
+    async def test_extract_marshaled_falls_back_on_length_mismatch(self, fake_llm):
+        """Test a short results array falls back to one call per chunk."""
+        fake_llm.responses = [{"results": [{"summary": "only one"}]}, {"summary": "a"}, {"summary": "b"}]
+
+        extractor = MetadataExtractor(llm=fake_llm)
+        items = [("chunk1", "Content 1", "Title 1"), ("chunk2", "Content 2", "Title 2")]
+
+        results = await extractor.extract_marshaled(items, rows_per_call=2)
+
+        assert len(fake_llm.calls) == 3
+        assert sorted(m.summary for m in results.values()) == ["a", "b"]
+
+    @pytest.mark.asyncio
+    async def test_extract_marshaled_fallback_respects_concurrency(self):
+        """Test per-chunk fallback never runs more LLM calls than the concurrency limit."""
+        in_flight = peak = 0
+
+        async def generate_json(prompt):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return {}
+
+        extractor = MetadataExtractor(llm=SimpleNamespace(generate_json=generate_json))
+        items = [(f"chunk{i}", f"Content {i}", f"Title {i}") for i in range(8)]
+
+        results = await extractor.extract_marshaled(items, rows_per_call=4, concurrency=2)
+
+        assert len(results) == 8
+        assert peak <= 2
+
+    @pytest.mark.asyncio
+    async def test_extract_marshaled_single_row_failure_uses_default(self, fake_llm):
+        """Test a one-chunk group gets default metadata instead of raising."""
+        fake_llm.error = RuntimeError("boom")
+        extractor = MetadataExtractor(llm=fake_llm)
+
+        results = await extractor.extract_marshaled([("chunk1", "Content", "Title")])
+
+        assert results["chunk1"] == DocumentMetadata()
 
 
 class TestMetadataDbConversion:
@@ -305,10 +425,10 @@ class TestMetadataDbConversion:
         db_dict = metadata_to_db_dict(metadata)
 
         # JSON fields should be serialized
-        assert db_dict["topics"] == '["engineering", "security"]'
+        assert db_dict["topics"] == '["engineering","security"]'
         assert db_dict["intents"] == '["secure code"]'
         assert db_dict["audience"] == '["engineering"]'
-        assert db_dict["key_entities"] == '["AWS", "GCP"]'
+        assert db_dict["key_entities"] == '["AWS","GCP"]'
 
         # String fields should remain strings
         assert db_dict["doc_type"] == "policy"
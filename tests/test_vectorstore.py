@@ -4,6 +4,7 @@ Note: ChromaDB and VectorRetriever have been replaced with Graphiti.
 See tests/test_graphiti_*.py for graph-based retriever tests.
 """
 
+import numpy as np
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -30,6 +31,11 @@ class TestEmbeddings:
         embeddings = get_embeddings("sentence-transformer")
         assert embeddings.provider_name == "sentence-transformer"
 
+    def test_get_embeddings_is_shared(self):
+        """Test repeated lookups reuse one provider instance (model loads once)."""
+        embeddings = get_embeddings("sentence-transformer")
+        assert get_embeddings("Sentence-Transformer") is embeddings
+
     def test_get_embeddings_unknown_raises(self):
         """Test that unknown provider raises ValueError."""
         with pytest.raises(ValueError) as exc_info:
@@ -41,6 +47,17 @@ class TestEmbeddings:
         embeddings = SentenceTransformerEmbeddings(model="all-MiniLM-L6-v2")
         assert embeddings.provider_name == "sentence-transformer"
 
+    async def test_sentence_transformer_embed_single_encodes_one_text(self):
+        """Test embed_single encodes the bare string and returns a flat float list."""
+        embeddings = SentenceTransformerEmbeddings(model="all-MiniLM-L6-v2")
+        embeddings._model = MagicMock()
+        embeddings._model.encode.return_value = np.full(4, 0.5, dtype=np.float32)
+
+        vector = await embeddings.embed_single("query")
+
+        embeddings._model.encode.assert_called_once_with("query", convert_to_numpy=True)
+        assert vector == [0.5, 0.5, 0.5, 0.5]
+
 
 class TestSearchResult:
     """Tests for SearchResult dataclass."""
@@ -97,3 +114,12 @@ class TestSearchResult:
             metadata={},
         )
         assert result.quality_score == 100.0
+
+    def test_search_result_is_slotted(self):
+        """Test SearchResult has no per-instance __dict__ but keeps score mutable."""
+        result = SearchResult(chunk_id="chunk_123", content="Test", score=0.5, metadata={})
+        assert not hasattr(result, "__dict__")
+
+        # Quality boosting rewrites scores in place
+        result.score = 0.75
+        assert result.score == 0.75
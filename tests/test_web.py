@@ -1,8 +1,23 @@
 """Tests for the Streamlit web UI module."""
 
+import orjson
 import pytest
+import requests
 from unittest.mock import MagicMock, patch
 from pathlib import Path
+from sqlalchemy import delete
+from sqlalchemy.orm import Session
+
+from knowledge_base.db.models import DocumentationGap, GovernanceIssue
+from knowledge_base.web import streamlit_app
+from knowledge_base.web.streamlit_app import (
+    check_auth,
+    clear_search_cache,
+    get_admin_stats,
+    get_db_size,
+    get_governance_data,
+    search_api,
+)
 
 
 # =============================================================================
@@ -13,64 +28,106 @@ from pathlib import Path
 class TestAuthFunction:
     """Tests for the authentication function."""
 
-    def test_check_auth_valid(self):
-        """Test valid credentials."""
-        with patch("knowledge_base.web.streamlit_app.settings") as mock_settings:
-            mock_settings.ADMIN_USERNAME = "admin"
-            mock_settings.ADMIN_PASSWORD = "secret123"
-
-            from knowledge_base.web.streamlit_app import check_auth
-
-            assert check_auth("admin", "secret123") is True
-
-    def test_check_auth_invalid_username(self):
-        """Test invalid username."""
-        with patch("knowledge_base.web.streamlit_app.settings") as mock_settings:
-            mock_settings.ADMIN_USERNAME = "admin"
-            mock_settings.ADMIN_PASSWORD = "secret123"
-
-            from knowledge_base.web.streamlit_app import check_auth
-
-            assert check_auth("wrong", "secret123") is False
+    @pytest.mark.parametrize(
+        "username,password,expected",
+        [
+            ("admin", "secret123", True),
+            ("wrong", "secret123", False),
+            ("admin", "wrong", False),
+        ],
+    )
+    def test_check_auth(self, monkeypatch, username, password, expected):
+        """Test only the exact username and password pair is accepted."""
+        monkeypatch.setattr(streamlit_app, "_ADMIN_USER", b"admin")
+        monkeypatch.setattr(streamlit_app, "_ADMIN_PASS", b"secret123")
 
-    def test_check_auth_invalid_password(self):
-        """Test invalid password."""
-        with patch("knowledge_base.web.streamlit_app.settings") as mock_settings:
-            mock_settings.ADMIN_USERNAME = "admin"
-            mock_settings.ADMIN_PASSWORD = "secret123"
-
-            from knowledge_base.web.streamlit_app import check_auth
-
-            assert check_auth("admin", "wrong") is False
+        assert check_auth(username, password) is expected
 
 
 class TestGetDbSize:
     """Tests for the get_db_size function."""
 
-    def test_db_size_file_exists(self):
+    @pytest.fixture(autouse=True)
+    def empty_db_size_cache(self):
+        """Start each test with an empty size cache."""
+        get_db_size.clear()
+        yield
+        get_db_size.clear()
+
+    @pytest.mark.parametrize(
+        "size,expected",
+        [
+            (500, "500 B"),
+            (2048, "2.0 KB"),
+            (2 * 1024 * 1024, "2.0 MB"),
+            (3 * 1024**3, "3.0 GB"),
+        ],
+    )
+    def test_db_size_file_exists(self, size, expected):
         """Test database size calculation when file exists."""
-        from knowledge_base.web.streamlit_app import get_db_size
-
         with patch.object(Path, "exists", return_value=True):
             with patch.object(Path, "stat") as mock_stat:
-                # Test bytes
+                mock_stat.return_value.st_size = size
+                assert get_db_size() == expected
+
+    def test_db_size_file_not_exists(self):
+        """Test database size when file doesn't exist."""
+        with patch.object(Path, "exists", return_value=False):
+            assert get_db_size() == "N/A"
+
+    def test_db_size_cached_within_ttl(self):
+        """Test repeated calls in one TTL window stat the file once."""
+        with patch.object(Path, "exists", return_value=True) as mock_exists:
+            with patch.object(Path, "stat") as mock_stat:
                 mock_stat.return_value.st_size = 500
                 assert get_db_size() == "500 B"
 
-                # Test kilobytes
                 mock_stat.return_value.st_size = 2048
-                assert get_db_size() == "2.0 KB"
+                assert get_db_size() == "500 B"
 
-                # Test megabytes
-                mock_stat.return_value.st_size = 2 * 1024 * 1024
-                assert get_db_size() == "2.0 MB"
+        mock_exists.assert_called_once()
 
-    def test_db_size_file_not_exists(self):
-        """Test database size when file doesn't exist."""
-        from knowledge_base.web.streamlit_app import get_db_size
 
-        with patch.object(Path, "exists", return_value=False):
-            assert get_db_size() == "N/A"
+class _FakeResult:
+    """Query result that hands back one canned row or a canned list of rows."""
+
+    def __init__(self, row=None, rows=()):
+        self._row = row
+        self._rows = list(rows)
+
+    def one(self):
+        return self._row
+
+    def scalar(self):
+        return self._row
+
+    def scalars(self):
+        return self
+
+    def mappings(self):
+        return self
+
+    def all(self):
+        return self._rows
+
+
+class _FakeSession:
+    """Context-managed session whose every execute() returns the same result."""
+
+    def __init__(self, result):
+        self.result = result
+        self.statements = []
+        self.closed = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.closed = True
+
+    def execute(self, statement):
+        self.statements.append(statement)
+        return self.result
 
 
 class TestGetAdminStats:
@@ -81,42 +138,38 @@ class TestGetAdminStats:
     def test_get_admin_stats_empty_db(self, mock_db_size, mock_get_session):
         """Test admin stats with empty database."""
         mock_db_size.return_value = "0 B"
-
-        mock_session = MagicMock()
-        mock_session.execute.return_value.scalar.return_value = 0
-        mock_get_session.return_value = mock_session
-
-        from knowledge_base.web.streamlit_app import get_admin_stats
+        session = _FakeSession(_FakeResult(row=(0,) * 8 + (None,)))
+        mock_get_session.return_value = session
 
         stats = get_admin_stats()
 
         assert stats["total_pages"] == 0
         assert stats["total_chunks"] == 0
         assert stats["database_size"] == "0 B"
-        mock_session.close.assert_called_once()
+        assert session.closed
 
     @patch("knowledge_base.web.streamlit_app.get_session")
     @patch("knowledge_base.web.streamlit_app.get_db_size")
     def test_get_admin_stats_with_data(self, mock_db_size, mock_get_session):
         """Test admin stats with data."""
         mock_db_size.return_value = "1.5 MB"
-
-        mock_session = MagicMock()
-        # Configure return values for different queries
-        mock_session.execute.return_value.scalar.side_effect = [
-            100,  # total_pages
-            90,   # active_pages
-            500,  # total_chunks
-            10,   # total_documents
-            8,    # published_documents
-            2,    # draft_documents
-            3,    # open_issues
-            2,    # documentation_gaps
-            None, # last_sync
-        ]
-        mock_get_session.return_value = mock_session
-
-        from knowledge_base.web.streamlit_app import get_admin_stats
+        # All counters come back as one row
+        session = _FakeSession(
+            _FakeResult(
+                row=(
+                    100,  # total_pages
+                    90,   # active_pages
+                    500,  # total_chunks
+                    10,   # total_documents
+                    8,    # published_documents
+                    2,    # draft_documents
+                    3,    # open_issues
+                    2,    # documentation_gaps
+                    None, # last_sync
+                )
+            )
+        )
+        mock_get_session.return_value = session
 
         stats = get_admin_stats()
 
@@ -124,20 +177,25 @@ class TestGetAdminStats:
         assert stats["active_pages"] == 90
         assert stats["total_chunks"] == 500
         assert stats["database_size"] == "1.5 MB"
+        assert stats["last_sync"] == "Never"
+        assert len(session.statements) == 1
 
 
 class TestGetGovernanceData:
     """Tests for the get_governance_data function."""
 
+    @pytest.fixture(autouse=True)
+    def empty_governance_cache(self):
+        """Start each test with an empty governance cache."""
+        get_governance_data.clear()
+        yield
+        get_governance_data.clear()
+
     @patch("knowledge_base.web.streamlit_app.get_session")
     def test_get_governance_data_empty(self, mock_get_session):
         """Test governance data with empty database."""
-        mock_session = MagicMock()
-        mock_session.execute.return_value.scalars.return_value.all.return_value = []
-        mock_session.execute.return_value.all.return_value = []
-        mock_get_session.return_value = mock_session
-
-        from knowledge_base.web.streamlit_app import get_governance_data
+        session = _FakeSession(_FakeResult(row=False))
+        mock_get_session.return_value = session
 
         data = get_governance_data()
 
@@ -145,58 +203,178 @@ class TestGetGovernanceData:
         assert data["gaps"] == []
         assert data["stale_pages"] == []
         assert data["space_stats"] == []
-        mock_session.close.assert_called_once()
+        assert len(session.statements) == 1
+        assert session.closed
+
+    @patch("knowledge_base.web.streamlit_app.get_session")
+    def test_get_governance_data_runs_queries_when_populated(self, mock_get_session):
+        """Test the full query set runs once the existence probe finds data."""
+        session = _FakeSession(_FakeResult(row=True, rows=[]))
+        mock_get_session.return_value = session
+
+        data = get_governance_data()
+
+        assert data["space_stats"] == []
+        assert len(session.statements) == 5
+
+    @patch("knowledge_base.web.streamlit_app.get_session")
+    def test_get_governance_data_cached_within_ttl(self, mock_get_session):
+        """Test reruns within the TTL window reuse the first snapshot."""
+        session = _FakeSession(_FakeResult(row=False))
+        mock_get_session.return_value = session
+
+        first = get_governance_data()
+        second = get_governance_data()
+
+        assert second == first
+        assert len(session.statements) == 1
+
+    def test_get_governance_data_caches_plain_values(self, db_engine):
+        """Test cached rows are plain dicts/tuples, not detached ORM instances."""
+        with Session(db_engine) as session:
+            session.add_all([
+                GovernanceIssue(page_id="p1", issue_type="stale", description="Old page"),
+                DocumentationGap(topic="vpn", query_count=3),
+            ])
+            session.commit()
+
+        try:
+            with patch(
+                "knowledge_base.web.streamlit_app.get_session",
+                side_effect=lambda: Session(db_engine),
+            ):
+                get_governance_data()
+                data = get_governance_data()
+        finally:
+            with Session(db_engine) as session:
+                session.execute(delete(GovernanceIssue))
+                session.execute(delete(DocumentationGap))
+                session.commit()
+
+        assert data["recent_issues"][0]["description"] == "Old page"
+        assert data["recent_issues"][0]["severity"] == "medium"
+        assert data["gaps"] == [
+            {"topic": "vpn", "query_count": 3, "suggested_title": None, "sample_queries": "[]"}
+        ]
+        assert data["stale_pages"] == []
 
 
 class TestSearchApi:
     """Tests for the search_api function."""
 
-    @patch("knowledge_base.web.streamlit_app.requests.post")
+    @pytest.fixture(autouse=True)
+    def empty_search_cache(self):
+        """Start each test with an empty response cache."""
+        clear_search_cache()
+        yield
+        clear_search_cache()
+
+    @patch("knowledge_base.web.streamlit_app.requests.Session.post")
     def test_search_api_success(self, mock_post):
         """Test successful API call."""
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "results": [{"title": "Test", "score": 0.9}],
-            "answer": "Test answer",
-        }
+        mock_response.content = orjson.dumps(
+            {
+                "results": [{"title": "Test", "score": 0.9}],
+                "answer": "Test answer",
+            }
+        )
         mock_post.return_value = mock_response
 
-        from knowledge_base.web.streamlit_app import search_api
-
         result = search_api("test query")
 
         assert "results" in result
         assert result["results"][0]["title"] == "Test"
-        mock_post.assert_called_once()
+        mock_post.assert_called_once_with(
+            "http://localhost:8000/api/v1/search",
+            json={"query": "test query", "top_k": 5},
+            timeout=30,
+        )
+
+    @patch("knowledge_base.web.streamlit_app.requests.Session.post")
+    def test_search_api_cached(self, mock_post):
+        """Test identical queries within the TTL reuse the first response."""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.content = orjson.dumps({"results": [], "answer": "cached"})
+        mock_post.return_value = mock_response
 
-    @patch("knowledge_base.web.streamlit_app.requests.post")
+        first = search_api("test query")
+        second = search_api("test query")
+        search_api("test query", top_k=10)
+
+        assert second == first
+        assert mock_post.call_count == 2
+
+    @patch("knowledge_base.web.streamlit_app.requests.Session.post")
+    def test_search_api_errors_not_cached(self, mock_post):
+        """Test a failed call is retried rather than served from cache."""
+        mock_response = MagicMock()
+        mock_response.status_code = 500
+        mock_post.return_value = mock_response
+
+        search_api("test query")
+        search_api("test query")
+
+        assert mock_post.call_count == 2
+
+    @patch("knowledge_base.web.streamlit_app.requests.Session.post")
     def test_search_api_error(self, mock_post):
         """Test API error handling."""
         mock_response = MagicMock()
         mock_response.status_code = 500
         mock_post.return_value = mock_response
 
-        from knowledge_base.web.streamlit_app import search_api
-
         result = search_api("test query")
 
         assert "error" in result
         assert "500" in result["error"]
 
-    @patch("knowledge_base.web.streamlit_app.requests.post")
+    @patch("knowledge_base.web.streamlit_app.requests.Session.post")
     def test_search_api_connection_error(self, mock_post):
         """Test connection error handling."""
-        import requests
         mock_post.side_effect = requests.exceptions.ConnectionError()
 
-        from knowledge_base.web.streamlit_app import search_api
-
         result = search_api("test query")
 
         assert "error" in result
         assert "Cannot connect" in result["error"]
 
+    @patch("knowledge_base.web.streamlit_app.requests.Session.post")
+    def test_search_api_skips_connecting_during_outage(self, mock_post):
+        """Test calls inside the backoff window fail fast, then retry after it."""
+        mock_post.side_effect = requests.exceptions.ConnectionError()
+
+        with patch("knowledge_base.web.streamlit_app.time.monotonic") as mock_monotonic:
+            mock_monotonic.return_value = 100.0
+            search_api("test query")
+
+            mock_monotonic.return_value = 105.0
+            result = search_api("other query")
+            assert "Cannot connect" in result["error"]
+            assert mock_post.call_count == 1
+
+            mock_monotonic.return_value = 111.0
+            search_api("other query")
+            assert mock_post.call_count == 2
+
+    @patch("knowledge_base.web.streamlit_app.requests.Session.post")
+    def test_search_api_serves_cached_results_during_outage(self, mock_post):
+        """Test a cached response is still returned while connections are skipped."""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.content = orjson.dumps({"results": [], "answer": "cached"})
+        mock_post.return_value = mock_response
+        search_api("cached query")
+
+        mock_post.side_effect = requests.exceptions.ConnectionError()
+        search_api("new query")
+
+        assert search_api("cached query")["answer"] == "cached"
+        assert "Cannot connect" in search_api("new query")["error"]
+        assert mock_post.call_count == 2
+
 
 # =============================================================================
 # Config Tests
@@ -258,15 +436,20 @@ class TestModuleImport:
 # =============================================================================
 
 
+@pytest.fixture(scope="module")
+def client(app):
+    """One TestClient (and lifespan startup/shutdown) for every FastAPI test here."""
+    from fastapi.testclient import TestClient
+
+    with TestClient(app) as client:
+        yield client
+
+
 class TestFastAPIRoot:
     """Tests for the FastAPI root endpoint."""
 
-    def test_root_returns_info(self):
+    def test_root_returns_info(self, client):
         """Test that root endpoint returns app info."""
-        from fastapi.testclient import TestClient
-        from knowledge_base.main import app
-
-        client = TestClient(app)
         response = client.get("/")
 
         assert response.status_code == 200